@@ -15,13 +15,14 @@ project_root = Path(__file__).parent.parent
 sys.path.append(str(project_root))
 sys.path.append(str(project_root / "src"))
 
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Request
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse, StreamingResponse, JSONResponse
+from fastapi.responses import HTMLResponse, StreamingResponse, JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
 from pydantic import ValidationError
+from strands.types.exceptions import ModelThrottledException
 import json
 import asyncio
 import time
@@ -39,6 +40,24 @@ from api.models import (
     MemoryRequest
 )
 from src.agent import ProductHuntLaunchAgent
+from src.agent_pool import AgentPool
+from src.batch import analysis_cache_payload, build_analysis_prompt
+from helpers.model_router import get_model_router, get_model_tier_stats
+from helpers.context_assembly import get_context_assembly_stats
+from helpers.interaction_dedupe import get_interaction_dedupe_stats
+from helpers.memory import (
+    flush_memory_writes,
+    get_memory_gating_stats,
+    get_memory_retrieval_stats,
+    get_memory_summary_cache_stats,
+    get_seed_stats,
+)
+from helpers.response_cache import etag_matches, fingerprint, get_analysis_cache, make_etag
+from helpers.semantic_cache import get_semantic_cache
+from helpers.resilience import BEDROCK_RETRY_MAX_DELAY, get_resilience_stats
+from helpers.tool_execution import get_tool_timing_stats
+from helpers.tool_results import get_tool_result_encoding_stats
+from tools.tool_cache import get_tool_cache_stats
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -78,24 +97,45 @@ templates = Jinja2Templates(directory="templates")
 
 # Initialize the agent (singleton pattern)
 agent = None
+agent_pool = None
+
+
+def get_agent_pool() -> AgentPool:
+    """Get the pool of pre-warmed agents, starting it on first use."""
+    global agent_pool
+    if agent_pool is None:
+        agent_pool = AgentPool(ProductHuntLaunchAgent)
+    return agent_pool
+
 
 def get_agent(user_id: str = None, session_id: str = None):
-    """Get or create the Product Hunt agent instance."""
+    """Get the Product Hunt agent instance, binding a pre-warmed one for a new user."""
     global agent
-    if agent is None:
+    if agent is None or (user_id and agent.get_user_id() != user_id):
         try:
-            logger.info("Initializing Product Hunt Launch Agent...")
-            agent = ProductHuntLaunchAgent()
+            logger.info("Binding Product Hunt Launch Agent from pool...")
+            agent = get_agent_pool().acquire(user_id=user_id, session_id=session_id)
             logger.info("Agent initialized successfully!")
         except Exception as e:
             logger.error(f"Failed to initialize agent: {e}")
             logger.error(traceback.format_exc())
             raise e
-    if agent is None or (user_id and agent.get_user_id() != user_id):
-        agent = ProductHuntLaunchAgent(user_id=user_id, session_id=session_id)
     return agent
 
 
+@app.on_event("startup")
+async def warm_agent_pool():
+    """Start pre-warming agents so the first session does not pay for construction."""
+    get_agent_pool()
+
+
+@app.on_event("shutdown")
+async def flush_pending_memory_writes():
+    """Give queued memory writes a last chance to finish before the process exits."""
+    if not flush_memory_writes(timeout=10):
+        logger.warning("Shutting down with memory writes still pending")
+
+
 @app.get("/", response_class=HTMLResponse)
 async def read_root(request: Request):
     """Serve the main web interface."""
@@ -114,6 +154,27 @@ async def health_check():
     return {"status": "healthy", "service": "Product Hunt Launch Assistant"}
 
 
+@app.get("/api/metrics")
+async def get_metrics():
+    """Operational metrics for caches and other performance layers."""
+    return {
+        "tool_cache": get_tool_cache_stats(),
+        "tool_timing": get_tool_timing_stats(),
+        "tool_result_encoding": get_tool_result_encoding_stats(),
+        "model_tiers": get_model_tier_stats(),
+        "bedrock": get_resilience_stats(),
+        "agent_pool": get_agent_pool().stats(),
+        "analysis_cache": get_analysis_cache().stats(),
+        "semantic_cache": get_semantic_cache().stats() if get_semantic_cache() else None,
+        "memory_summary_cache": get_memory_summary_cache_stats(),
+        "memory_seeding": get_seed_stats(),
+        "memory_retrieval": get_memory_retrieval_stats(),
+        "memory_gating": get_memory_gating_stats(),
+        "memory_context": get_context_assembly_stats(),
+        "memory_dedupe": get_interaction_dedupe_stats()
+    }
+
+
 @app.post("/api/chat", response_model=AgentResponse)
 async def chat_with_agent(request: ChatRequest):
     """General chat endpoint with the Product Hunt assistant."""
@@ -121,7 +182,7 @@ async def chat_with_agent(request: ChatRequest):
         logger.info(f"Chat request: {request.message[:100]}...")
         agent_instance = get_agent()
         agent_instance = get_agent(user_id=request.user_id, session_id=request.session_id)
-        response = agent_instance.chat(request.message)
+        response = agent_instance.chat(request.message, request.context)
         logger.info("Chat response generated successfully")
 
         # Extract text content from AgentResult if needed
@@ -154,9 +215,22 @@ async def chat_with_agent(request: ChatRequest):
             data={
                 "context": request.context,
                 "user_id": agent_instance.get_user_id(),
-                "session_id": agent_instance.get_session_id()
+                "session_id": agent_instance.get_session_id(),
+                "model_tier": None if agent_instance.last_cache_hit else agent_instance.last_tier,
+                "semantic_cache_hit": agent_instance.last_cache_hit,
+                # A/B group and retrieval decision, for comparing answer quality with and without gating
+                "memory_gate": agent_instance.memory_hooks.last_gate
+                if agent_instance.memory_hooks and not agent_instance.last_cache_hit else None,
+                "tool_timings": agent_instance.get_tool_timings()
             }
         )
+    except ModelThrottledException as e:
+        logger.warning(f"Chat throttled after retries: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail="The model is busy, please retry shortly",
+            headers={"Retry-After": str(int(BEDROCK_RETRY_MAX_DELAY))}
+        )
     except Exception as e:
         logger.error(f"Chat error: {e}")
         logger.error(traceback.format_exc())
@@ -190,7 +264,7 @@ async def chat_with_agent_stream(request: ChatRequest):
             accumulated_text = ""
 
             # Get the full response first (Strands may not support true streaming)
-            response = agent_instance.chat(request.message)
+            response = agent_instance.chat(request.message, request.context)
             logger.info("Chat response generated, starting streaming simulation")
 
             # Extract text content from AgentResult
@@ -293,12 +367,13 @@ async def chat_with_agent_stream(request: ChatRequest):
 
 
 @app.post("/api/analyze-product", response_model=AgentResponse)
-async def analyze_product(request: ProductRequest):
-    """Analyze a product and provide comprehensive launch guidance."""
-    try:
-        agent_instance = get_agent(user_id=request.user_id, session_id=request.session_id)
+async def analyze_product(request: ProductRequest, http_request: Request, refresh: bool = False):
+    """Analyze a product and provide comprehensive launch guidance.
 
-        # Seed memory with product information
+    Analyses are cached per user by product fingerprint and model; pass
+    ?refresh=true to regenerate. Responses carry an ETag and honour If-None-Match.
+    """
+    try:
         product_data = {
             "product_name": request.product_name,
             "product_type": request.product_type,
@@ -308,27 +383,35 @@ async def analyze_product(request: ProductRequest):
             "additional_notes": request.additional_notes,
             "github_repo": request.github_repo
         }
-        agent_instance.seed_product_memory(product_data)
 
         # Create a comprehensive prompt for the agent
-        prompt = f"""I need help launching my product on Product Hunt. Here are the details:
+        prompt = build_analysis_prompt(product_data)
 
-Product Name: {request.product_name}
-Product Type: {request.product_type}
-Description: {request.product_description}
-Target Audience: {request.target_audience or 'Not specified'}
-Planned Launch Date: {request.launch_date or 'Not specified'}
-Additional Notes: {request.additional_notes or 'None'}
-GitHub Repository: {request.github_repo or 'Not provided'}
+        agent_instance = get_agent(user_id=request.user_id, session_id=request.session_id)
 
-Please provide a comprehensive analysis and recommendations including:
-1. Launch timeline and key milestones
-2. Marketing strategy and messaging
-3. Competitive landscape insights
-4. Hunter recommendations
-5. Strategic advice for success
+        # Seed memory with product information
+        agent_instance.seed_product_memory(product_data)
 
-Focus on actionable, specific recommendations tailored to my product."""
+        router = get_model_router()
+        model_id = router.rules["tiers"][router.route(prompt)[0]]["model_id"]
+        cache = get_analysis_cache()
+        cache_key = fingerprint(analysis_cache_payload(product_data, model_id, agent_instance.get_user_id()))
+        if not refresh:
+            cached = cache.get(cache_key)
+            if cached:
+                logger.info(f"Analysis cache hit ({cached['age_seconds']}s old)")
+                # Identity and request details always come from this request, never from the cached body
+                body = cached["body"]
+                body["data"].update({
+                    "product_info": request.dict(),
+                    "user_id": agent_instance.get_user_id(),
+                    "session_id": agent_instance.get_session_id(),
+                })
+                etag = make_etag(body)
+                headers = {"ETag": etag, "X-Cache": "HIT", "Age": str(int(cached["age_seconds"]))}
+                if etag_matches(http_request.headers.get("if-none-match"), etag):
+                    return Response(status_code=304, headers=headers)
+                return JSONResponse(content=body, headers=headers)
 
         logger.info("Sending prompt to agent...")
         response = agent_instance.chat(prompt)
@@ -358,15 +441,28 @@ Focus on actionable, specific recommendations tailored to my product."""
             else:
                 response_text = response_str
 
-        return AgentResponse(
+        result = AgentResponse(
             success=True,
             response=response_text,
             data={
                 "product_info": request.dict(),
                 "analysis_type": "comprehensive",
                 "user_id": agent_instance.get_user_id(),
-                "session_id": agent_instance.get_session_id()
+                "session_id": agent_instance.get_session_id(),
+                "model_tier": agent_instance.last_tier,
+                "tool_timings": agent_instance.get_tool_timings()
             }
+        ).model_dump(mode="json")
+        etag = cache.put(cache_key, result)
+        if etag_matches(http_request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers={"ETag": etag, "X-Cache": "MISS"})
+        return JSONResponse(content=result, headers={"ETag": etag, "X-Cache": "MISS"})
+    except ModelThrottledException as e:
+        logger.warning(f"Analysis throttled after retries: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail="The model is busy, please retry shortly",
+            headers={"Retry-After": str(int(BEDROCK_RETRY_MAX_DELAY))}
         )
     except Exception as e:
         logger.error(f"Analysis error: {e}")
@@ -381,7 +477,7 @@ async def generate_timeline(request: ProductRequest):
         agent_instance = get_agent(user_id=request.user_id, session_id=request.session_id)
 
         # Use the timeline tool directly
-        from src.tools.product_tools import generate_launch_timeline
+        from tools.product_tools import generate_launch_timeline
 
         result = generate_launch_timeline(
             product_name=request.product_name,
@@ -410,13 +506,14 @@ async def generate_marketing_assets(request: ProductRequest):
     """Generate marketing assets for the product."""
     try:
         agent_instance = get_agent(user_id=request.user_id, session_id=request.session_id)
-        from src.tools.product_tools import generate_marketing_assets
+        from tools.product_tools import generate_marketing_assets
 
         result = generate_marketing_assets(
             product_name=request.product_name,
             elevator_pitch=request.product_description,
             target_audience=request.target_audience or "entrepreneurs and startups",
-            tone="professional"
+            tone="professional",
+            product_type=request.product_type
         )
 
         if result.get("success"):
@@ -439,7 +536,7 @@ async def research_competition(request: ProductRequest):
     """Research competitive landscape and successful launches."""
     try:
         agent_instance = get_agent(user_id=request.user_id, session_id=request.session_id)
-        from src.tools.product_tools import research_top_launches
+        from tools.product_tools import research_top_launches
 
         result = research_top_launches(
             product_category=request.product_type,
@@ -493,20 +590,28 @@ async def get_github_repo_info(owner: str, repo: str):
 
 
 @app.post("/api/memory/summary", response_model=MemorySummaryResponse)
-async def get_memory_summary(request: MemoryRequest):
-    """Get a summary of user's stored memories."""
+async def get_memory_summary(request: MemoryRequest, http_request: Request):
+    """Get a summary of user's stored memories.
+
+    Summaries are cached until the user's memory is written; send the returned
+    ETag as If-None-Match to get 304 Not Modified when nothing has changed.
+    """
     try:
         agent_instance = get_agent(user_id=request.user_id, session_id=request.session_id)
         memory_summary = agent_instance.get_memory_summary()
-        
-        return MemorySummaryResponse(
+
+        body = MemorySummaryResponse(
             success=True,
             user_id=agent_instance.get_user_id(),
             session_id=agent_instance.get_session_id(),
             preferences=memory_summary.get("preferences", []),
             semantic_memories=memory_summary.get("semantic", []),
             total_memories=memory_summary.get("total_memories", 0)
-        )
+        ).model_dump(mode="json")
+        etag = make_etag(body)
+        if etag_matches(http_request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        return JSONResponse(content=body, headers={"ETag": etag})
     except Exception as e:
         return MemorySummaryResponse(
             success=False,
@@ -558,17 +663,61 @@ async def seed_memory(request: ProductRequest):
         )
 
 
+@app.post("/api/memory/prefetch", response_model=AgentResponse)
+async def prefetch_memory(request: ProductRequest, background_tasks: BackgroundTasks):
+    """Start warming the user's memory context with queries built from their product details.
+
+    Returns immediately; the chat page calls this on load so the first turn
+    finds its memories already fetched. data["prefetch"] reports whether the
+    pool alone will serve that turn ("pool"), is merged with a live retrieval
+    because the user's memory was just written ("pool+live"), or was skipped.
+    """
+    try:
+        agent_instance = get_agent(user_id=request.user_id, session_id=request.session_id)
+
+        product_data = {
+            "product_name": request.product_name,
+            "product_type": request.product_type,
+            "product_description": request.product_description,
+            "target_audience": request.target_audience,
+            "launch_date": request.launch_date,
+        }
+        mode = agent_instance.prefetch_mode()
+        if agent_instance.memory_hooks:
+            # A prefetch the breaker refuses is counted under memory_retrieval.prefetch_skipped
+            background_tasks.add_task(agent_instance.prefetch_memory, product_data)
+
+        return AgentResponse(
+            success=True,
+            response="Memory prefetch skipped" if mode == "skipped" else "Memory prefetch started",
+            data={
+                "user_id": agent_instance.get_user_id(),
+                "session_id": agent_instance.get_session_id(),
+                "memory_enabled": bool(agent_instance.memory_hooks),
+                "prefetch": mode
+            }
+        )
+    except Exception as e:
+        return AgentResponse(
+            success=False,
+            response="Error prefetching memory",
+            error=f"Memory prefetch error: {str(e)}"
+        )
+
+
 @app.post("/api/session/create", response_model=UserSessionResponse)
 async def create_user_session():
-    """Create a new user session with memory enabled."""
+    """Create a new user session; a pre-warmed agent is bound to it on first use."""
     try:
-        agent_instance = get_agent()
-        
+        pool = get_agent_pool()
+        ids = pool.create_session()
+
         return UserSessionResponse(
             success=True,
-            user_id=agent_instance.get_user_id(),
-            session_id=agent_instance.get_session_id(),
-            memory_enabled=agent_instance.memory_hooks is not None
+            user_id=ids["user_id"],
+            session_id=ids["session_id"],
+            # The first build may still be running right after startup
+            memory_enabled=await asyncio.to_thread(pool.memory_status)
         )
     except Exception as e:
         return UserSessionResponse(
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""Micro-benchmarks for the Product Hunt Launch Assistant's local code paths."""
+
+import argparse
+import inspect
+import sys
+import time
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent
+sys.path.append(str(project_root))
+sys.path.append(str(project_root / "src"))
+
+
+def _timed(fn, repeat: int = 3) -> float:
+    """Return the best wall time of fn() over several runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_timeline(n: int):
+    """Compare the per-item timeline tool against the vectorized batch engine."""
+    from datetime import date, timedelta
+    from tools.product_tools import (
+        compute_timeline_dates,
+        generate_launch_timeline,
+        generate_launch_timelines_batch,
+        to_datetime64,
+    )
+
+    today = date.today()
+    launch_dates = [(today + timedelta(days=3 + i % 60)).isoformat() for i in range(n)]
+    product_types = ["SaaS", "Mobile App", "Chrome Extension"] * (n // 3 + 1)
+    product_types = product_types[:n]
+
+    # The tool memoizes results and the inputs repeat, so time the undecorated function
+    timeline_tool = inspect.unwrap(generate_launch_timeline)
+
+    def per_item():
+        # Keep the results, as the batch path does, so both pay the same garbage collection cost
+        return [
+            timeline_tool(product_name="Bench", product_type=product_type, launch_date=launch_date)
+            for launch_date, product_type in zip(launch_dates, product_types)
+        ]
+
+    def batch():
+        generate_launch_timelines_batch(launch_dates, product_types, today=today)
+
+    launch_array = to_datetime64(launch_dates)
+
+    def dates_only():
+        compute_timeline_dates(launch_array, today=today)
+
+    per_item_time = _timed(per_item)
+    batch_time = _timed(batch)
+    dates_time = _timed(dates_only)
+    print(f"📅 Timelines x{n}")
+    print(f"   per-item: {per_item_time * 1000:.1f} ms ({n / per_item_time:,.0f}/s)")
+    print(f"   batch:    {batch_time * 1000:.1f} ms ({n / batch_time:,.0f}/s)")
+    print(f"   dates:    {dates_time * 1000:.1f} ms ({n / dates_time:,.0f}/s, arrays only)")
+    print(f"   speedup:  {per_item_time / batch_time:.1f}x (dicts), {per_item_time / dates_time:.0f}x (arrays)")
+
+
+def bench_date_parser(n: int):
+    """Compare the memoized date grammar against the dateutil fallback."""
+    from datetime import date
+    from dateutil import parser
+    from tools.product_tools import _parse_launch_date_cached, parse_launch_date
+
+    today = date.today()
+    inputs = ["2025-12-01", "next Wednesday", "in 3 weeks", "end of month", "friday", "in 10 days", "2026-03-15"]
+    inputs = (inputs * (n // len(inputs) + 1))[:n]
+    iso_inputs = [f"2026-{1 + i % 12:02d}-{1 + i % 28:02d}" for i in range(n)]
+
+    def dateutil_only():
+        for text in iso_inputs:
+            parser.parse(text)
+
+    def grammar_cold():
+        for text in iso_inputs:
+            _parse_launch_date_cached.cache_clear()
+            parse_launch_date(text, today=today)
+
+    def grammar_warm():
+        for text in inputs:
+            parse_launch_date(text, today=today)
+
+    dateutil_time = _timed(dateutil_only)
+    cold_time = _timed(grammar_cold)
+    warm_time = _timed(grammar_warm)
+    print(f"🗓️  Date parsing x{n}")
+    print(f"   dateutil:        {dateutil_time / n * 1e6:.2f} µs/call")
+    print(f"   grammar (cold):  {cold_time / n * 1e6:.2f} µs/call")
+    print(f"   grammar (warm):  {warm_time / n * 1e6:.2f} µs/call")
+    print(f"   speedup:         {dateutil_time / cold_time:.1f}x cold, {dateutil_time / warm_time:.1f}x warm")
+
+
+def bench_launch_index(n: int):
+    """Measure launch index build time, size and query latency on a synthetic corpus."""
+    import json
+    import random
+    import tempfile
+    from tools.launch_index import LaunchIndex, build_launch_index
+
+    rng = random.Random(42)
+    categories = ["Productivity", "AI Tools", "Design", "Developer Tools", "Marketing", "Fintech", "Health"]
+    audiences = ["developers", "designers", "marketers", "founders", "remote teams", "students"]
+    factors = ["Strong community", "Clear value prop", "Great timing", "Founder story", "Clear demo", "AI trend"]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus = Path(tmp) / "launches.jsonl"
+        with open(corpus, "w") as f:
+            for i in range(n):
+                category = rng.choice(categories)
+                f.write(json.dumps({
+                    "name": f"Launch {i}",
+                    "tagline": f"{category} for {rng.choice(audiences)}",
+                    "category": category,
+                    "launch_date": f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+                    "rank": rng.randint(1, 20),
+                    "upvotes": rng.randint(10, 5000),
+                    "success_factors": rng.sample(factors, 3),
+                }) + "\n")
+
+        start = time.perf_counter()
+        stats = build_launch_index(str(corpus), str(Path(tmp) / "launches.db"))
+        build_time = time.perf_counter() - start
+
+        index = LaunchIndex(stats["path"])
+        queries = [(rng.choice(categories), rng.choice(audiences)) for _ in range(200)]
+        latencies = []
+        for category, audience in queries:
+            start = time.perf_counter()
+            index.search(category, audience, top_k=5)
+            latencies.append(time.perf_counter() - start)
+        latencies.sort()
+
+    print(f"🔎 Launch index x{n}")
+    print(f"   build:    {build_time * 1000:.0f} ms, {stats['index_bytes'] / 1024:.0f} KiB")
+    print(f"   query:    p50 {latencies[len(latencies) // 2] * 1000:.2f} ms, p99 {latencies[int(len(latencies) * 0.99)] * 1000:.2f} ms")
+
+
+def bench_hunter_index(n: int):
+    """Measure hunter index build, top-k query latency and incremental updates."""
+    import random
+    from tools.hunter_index import HunterIndex
+
+    rng = random.Random(7)
+    topics = ["productivity", "ai tools", "design", "developer tools", "marketing", "fintech", "health",
+              "saas", "mobile apps", "chrome extensions", "no-code", "remote work", "education", "crypto"]
+    audiences = ["developers", "designers", "marketers", "founders", "remote teams", "students"]
+
+    def profile(i: int) -> dict:
+        picked = rng.sample(topics, 3)
+        return {
+            "handle": f"@hunter{i}",
+            "name": f"Hunter {i}",
+            "specialization": f"{picked[0]} and {picked[1]}",
+            "topics": picked + rng.sample(audiences, 2),
+            "followers": rng.randint(100, 50000),
+            "success_rate": rng.random(),
+        }
+
+    profiles = [profile(i) for i in range(n)]
+    index = HunterIndex()
+    start = time.perf_counter()
+    index.upsert(profiles)
+    build_time = time.perf_counter() - start
+
+    queries = [(rng.choice(topics), rng.choice(audiences)) for _ in range(200)]
+    latencies = []
+    for category, audience in queries:
+        start = time.perf_counter()
+        index.match(category, audience, top_k=5, min_followers=1000)
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+
+    batch_time = _timed(lambda: index.match_many(queries[:64], top_k=5))
+
+    updates = [profile(rng.randrange(n)) for _ in range(100)]
+    start = time.perf_counter()
+    index.upsert(updates)
+    update_time = time.perf_counter() - start
+
+    print(f"🎯 Hunter index x{n}")
+    print(f"   build:    {build_time * 1000:.0f} ms, {index._vectors.nbytes / 1e6:.0f} MB matrix")
+    print(f"   query:    p50 {latencies[len(latencies) // 2] * 1000:.2f} ms, p99 {latencies[int(len(latencies) * 0.99)] * 1000:.2f} ms")
+    print(f"   batch:    {batch_time / 64 * 1000:.2f} ms/query (64 queries per call)")
+    print(f"   update:   {update_time * 1000:.1f} ms for 100 changed profiles")
+
+
+def bench_marketing(n: int):
+    """Measure batched marketing asset generation throughput."""
+    from tools.marketing_templates import TONES, generate_assets_batch
+
+    product_types = ["SaaS", "Mobile App", "Chrome Extension", "API", "Hardware"]
+    products = [
+        {
+            "product_name": f"Product {i}",
+            "elevator_pitch": "An AI assistant that turns messy meeting notes into clear action items for the whole team",
+            "target_audience": "remote teams",
+            "tone": TONES[i % len(TONES)],
+            "product_type": product_types[i % len(product_types)],
+        }
+        for i in range(n)
+    ]
+
+    batch_time = _timed(lambda: generate_assets_batch(products, variants=5))
+    print(f"📣 Marketing assets x{n}")
+    print(f"   batch:    {batch_time * 1000:.0f} ms ({n / batch_time:,.0f} products/s, 5 variants each)")
+
+
+def bench_tool_results(n: int):
+    """Compare estimated model tokens of JSON and compact tool results, per tool."""
+    import json
+    from helpers.tool_results import encode_compact, estimate_tokens
+    from tools.product_tools import (
+        find_best_launch_days,
+        generate_launch_timeline,
+        generate_marketing_assets,
+        research_top_launches,
+    )
+
+    results = {
+        "generate_launch_timeline": generate_launch_timeline(
+            product_name="Acme", product_type="SaaS", launch_date="in 3 weeks"
+        ),
+        "generate_marketing_assets": generate_marketing_assets(
+            product_name="Acme", elevator_pitch="Turn meeting notes into action items", target_audience="remote teams"
+        ),
+        "research_top_launches": research_top_launches(product_category="SaaS", target_audience="developers"),
+        "find_best_launch_days": find_best_launch_days(product_category="SaaS"),
+    }
+
+    print("🗜️  Tool result encoding (estimated tokens)")
+    for name, result in results.items():
+        json_tokens = estimate_tokens(json.dumps(result, ensure_ascii=False))
+        compact_tokens = estimate_tokens(encode_compact(result))
+        print(f"   {name:<26} json {json_tokens:>4}  compact {compact_tokens:>4}  ({1 - compact_tokens / json_tokens:.0%} fewer)")
+
+    encode_time = _timed(lambda: [encode_compact(r) for _ in range(n) for r in results.values()])
+    print(f"   encode:   {encode_time / (n * len(results)) * 1e6:.1f} µs/result")
+
+
+def bench_memory(n: int):
+    """Measure local memory backend write and retrieval latency, optionally against AgentCore.
+
+    Set BENCH_REMOTE_MEMORY=1 with AWS credentials to time the same
+    retrievals against the AgentCore Memory service.
+    """
+    import os
+    import random
+    import tempfile
+    from helpers.local_memory import LocalMemoryClient
+
+    rng = random.Random(11)
+    topics = ["note-taking", "analytics", "design", "CI pipelines", "invoicing", "fitness", "hiring"]
+    audiences = ["developers", "designers", "marketers", "founders", "remote teams", "students"]
+    tastes = ["short punchy tweets", "a formal tone", "emoji in copy", "launching on Tuesdays", "detailed checklists"]
+    actors = [f"user_{i}" for i in range(max(1, n // 100))]
+
+    def latency_summary(latencies):
+        latencies.sort()
+        return f"p50 {latencies[len(latencies) // 2] * 1000:.2f} ms, p99 {latencies[int(len(latencies) * 0.99)] * 1000:.2f} ms"
+
+    queries = [
+        (rng.choice(actors), f"how do I reach {rng.choice(audiences)} for my {rng.choice(topics)} launch")
+        for _ in range(200)
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        client = LocalMemoryClient(str(Path(tmp) / "memory.db"))
+        writes = []
+        for i in range(n):
+            actor = rng.choice(actors)
+            messages = [
+                (f"I prefer {rng.choice(tastes)}. Our product helps {rng.choice(audiences)} with {rng.choice(topics)}.", "USER"),
+                (f"Great, here is a plan for launch #{i}.", "ASSISTANT"),
+            ]
+            start = time.perf_counter()
+            client.create_event(memory_id="local", actor_id=actor, session_id="bench", messages=messages)
+            writes.append(time.perf_counter() - start)
+
+        reads = []
+        for actor, query in queries:
+            start = time.perf_counter()
+            for kind in ("preferences", "semantic"):
+                client.retrieve_memories(memory_id="local", namespace=f"producthunt/user/{actor}/{kind}", query=query, top_k=5)
+            reads.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        LocalMemoryClient(str(Path(tmp) / "memory.db"))
+        reload_time = time.perf_counter() - start
+
+    print(f"🧠 Local memory x{n} events, {len(actors)} actors")
+    print(f"   write:    {latency_summary(writes)}")
+    print(f"   retrieve: {latency_summary(reads)} (both namespaces)")
+    print(f"   reload:   {reload_time * 1000:.0f} ms")
+
+    if os.getenv("BENCH_REMOTE_MEMORY") != "1":
+        print("   remote:   skipped (set BENCH_REMOTE_MEMORY=1 to compare with AgentCore)")
+        return
+    from helpers.memory import create_or_get_memory_resource, memory_client
+
+    memory_id = create_or_get_memory_resource()
+    remote = []
+    for actor, query in queries[:20]:
+        start = time.perf_counter()
+        for kind in ("preferences", "semantic"):
+            memory_client.retrieve_memories(memory_id=memory_id, namespace=f"producthunt/user/{actor}/{kind}", query=query, top_k=5)
+        remote.append(time.perf_counter() - start)
+    print(f"   remote:   {latency_summary(remote)} (AgentCore, both namespaces)")
+
+
+BENCHMARKS = {
+    "timeline": bench_timeline,
+    "dates": bench_date_parser,
+    "launch_index": bench_launch_index,
+    "hunters": bench_hunter_index,
+    "marketing": bench_marketing,
+    "tool_results": bench_tool_results,
+    "memory": bench_memory,
+}
+
+
+def main():
+    """Run the selected benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("names", nargs="*", default=list(BENCHMARKS), help=f"Benchmarks to run: {', '.join(BENCHMARKS)}")
+    parser.add_argument("-n", type=int, default=5000, help="Workload size")
+    args = parser.parse_args()
+
+    print("⏱️  Product Hunt Launch Assistant benchmarks")
+    print("=" * 50)
+    for name in args.names:
+        BENCHMARKS[name](args.n)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,34 @@
 #!/usr/bin/env python3
 """Main entry point for the Product Hunt Launch Assistant."""
 
+import argparse
+import json
 import sys
 import os
 
 # Add src directory to Python path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
+from pydantic import ValidationError
+
+from api.models import ProductRequest
 from src.agent import ProductHuntLaunchAgent
+from src.batch import BATCH_STEPS, load_products, run_batch
+from helpers.memory import MEMORY_BACKEND, create_or_get_memory_resource, get_memory_client, get_memory_data_client
+from helpers.memory_transfer import (
+    EXPORT_PAGE_SIZE,
+    IMPORT_BATCH_SIZE,
+    IMPORT_CONCURRENCY,
+    MEMORY_NAMESPACE_PREFIX,
+    actor_namespaces,
+    export_memory_records,
+    import_memory_records,
+)
+from tools.launch_index import build_launch_index
 
 
-def main():
-    """Main function to run the Product Hunt launch assistant."""
+def run_interactive():
+    """Run the interactive Product Hunt launch assistant."""
     print("🚀 Product Hunt Launch Assistant")
     print("=" * 40)
     print("Your AI-powered guide to Product Hunt success!")
@@ -26,5 +43,150 @@ def main():
         sys.exit(1)
 
 
+def run_batch_command(args):
+    """Process a CSV/JSONL file of products and stream JSONL results."""
+    steps = [s.strip() for s in args.steps.split(",") if s.strip()]
+    unknown = [s for s in steps if s not in BATCH_STEPS]
+    if unknown:
+        print(f"Unknown steps: {', '.join(unknown)}. Choose from: {', '.join(BATCH_STEPS)}", file=sys.stderr)
+        sys.exit(2)
+
+    products, rows, invalid = [], [], []
+    for entry in load_products(args.input):
+        raw = entry.get("product")
+        if not isinstance(raw, dict):
+            error = entry.get("error", "Each line must be a JSON object")
+            invalid.append({"row": entry["row"], "product_name": None, "errors": {"parse": error}})
+            continue
+        try:
+            products.append(ProductRequest(**raw).model_dump())
+            rows.append(entry["row"])
+        except ValidationError as e:
+            invalid.append({
+                "row": entry["row"],
+                "product_name": raw.get("product_name"),
+                "errors": {"validation": e.errors(include_url=False)},
+            })
+
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        stats = run_batch(
+            products,
+            steps=steps,
+            concurrency=args.concurrency,
+            agent_factory=ProductHuntLaunchAgent,
+            output=output,
+            rows=rows,
+            invalid=invalid,
+        )
+    finally:
+        if args.output:
+            output.close()
+
+    print(
+        f"✅ Processed {stats['total']} products in {stats['elapsed_seconds']}s "
+        f"({stats['products_per_second']} products/s), {stats['failed']} failed ({stats['invalid']} invalid)",
+        file=sys.stderr,
+    )
+    for failure in stats["failures"]:
+        print(f"❌ Row {failure['row']} ({failure['product_name']}): {json.dumps(failure['errors'], default=str)}", file=sys.stderr)
+    if stats["failed"]:
+        sys.exit(1)
+
+
+def run_index_launches_command(args):
+    """Build the local launch index used by research_top_launches."""
+    stats = build_launch_index(args.input, args.db)
+    print(f"✅ Indexed {stats['launches']} launches into {stats['path']} ({stats['index_bytes'] / 1024:.1f} KiB)")
+
+
+def _memory_id(args) -> str:
+    memory_id = args.memory_id or create_or_get_memory_resource()
+    if not memory_id:
+        print("No memory resource available; pass --memory-id or check AWS credentials", file=sys.stderr)
+        sys.exit(1)
+    return memory_id
+
+
+def run_export_memory_command(args):
+    """Stream memory records for some actors, namespaces or everyone to a .jsonl.gz file."""
+    memory_id = _memory_id(args)
+    namespaces = list(args.namespace or [])
+    if args.actor:
+        namespaces += actor_namespaces(args.actor, get_memory_client().get_memory_strategies(memory_id))
+    stats = export_memory_records(
+        get_memory_data_client(),
+        memory_id,
+        namespaces or [MEMORY_NAMESPACE_PREFIX],
+        args.output,
+        page_size=args.page_size,
+    )
+    print(
+        f"✅ Exported {stats['records']} memory records to {args.output} in {stats['elapsed_seconds']}s "
+        f"({stats['records_per_second']} records/s)",
+        file=sys.stderr,
+    )
+
+
+def run_import_memory_command(args):
+    """Import memory records from a .jsonl.gz export with bounded concurrent batch writes."""
+    stats = import_memory_records(
+        get_memory_data_client(),
+        _memory_id(args),
+        args.input,
+        batch_size=args.batch_size,
+        concurrency=args.concurrency,
+    )
+    print(
+        f"✅ Imported {stats['imported']} of {stats['records']} memory records in {stats['elapsed_seconds']}s "
+        f"({stats['records_per_second']} records/s), {stats['failed']} failed",
+        file=sys.stderr,
+    )
+    if stats["failed"]:
+        sys.exit(1)
+
+
+def main():
+    """Main function to run the Product Hunt launch assistant."""
+    parser = argparse.ArgumentParser(description="Product Hunt Launch Assistant")
+    subparsers = parser.add_subparsers(dest="command")
+
+    batch_parser = subparsers.add_parser("batch", help="Plan launches for many products from a CSV/JSONL file")
+    batch_parser.add_argument("input", help="CSV or JSONL file with ProductRequest fields")
+    batch_parser.add_argument("-o", "--output", help="Write JSONL results to this file instead of stdout")
+    batch_parser.add_argument("-c", "--concurrency", type=int, default=4, help="Maximum products processed at once")
+    batch_parser.add_argument("--steps", default=",".join(BATCH_STEPS), help="Comma-separated steps to run")
+
+    index_parser = subparsers.add_parser("index-launches", help="Build the local launch index from a JSONL corpus")
+    index_parser.add_argument("input", help="JSONL file with one launch per line")
+    index_parser.add_argument("--db", help="Index file to write (default: data/launches.db or LAUNCH_INDEX_PATH)")
+
+    memory_backend = f"the {MEMORY_BACKEND} memory backend"
+    export_parser = subparsers.add_parser("export-memory", help=f"Export memory records from {memory_backend} as compressed JSONL")
+    export_parser.add_argument("output", help="File to write, e.g. memories.jsonl.gz")
+    export_parser.add_argument("--actor", action="append", help="Export this user's records (repeatable)")
+    export_parser.add_argument("--namespace", action="append", help="Export records under this namespace prefix (repeatable)")
+    export_parser.add_argument("--page-size", type=int, default=EXPORT_PAGE_SIZE, help="Records listed per request")
+    export_parser.add_argument("--memory-id", help="Memory to export (default: the configured memory resource)")
+
+    import_parser = subparsers.add_parser("import-memory", help=f"Import memory records into {memory_backend}")
+    import_parser.add_argument("input", help="File written by export-memory")
+    import_parser.add_argument("-c", "--concurrency", type=int, default=IMPORT_CONCURRENCY, help="Maximum batches written at once")
+    import_parser.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE, help="Records per batch write (at most 100)")
+    import_parser.add_argument("--memory-id", help="Memory to import into (default: the configured memory resource)")
+
+    args = parser.parse_args()
+    if args.command == "batch":
+        run_batch_command(args)
+    elif args.command == "index-launches":
+        run_index_launches_command(args)
+    elif args.command == "export-memory":
+        run_export_memory_command(args)
+    elif args.command == "import-memory":
+        run_import_memory_command(args)
+    else:
+        run_interactive()
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
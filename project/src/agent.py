@@ -1,13 +1,25 @@
 """Product Hunt Launch Assistant with AgentCore Memory integration."""
 
+import asyncio
 import boto3
+import time
 import uuid
 from strands import Agent
 from strands.models import BedrockModel
 
-from tools.product_tools import generate_launch_timeline, generate_marketing_assets, research_top_launches
+from tools.product_tools import (
+    find_best_launch_days,
+    generate_launch_timeline,
+    generate_marketing_assets,
+    research_top_launches,
+)
 from helpers.utils import get_boto_session, load_aws_config
+from helpers.model_router import get_model_router, record_turn
+from helpers.resilience import ResilientModel
+from helpers.semantic_cache import get_semantic_cache
 from helpers.memory import get_memory_hooks, seed_product_memory, get_user_memory_summary
+from helpers.tool_execution import BoundedConcurrentToolExecutor, ToolTimingHooks
+from helpers.tool_results import get_tool_result_hooks
 
 
 class ProductHuntLaunchAgent:
@@ -47,9 +59,10 @@ You have access to the following specialized tools:
 1. generate_launch_timeline() - Create detailed launch timelines with tasks, deadlines, and milestones
 2. generate_marketing_assets() - Generate taglines, descriptions, tweets, and marketing content
 3. research_top_launches() - Research successful launches, identify hunters, and provide competitive insights
+4. find_best_launch_days() - Rank candidate launch days in a window by competing launches in the category
 
 Key principles for Product Hunt success:
-- Tuesday-Thursday launches typically perform best
+- Tuesday-Thursday launches typically perform best; use find_best_launch_days() to check actual competition instead of guessing
 - Community building 2-3 weeks before launch is crucial
 - Clear, benefit-focused messaging outperforms feature lists
 - Authentic founder stories drive engagement
@@ -57,38 +70,111 @@ Key principles for Product Hunt success:
 
 Always use the appropriate tools to provide data-driven recommendations and actionable advice tailored to each user's specific product and timeline."""
 
-        # Initialize the Bedrock model (Anthropic Claude 3.5 Haiku)
-        self.model = BedrockModel(
-            model_id="anthropic.claude-3-5-haiku-20241022-v1:0",
-            temperature=0.3,
-            region_name=self.region,
-            stream=True  # Enable streaming from the model
-        )
+        # Bedrock models per tier; each turn is routed by complexity (Claude 3.5 Haiku by default)
+        self.router = get_model_router()
+        self._models = {}
+        self.last_tier = self.router.rules["default_tier"]
+        self.model = self._model_for(self.last_tier)
+
+        # Answers to paraphrased context-free questions are reused per user
+        self.semantic_cache = get_semantic_cache()
+        self.last_cache_hit = False
+
+        # Create the agent with Product Hunt tools, memory hooks, tool timing and compact tool results
+        self.tool_timing = ToolTimingHooks()
+        hooks = [hook for hook in (self.memory_hooks, self.tool_timing, get_tool_result_hooks()) if hook]
 
-        # Create the agent with Product Hunt tools and memory hooks
-        hooks = [self.memory_hooks] if self.memory_hooks else []
-        
         self.agent = Agent(
             model=self.model,
             tools=[
                 generate_launch_timeline,
                 generate_marketing_assets,
                 research_top_launches,
+                find_best_launch_days,
             ],
             system_prompt=self.system_prompt,
             hooks=hooks,
+            callback_handler=None,  # Output is rendered by the caller (CLI or API)
+            tool_executor=BoundedConcurrentToolExecutor(),  # Tool calls from one turn run in parallel
+            retry_strategy=None,  # Throttling is retried by ResilientModel
+        )
+
+    def _model_for(self, tier: str) -> ResilientModel:
+        """Get the rate-limited, retrying Bedrock model for a tier, creating it on first use."""
+        if tier not in self._models:
+            self._models[tier] = ResilientModel(BedrockModel(
+                model_id=self.router.rules["tiers"][tier]["model_id"],
+                temperature=0.3,
+                region_name=self.region,
+                stream=True  # Enable streaming from the model
+            ))
+        return self._models[tier]
+
+    def _usage(self) -> tuple:
+        """Input and output tokens used by this agent so far."""
+        metrics = getattr(self.agent, "event_loop_metrics", None)
+        usage = getattr(metrics, "accumulated_usage", None) or {}
+        return usage.get("inputTokens", 0), usage.get("outputTokens", 0)
+
+    def _begin_turn(self, message: str) -> dict:
+        """Route a turn to a model tier before it runs."""
+        tier, breakdown = self.router.route(message)
+        self.agent.model = self._model_for(tier)
+        self.last_tier = tier
+        return {"tier": tier, "score": breakdown["score"], "start": time.perf_counter(), "usage": self._usage()}
+
+    def _end_turn(self, turn: dict):
+        """Record latency, tokens and cost of a routed turn."""
+        input_tokens, output_tokens = self._usage()
+        record_turn(
+            turn["tier"],
+            time.perf_counter() - turn["start"],
+            input_tokens - turn["usage"][0],
+            output_tokens - turn["usage"][1],
         )
 
-    def chat(self, message: str) -> str:
+    def chat(self, message: str, context: dict = None) -> str:
         """Send a message to the agent and get response.
 
+        Context-free questions are first looked up in the user's semantic
+        cache; a hit is answered without calling the model.
+
         Args:
             message: User's message
+            context: Optional request context; messages with context are never cached
 
         Returns:
             Agent's response
         """
-        return self.agent(message)
+        cached = self._cached_answer(message, context)
+        if cached is not None:
+            return cached
+
+        turn = self._begin_turn(message)
+        try:
+            response = self.agent(message)
+        finally:
+            self._end_turn(turn)
+        self._store_answer(message, response, context)
+        return response
+
+    def _cached_answer(self, message: str, context: dict = None):
+        """Answer a paraphrase of an earlier context-free question from the semantic cache, or return None."""
+        cached = self.semantic_cache.lookup(self.user_id, message, context) if self.semantic_cache else None
+        self.last_cache_hit = cached is not None
+        if cached is not None:
+            # Keep the conversation coherent for follow-up questions
+            self.agent.messages.extend([
+                {"role": "user", "content": [{"text": message}]},
+                {"role": "assistant", "content": [{"text": cached}]},
+            ])
+            self.tool_timing.last_turn = []
+        return cached
+
+    def _store_answer(self, message: str, response, context: dict = None):
+        """Cache a completed answer for paraphrases of the same question."""
+        if self.semantic_cache and response is not None and response.stop_reason == "end_turn":
+            self.semantic_cache.store(self.user_id, message, str(response).strip(), context)
 
     def seed_product_memory(self, product_data: dict) -> bool:
         """Seed memory with initial product information.
@@ -108,6 +194,31 @@ Always use the appropriate tools to provide data-driven recommendations and acti
             product_data=product_data
         )
 
+    def prefetch_memory(self, product_data: dict) -> int:
+        """Warm this user's memory pool so the first turn finds its context locally.
+
+        Args:
+            product_data: Dictionary containing product information
+
+        Returns:
+            Number of memories prefetched, or -1 if memory is unavailable
+        """
+        if not self.memory_hooks:
+            return -1
+
+        return self.memory_hooks.prefetch_context(product_data)
+
+    def prefetch_mode(self) -> str:
+        """How a memory prefetch started now would serve this user's first turn.
+
+        Returns:
+            "pool", "pool+live" or "skipped", as from ProductHuntMemoryHooks.prefetch_mode
+        """
+        if not self.memory_hooks:
+            return "skipped"
+
+        return self.memory_hooks.prefetch_mode()
+
     def get_memory_summary(self) -> dict:
         """Get a summary of user's stored memories.
         
@@ -122,6 +233,19 @@ Always use the appropriate tools to provide data-driven recommendations and acti
             actor_id=self.user_id
         )
 
+    def bind_session(self, user_id: str = None, session_id: str = None):
+        """Assign user and session IDs to a pre-warmed agent before its first message.
+
+        Args:
+            user_id: User identifier. If None, keeps the generated ID.
+            session_id: Session identifier. If None, keeps the generated ID.
+        """
+        self.user_id = user_id or self.user_id
+        self.session_id = session_id or self.session_id
+        if self.memory_hooks:
+            self.memory_hooks.actor_id = self.user_id
+            self.memory_hooks.session_id = self.session_id
+
     def get_user_id(self) -> str:
         """Get the current user ID.
         
@@ -138,6 +262,14 @@ Always use the appropriate tools to provide data-driven recommendations and acti
         """
         return self.session_id
 
+    def get_tool_timings(self) -> list:
+        """Get wall times of the tool calls made during the last message.
+
+        Returns:
+            One entry per tool batch with wall_seconds and per-tool seconds
+        """
+        return self.tool_timing.last_turn
+
     def chat_stream(self, message: str):
         """Send a message to the agent and get streaming response.
 
@@ -153,7 +285,7 @@ Always use the appropriate tools to provide data-driven recommendations and acti
                 yield chunk
         except AttributeError:
             # Fallback if streaming not available - simulate streaming
-            response = self.agent(message)
+            response = self.chat(message)
 
             # Extract text content from AgentResult
             response_text = ""
@@ -173,6 +305,63 @@ Always use the appropriate tools to provide data-driven recommendations and acti
             for word in words:
                 yield word + " "
 
+    async def _stream_to_terminal(self, message: str) -> dict:
+        """Stream a single turn to the terminal as tokens arrive from the model.
+
+        Args:
+            message: User's message
+
+        Questions answered by the semantic cache are printed at once, as chat() returns them.
+
+        Returns:
+            Dictionary with time_to_first_token and total_time in seconds and the
+            model tier used ("cache" for a semantic cache hit)
+        """
+        start = time.perf_counter()
+        first_token_at = None
+        announced_tools = set()
+        at_line_start = False
+
+        cached = self._cached_answer(message)
+        if cached is not None:
+            print(f"🤖 Assistant: {cached}\n")
+            elapsed = time.perf_counter() - start
+            return {"time_to_first_token": elapsed, "total_time": elapsed, "tier": "cache"}
+
+        turn = self._begin_turn(message)
+        result = None
+        print("🤖 Assistant: ", end="", flush=True)
+        try:
+            async for event in self.agent.stream_async(message):
+                result = event.get("result", result)
+                text = event.get("data")
+                if text:
+                    if first_token_at is None:
+                        first_token_at = time.perf_counter()
+                    print(text, end="", flush=True)
+                    at_line_start = text.endswith("\n")
+
+                # Announce each tool call once, as soon as the model names it
+                tool_use = event.get("current_tool_use") or {}
+                tool_id = tool_use.get("toolUseId")
+                if tool_id and tool_use.get("name") and tool_id not in announced_tools:
+                    announced_tools.add(tool_id)
+                    if not at_line_start:
+                        print()
+                    print(f"   🔧 Running {tool_use['name']}...", flush=True)
+                    at_line_start = True
+        finally:
+            # Record the turn even when the stream fails or is interrupted
+            print("\n" if not at_line_start else "")
+            self._end_turn(turn)
+        self._store_answer(message, result)
+
+        return {
+            "time_to_first_token": first_token_at - start if first_token_at is not None else None,
+            "total_time": time.perf_counter() - start,
+            "tier": turn["tier"],
+        }
+
     def start_interactive_chat(self):
         """Start an interactive chat session with the Product Hunt assistant."""
         print("🚀 Product Hunt Launch Assistant ready! Type 'quit' to exit.\n")
@@ -189,8 +378,12 @@ Always use the appropriate tools to provide data-driven recommendations and acti
                     print("🎯 Good luck with your Product Hunt launch! Remember: build community, tell your story, and engage authentically!")
                     break
 
-                response = self.chat(user_input)
-                print(f"🤖 Assistant: {response}\n")
+                stats = asyncio.run(self._stream_to_terminal(user_input))
+                ttft = f"{stats['time_to_first_token']:.2f}s" if stats['time_to_first_token'] is not None else "n/a"
+                tools = ", ".join(
+                    f"{t['tool']} {t['seconds']:.2f}s" for batch in self.get_tool_timings() for t in batch["tools"]
+                )
+                print(f"⏱️  First token: {ttft} | Total: {stats['total_time']:.2f}s | Model: {stats['tier']}" + (f" | Tools: {tools}" if tools else "") + "\n")
 
             except KeyboardInterrupt:
                 print("\n🚀 See you on Product Hunt!")
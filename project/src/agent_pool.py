@@ -0,0 +1,137 @@
+"""Pool of pre-warmed agents so new sessions do not wait for agent construction."""
+
+import logging
+import math
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from typing import Any, Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+AGENT_POOL_MIN = int(os.getenv("AGENT_POOL_MIN", "1"))
+AGENT_POOL_MAX = int(os.getenv("AGENT_POOL_MAX", "8"))
+# Longest a new session waits for the first agent build to learn whether memory is enabled
+AGENT_POOL_READY_TIMEOUT = float(os.getenv("AGENT_POOL_READY_TIMEOUT", "10"))
+
+# Session creations counted toward the arrival rate
+RATE_WINDOW_SECONDS = 60
+# Extra warm agents kept above the expected arrivals during one build
+HEADROOM = 1.5
+
+
+def new_session_ids() -> Dict[str, str]:
+    """Generate user and session IDs in the format ProductHuntLaunchAgent uses."""
+    return {"user_id": f"user_{uuid.uuid4().hex[:8]}", "session_id": str(uuid.uuid4())}
+
+
+class AgentPool:
+    """Keep unbound agents warm and bind one to a session on first use.
+
+    The target size follows Little's law: session arrivals per second over
+    the last minute times the average build time, with headroom, clamped to
+    [min_size, max_size]. A background thread refills the pool to target.
+    """
+
+    def __init__(self, factory: Callable[[], Any], min_size: int = AGENT_POOL_MIN, max_size: int = AGENT_POOL_MAX):
+        self.factory = factory
+        self.min_size = min_size
+        self.max_size = max(max_size, min_size)
+        self.memory_enabled = None
+        self._ready = threading.Event()  # Set once the first build has finished or failed
+        self._idle = deque()
+        self._arrivals = deque()
+        self._build_seconds = None
+        self._warm_hits = 0
+        self._cold_builds = 0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = threading.Thread(target=self._refill_loop, name="agent-pool", daemon=True)
+        self._wake.set()  # Warm min_size agents right away
+        self._thread.start()
+
+    def _build(self) -> Any:
+        """Construct an agent and update the build time estimate."""
+        start = time.perf_counter()
+        try:
+            agent = self.factory()
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                # Exponential moving average of build time
+                self._build_seconds = elapsed if self._build_seconds is None else 0.8 * self._build_seconds + 0.2 * elapsed
+                self.memory_enabled = agent.memory_hooks is not None
+        finally:
+            self._ready.set()
+        return agent
+
+    def memory_status(self, timeout: float = AGENT_POOL_READY_TIMEOUT) -> bool:
+        """Whether built agents have memory, waiting up to timeout for the first build to finish."""
+        self._ready.wait(timeout)
+        return bool(self.memory_enabled)
+
+    def _arrival_rate(self, now: float) -> float:
+        while self._arrivals and now - self._arrivals[0] > RATE_WINDOW_SECONDS:
+            self._arrivals.popleft()
+        return len(self._arrivals) / RATE_WINDOW_SECONDS
+
+    def target_size(self) -> int:
+        """Number of warm agents to keep for the recent session creation rate."""
+        with self._lock:
+            rate = self._arrival_rate(time.monotonic())
+            build_seconds = self._build_seconds or 1.0
+        needed = math.ceil(rate * build_seconds * HEADROOM)
+        return min(max(needed, self.min_size), self.max_size)
+
+    def _refill_loop(self):
+        """Keep the idle pool at its target size, re-checking at least once per rate window."""
+        while True:
+            self._wake.wait(timeout=RATE_WINDOW_SECONDS)
+            self._wake.clear()
+            while len(self._idle) < self.target_size():
+                try:
+                    agent = self._build()
+                except Exception as e:
+                    logger.error(f"Failed to pre-warm agent: {e}")
+                    break
+                self._idle.append(agent)
+                logger.info(f"Agent pool warmed: {len(self._idle)}/{self.target_size()}")
+            # Shrink back when session creation slows down
+            while len(self._idle) > self.target_size():
+                self._idle.pop()
+
+    def create_session(self) -> Dict[str, str]:
+        """Return new session IDs immediately and count the arrival for pool sizing."""
+        with self._lock:
+            self._arrivals.append(time.monotonic())
+        self._wake.set()
+        return new_session_ids()
+
+    def acquire(self, user_id: str = None, session_id: str = None) -> Any:
+        """Bind a warm agent to the given IDs, building one synchronously if the pool is empty."""
+        try:
+            agent = self._idle.popleft()
+            with self._lock:
+                self._warm_hits += 1
+        except IndexError:
+            agent = self._build()
+            with self._lock:
+                self._cold_builds += 1
+        self._wake.set()
+        agent.bind_session(user_id=user_id, session_id=session_id)
+        return agent
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool size, target, warm hit counts and build time."""
+        target = self.target_size()
+        with self._lock:
+            return {
+                "idle": len(self._idle),
+                "target": target,
+                "sessions_per_minute": round(self._arrival_rate(time.monotonic()) * 60, 2),
+                "warm_hits": self._warm_hits,
+                "cold_builds": self._cold_builds,
+                "avg_build_seconds": round(self._build_seconds, 3) if self._build_seconds is not None else None,
+            }
+
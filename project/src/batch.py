@@ -0,0 +1,211 @@
+"""Batch processing of many product launches with bounded concurrency."""
+
+import csv
+import json
+import logging
+import sys
+import time
+from datetime import date
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, TextIO
+
+from tools.product_tools import generate_launch_timeline, generate_marketing_assets, research_top_launches
+
+logger = logging.getLogger(__name__)
+
+BATCH_STEPS = ("analyze", "timeline", "marketing", "research")
+
+# Bump when the analysis prompt or system prompt changes meaningfully, to invalidate cached analyses
+ANALYSIS_PROMPT_VERSION = "1"
+
+# ProductRequest fields that determine an analysis (user and session IDs do not)
+ANALYSIS_FIELDS = (
+    "product_name", "product_description", "product_type", "target_audience",
+    "launch_date", "additional_notes", "github_repo",
+)
+
+
+def load_products(path: str) -> List[Dict[str, Any]]:
+    """Load product definitions from a CSV or JSONL file.
+
+    Args:
+        path: Path to a .csv file with a header row or a .jsonl file with one product per line
+
+    Returns:
+        One {"row", "product"} dictionary per data row, where row is the 1-based
+        line number in the file; lines that are not valid JSON get {"row", "error"}
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.lower().endswith(".csv"):
+            # Drop empty cells so model defaults apply; data starts on line 2, after the header
+            return [
+                {"row": row, "product": {k: v for k, v in raw.items() if v not in (None, "")}}
+                for row, raw in enumerate(csv.DictReader(f), start=2)
+            ]
+        rows = []
+        for row, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                rows.append({"row": row, "product": json.loads(line)})
+            except json.JSONDecodeError as e:
+                rows.append({"row": row, "error": f"Invalid JSON: {e}"})
+        return rows
+
+
+def build_analysis_prompt(product: Dict[str, Any]) -> str:
+    """Build the comprehensive analysis prompt used by /api/analyze-product."""
+    return f"""I need help launching my product on Product Hunt. Here are the details:
+
+Product Name: {product['product_name']}
+Product Type: {product['product_type']}
+Description: {product['product_description']}
+Target Audience: {product.get('target_audience') or 'Not specified'}
+Planned Launch Date: {product.get('launch_date') or 'Not specified'}
+Additional Notes: {product.get('additional_notes') or 'None'}
+GitHub Repository: {product.get('github_repo') or 'Not provided'}
+
+Please provide a comprehensive analysis and recommendations including:
+1. Launch timeline and key milestones
+2. Marketing strategy and messaging
+3. Competitive landscape insights
+4. Hunter recommendations
+5. Strategic advice for success
+
+Focus on actionable, specific recommendations tailored to my product."""
+
+
+def analysis_cache_payload(product: Dict[str, Any], model_id: str, user_id: str) -> Dict[str, Any]:
+    """Inputs that determine an analysis, for fingerprinting cached responses.
+
+    Analyses are written with the user's memory injected into the prompt, so
+    they are cached per user. Relative launch dates such as "next Tuesday"
+    resolve differently each day, so today's date is included when a launch
+    date is given.
+    """
+    return {
+        "user_id": user_id,
+        "product": {field: product.get(field) or "" for field in ANALYSIS_FIELDS},
+        "prompt_version": ANALYSIS_PROMPT_VERSION,
+        "model_id": model_id,
+        "today": date.today().isoformat() if product.get("launch_date") else None,
+    }
+
+
+def process_product(product: Dict[str, Any], steps: Iterable[str], agent_factory: Callable = None) -> Dict[str, Any]:
+    """Run the requested launch steps for a single product.
+
+    Args:
+        product: Validated product dictionary with ProductRequest fields
+        steps: Steps to run, any of BATCH_STEPS
+        agent_factory: Callable returning a ProductHuntLaunchAgent, required for the analyze step
+
+    Returns:
+        Dictionary with per-step results and errors
+    """
+    results = {}
+    errors = {}
+
+    for step in steps:
+        try:
+            if step == "analyze":
+                agent = agent_factory(user_id=product.get("user_id"), session_id=product.get("session_id"))
+                agent.seed_product_memory(product)
+                results[step] = str(agent.chat(build_analysis_prompt(product)))
+            elif step == "timeline":
+                results[step] = generate_launch_timeline(
+                    product_name=product["product_name"],
+                    product_type=product["product_type"],
+                    launch_date=product.get("launch_date") or "next Tuesday",
+                    additional_notes=f"Description: {product['product_description']}. Target: {product.get('target_audience')}. {product.get('additional_notes')}"
+                )
+            elif step == "marketing":
+                results[step] = generate_marketing_assets(
+                    product_name=product["product_name"],
+                    elevator_pitch=product["product_description"],
+                    target_audience=product.get("target_audience") or "entrepreneurs and startups",
+                    tone="professional",
+                    product_type=product["product_type"]
+                )
+            elif step == "research":
+                results[step] = research_top_launches(
+                    product_category=product["product_type"],
+                    target_audience=product.get("target_audience") or "general",
+                    budget_range="medium"
+                )
+
+            if isinstance(results[step], dict) and not results[step].get("success", True):
+                errors[step] = results[step].get("error")
+        except Exception as e:
+            logger.error(f"Batch step '{step}' failed for {product.get('product_name')}: {e}")
+            errors[step] = str(e)
+
+    return {"results": results, "errors": errors}
+
+
+def run_batch(
+    products: List[Dict[str, Any]],
+    steps: Iterable[str] = BATCH_STEPS,
+    concurrency: int = 4,
+    agent_factory: Callable = None,
+    output: TextIO = sys.stdout,
+    rows: Optional[Sequence[int]] = None,
+    invalid: Optional[List[Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
+    """Process products concurrently and stream one JSON line per product as it finishes.
+
+    Args:
+        products: Validated product dictionaries
+        steps: Steps to run for each product
+        concurrency: Maximum number of products processed at once
+        agent_factory: Callable returning a ProductHuntLaunchAgent, required for the analyze step
+        output: Writable stream receiving JSONL results
+        rows: Source row number of each product, defaults to its 1-based position
+        invalid: Rows rejected before processing, as {"row", "product_name", "errors"};
+            they are written and counted as failures
+
+    Returns:
+        Aggregate statistics for the batch
+    """
+    steps = list(steps)
+    rows = list(rows) if rows is not None else list(range(1, len(products) + 1))
+    invalid = invalid or []
+    start = time.perf_counter()
+    failures = []
+
+    def _write(record: Dict[str, Any]):
+        if not record["success"]:
+            failures.append({"row": record["row"], "product_name": record["product_name"], "errors": record["errors"]})
+        output.write(json.dumps(record, default=str) + "\n")
+        output.flush()
+
+    for rejected in invalid:
+        _write({**rejected, "success": False, "elapsed_seconds": 0.0, "results": {}})
+
+    def _run(row: int, product: Dict[str, Any]) -> Dict[str, Any]:
+        item_start = time.perf_counter()
+        outcome = process_product(product, steps, agent_factory)
+        return {
+            "row": row,
+            "product_name": product["product_name"],
+            "success": not outcome["errors"],
+            "elapsed_seconds": round(time.perf_counter() - item_start, 3),
+            **outcome,
+        }
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        futures = [executor.submit(_run, row, p) for row, p in zip(rows, products)]
+        for future in as_completed(futures):
+            _write(future.result())
+
+    elapsed = time.perf_counter() - start
+    total = len(products) + len(invalid)
+    return {
+        "total": total,
+        "succeeded": total - len(failures),
+        "failed": len(failures),
+        "invalid": len(invalid),
+        "elapsed_seconds": round(elapsed, 3),
+        "products_per_second": round(len(products) / elapsed, 3) if elapsed > 0 else None,
+        "failures": sorted(failures, key=lambda failure: failure["row"]),
+    }
@@ -0,0 +1,113 @@
+"""Rank, deduplicate and pack retrieved memories into a token budget."""
+
+import logging
+import os
+import threading
+from typing import Any, Dict, List
+
+import numpy as np
+
+from .semantic_cache import embed
+from .tool_results import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+# Estimated tokens of memory context injected per turn
+MEMORY_CONTEXT_TOKEN_BUDGET = int(os.getenv("MEMORY_CONTEXT_TOKEN_BUDGET", "400"))
+# Memories retrieved per namespace before ranking
+MEMORY_CONTEXT_TOP_K = int(os.getenv("MEMORY_CONTEXT_TOP_K", "5"))
+# MMR trade-off: 1.0 ranks by relevance only, lower values favour diversity
+MEMORY_CONTEXT_MMR_LAMBDA = float(os.getenv("MEMORY_CONTEXT_MMR_LAMBDA", "0.7"))
+# Memories at least this similar to a better one are dropped as duplicates
+MEMORY_CONTEXT_DEDUPE_THRESHOLD = float(os.getenv("MEMORY_CONTEXT_DEDUPE_THRESHOLD", "0.9"))
+
+_stats_lock = threading.Lock()
+_assembly_totals = {
+    "turns": 0,
+    "candidates": 0,
+    "duplicates": 0,
+    "selected": 0,
+    "candidate_tokens": 0,
+    "injected_tokens": 0,
+}
+
+
+def assemble_context(
+    query: str,
+    candidates: List[Dict[str, Any]],
+    token_budget: int = MEMORY_CONTEXT_TOKEN_BUDGET,
+    mmr_lambda: float = MEMORY_CONTEXT_MMR_LAMBDA,
+    dedupe_threshold: float = MEMORY_CONTEXT_DEDUPE_THRESHOLD,
+) -> List[Dict[str, Any]]:
+    """Choose the memories to inject for a query across all namespaces.
+
+    Candidates are scored by their retrieval score, or by similarity to the
+    query when the service returned none. Near-duplicates of a higher scored
+    memory are dropped, then maximal marginal relevance picks memories one at
+    a time, skipping any that no longer fit the token budget.
+
+    Args:
+        query: User's message the context is for
+        candidates: Memories as {"type", "text", "score"} dictionaries; score may be None
+        token_budget: Maximum estimated tokens of selected text
+        mmr_lambda: Weight of relevance against similarity to already selected memories
+        dedupe_threshold: Cosine similarity at which a memory counts as a duplicate
+
+    Returns:
+        Selected candidates in selection order, each with a "tokens" estimate
+    """
+    candidates = [c for c in candidates if c.get("text")]
+    if not candidates:
+        return []
+
+    vectors = np.stack([embed(c["text"]) for c in candidates])
+    query_similarity = vectors @ embed(query)
+    relevance = np.array([
+        c["score"] if c.get("score") is not None else float(query_similarity[i]) for i, c in enumerate(candidates)
+    ])
+    similarity = vectors @ vectors.T
+    tokens = [estimate_tokens(c["text"]) for c in candidates]
+
+    # Most relevant first, so each duplicate group keeps its best scored member
+    kept = []
+    for i in np.argsort(-relevance, kind="stable"):
+        if all(similarity[i, j] < dedupe_threshold for j in kept):
+            kept.append(int(i))
+
+    selected: List[int] = []
+    remaining = list(kept)
+    used = 0
+    while remaining:
+        def mmr(i: int) -> float:
+            redundancy = max((similarity[i, j] for j in selected), default=0.0)
+            return mmr_lambda * relevance[i] - (1 - mmr_lambda) * redundancy
+
+        best = max(remaining, key=mmr)
+        remaining.remove(best)
+        if used + tokens[best] <= token_budget:
+            selected.append(best)
+            used += tokens[best]
+
+    _record(len(candidates), len(candidates) - len(kept), len(selected), sum(tokens), used)
+    return [{**candidates[i], "tokens": tokens[i]} for i in selected]
+
+
+def _record(candidates: int, duplicates: int, selected: int, candidate_tokens: int, injected_tokens: int):
+    with _stats_lock:
+        _assembly_totals["turns"] += 1
+        _assembly_totals["candidates"] += candidates
+        _assembly_totals["duplicates"] += duplicates
+        _assembly_totals["selected"] += selected
+        _assembly_totals["candidate_tokens"] += candidate_tokens
+        _assembly_totals["injected_tokens"] += injected_tokens
+
+
+def get_context_assembly_stats() -> Dict[str, Any]:
+    """Candidates, duplicates and tokens retrieved versus injected."""
+    with _stats_lock:
+        totals = dict(_assembly_totals)
+    totals["token_budget"] = MEMORY_CONTEXT_TOKEN_BUDGET
+    totals["token_reduction"] = (
+        round(1 - totals["injected_tokens"] / totals["candidate_tokens"], 3) if totals["candidate_tokens"] else 0.0
+    )
+    return totals
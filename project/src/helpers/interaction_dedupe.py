@@ -0,0 +1,139 @@
+"""Per-session SimHash index that suppresses near-duplicate interactions before they are saved to memory."""
+
+import hashlib
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict, deque
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MEMORY_DEDUPE = os.getenv("MEMORY_DEDUPE", "true").lower() == "true"
+# Fingerprints within this many differing bits (of 64) count as near-duplicates
+MEMORY_DEDUPE_MAX_DISTANCE = int(os.getenv("MEMORY_DEDUPE_MAX_DISTANCE", "6"))
+# Recent interactions remembered per session, and sessions kept (least recently used evicted)
+MEMORY_DEDUPE_WINDOW = int(os.getenv("MEMORY_DEDUPE_WINDOW", "50"))
+MEMORY_DEDUPE_MAX_SESSIONS = int(os.getenv("MEMORY_DEDUPE_MAX_SESSIONS", "1000"))
+
+_WORD = re.compile(r"[a-z0-9]+")
+_BITS = np.arange(64, dtype=np.uint64)
+
+# Shared index instance
+_interaction_index = None
+
+
+def simhash(text: str) -> int:
+    """64-bit SimHash over the words and word pairs of a text.
+
+    Each feature hashes to 64 bits that vote for or against every bit of the
+    fingerprint, so texts sharing most features differ in only a few bits.
+    """
+    words = _WORD.findall(text.lower().replace("'", "").replace("\u2019", ""))
+    features = words + [f"{first} {second}" for first, second in zip(words, words[1:])]
+    if not features:
+        return 0
+    hashes = np.array(
+        [int.from_bytes(hashlib.blake2b(f.encode(), digest_size=8).digest(), "little") for f in features],
+        dtype=np.uint64,
+    )
+    bits = (hashes[:, None] >> _BITS) & np.uint64(1)
+    votes = (2 * bits.astype(np.int64) - 1).sum(axis=0)
+    return int(sum(1 << i for i in np.flatnonzero(votes > 0)))
+
+
+def hamming(first: int, second: int) -> int:
+    """Number of differing bits between two fingerprints."""
+    return (first ^ second).bit_count()
+
+
+class InteractionIndex:
+    """Rolling (query, response) fingerprints per session.
+
+    A repeat of a recent interaction, with a near-identical query and
+    response, is a duplicate and is not saved. A repeated query that got a
+    different response is a repeat: only the response is worth saving.
+    """
+
+    def __init__(
+        self,
+        max_distance: int = MEMORY_DEDUPE_MAX_DISTANCE,
+        window: int = MEMORY_DEDUPE_WINDOW,
+        max_sessions: int = MEMORY_DEDUPE_MAX_SESSIONS,
+    ):
+        self.max_distance = max_distance
+        self.window = window
+        self.max_sessions = max_sessions
+        self.checked = 0
+        self.duplicates = 0
+        self.repeats = 0
+        self._sessions: "OrderedDict[str, deque]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def check(self, session: str, query: str, response: str) -> Optional[str]:
+        """Classify an interaction against the session's recent ones and remember it.
+
+        Args:
+            session: Session key, such as "actor_id:session_id"
+            query: User's message
+            response: Assistant's answer
+
+        Returns:
+            "duplicate" if query and response are near-duplicates of a recent
+            interaction, "repeat" if only the query is, otherwise None
+        """
+        query_hash, response_hash = simhash(query), simhash(response)
+        with self._lock:
+            recent = self._sessions.get(session)
+            if recent is None:
+                recent = self._sessions[session] = deque(maxlen=self.window)
+                if len(self._sessions) > self.max_sessions:
+                    self._sessions.popitem(last=False)
+            self._sessions.move_to_end(session)
+
+            verdict = None
+            for seen_query, seen_response in recent:
+                if hamming(query_hash, seen_query) <= self.max_distance:
+                    if hamming(response_hash, seen_response) <= self.max_distance:
+                        verdict = "duplicate"
+                        break
+                    verdict = "repeat"
+
+            self.checked += 1
+            if verdict == "duplicate":
+                self.duplicates += 1
+            else:
+                self.repeats += verdict == "repeat"
+                recent.append((query_hash, response_hash))
+            return verdict
+
+    def stats(self) -> Dict[str, Any]:
+        """Checked interactions and how many were suppressed or reduced to their response."""
+        with self._lock:
+            return {
+                "checked": self.checked,
+                "duplicates": self.duplicates,
+                "repeats": self.repeats,
+                "suppression_rate": round(self.duplicates / self.checked, 3) if self.checked else 0.0,
+                "sessions": len(self._sessions),
+                "max_distance": self.max_distance,
+            }
+
+
+def get_interaction_index() -> Optional[InteractionIndex]:
+    """Get the shared interaction index, or None when MEMORY_DEDUPE is disabled."""
+    global _interaction_index
+    if not MEMORY_DEDUPE:
+        return None
+    if _interaction_index is None:
+        _interaction_index = InteractionIndex()
+    return _interaction_index
+
+
+def get_interaction_dedupe_stats() -> Optional[Dict[str, Any]]:
+    """Stats of the shared interaction index, or None when MEMORY_DEDUPE is disabled."""
+    index = get_interaction_index()
+    return index.stats() if index else None
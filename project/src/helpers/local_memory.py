@@ -0,0 +1,265 @@
+"""Local SQLite and NumPy memory backend with the MemoryClient methods the memory hooks use."""
+
+import hashlib
+import logging
+import re
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from .semantic_cache import EMBEDDING_DIM, embed
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LOCAL_MEMORY_PATH = Path(__file__).resolve().parents[2] / "data" / "memory.db"
+
+# Same strategies and namespaces as the AgentCore memory resource
+LOCAL_STRATEGIES = [
+    {"type": "USER_PREFERENCE", "name": "ProductLaunchPreferences", "namespaces": ["producthunt/user/{actorId}/preferences"]},
+    {"type": "SEMANTIC", "name": "ProductLaunchSemantic", "namespaces": ["producthunt/user/{actorId}/semantic"]},
+]
+
+_SEGMENT = re.compile(r"(?<=[.!?])\s+|\n+")
+_PREFERENCE = re.compile(
+    r"\b(?:i|we)(?:'d| would)? (?:prefer|like|love|want|need|hate|avoid|don't like|do not like)\b"
+    r"|\bmy (?:favou?rite|preferred)\b|\b(?:always|never) (?:use|include|mention|write)\b",
+    re.IGNORECASE,
+)
+# "Label: value" facts in the messages written by product seeding
+_PRODUCT_MESSAGE = ("Product Information:", "Product Update:")
+_INJECTED_CONTEXT = "Product Launch Context:"
+_FACT = re.compile(r"^-?\s*([A-Z][A-Za-z ]{1,40}):\s*(.+)$")
+# Requests to the assistant say what the user wants now, not something to remember
+_REQUEST = re.compile(
+    r"^(?:please |can you |could you |would you )?(?:create|generate|give|write|make|tell|show|help|find|research|analy[sz]e|list|draft)\b",
+    re.IGNORECASE,
+)
+_WAS = re.compile(r"\s*\(was [^)]*\)$")
+_EMPTY_VALUES = {"not specified", "not provided", "none", ""}
+
+
+def extract_records(messages: List[Tuple[str, str]]) -> List[Tuple[str, str, str]]:
+    """Extract (strategy type, key, text) long-term records from an event's messages.
+
+    Seeded product facts ("- Launch Date: 2026-11-03") become semantic
+    records keyed by their label, so a later product update replaces them.
+    User statements of taste ("I prefer short tweets") become preferences,
+    and other user statements that are not questions or requests become
+    semantic records keyed by their text.
+    """
+    records = []
+    for text, role in messages:
+        if text.strip().startswith(_PRODUCT_MESSAGE):
+            for line in text.strip().splitlines()[1:]:
+                fact = _FACT.match(line.strip())
+                if not fact:
+                    continue
+                label, value = fact.group(1), _WAS.sub("", fact.group(2)).strip()
+                if value.lower() not in _EMPTY_VALUES:
+                    # A removed field yields a None text, which deletes the record
+                    text = None if value == "removed" else f"Product {label}: {value}"
+                    records.append(("SEMANTIC", f"product:{label.lower()}", text))
+            continue
+        if role != "USER":
+            continue
+        if text.startswith(_INJECTED_CONTEXT):
+            # Saved user turns include the memory context injected before them
+            text = text.split("\n\n", 1)[-1]
+        for segment in _SEGMENT.split(text):
+            segment = " ".join(segment.split())
+            if len(segment.split()) < 4 or segment.endswith("?") or _REQUEST.match(segment):
+                continue
+            strategy = "USER_PREFERENCE" if _PREFERENCE.search(segment) else "SEMANTIC"
+            records.append((strategy, segment.lower(), segment))
+    return records
+
+
+class _NamespaceIndex:
+    """Record embeddings of one namespace in a matrix that doubles as it fills."""
+
+    def __init__(self):
+        self.size = 0
+        self.vectors = np.zeros((0, EMBEDDING_DIM), dtype=np.float32)
+        self.records: List[Dict[str, Any]] = []
+        self.rows: Dict[str, int] = {}
+
+    def upsert(self, record: Dict[str, Any], vector: np.ndarray):
+        row = self.rows.get(record["memoryRecordId"])
+        if row is None:
+            if self.size == len(self.vectors):
+                grown = np.zeros((max(2 * self.size, 16), EMBEDDING_DIM), dtype=np.float32)
+                grown[:self.size] = self.vectors[:self.size]
+                self.vectors = grown
+            row = self.rows[record["memoryRecordId"]] = self.size
+            self.records.append(record)
+            self.size += 1
+        self.vectors[row] = vector
+        self.records[row] = record
+
+    def remove(self, record_id: str):
+        """Drop a record by moving the last row into its place."""
+        row = self.rows.pop(record_id, None)
+        if row is None:
+            return
+        last = self.size - 1
+        if row != last:
+            self.vectors[row] = self.vectors[last]
+            self.records[row] = self.records[last]
+            self.rows[self.records[row]["memoryRecordId"]] = row
+        self.records.pop()
+        self.size -= 1
+
+    def search(self, vector: np.ndarray, top_k: int) -> List[Dict[str, Any]]:
+        scores = self.vectors[:self.size] @ vector
+        top = np.argsort(-scores, kind="stable")[:top_k]
+        return [{**self.records[i], "score": round(float(scores[i]), 4)} for i in top]
+
+
+class LocalMemoryClient:
+    """Drop-in for the MemoryClient calls made by ProductHuntMemoryHooks and the memory helpers.
+
+    It also implements the two AgentCore data plane calls used by memory
+    export and import, with their camelCase parameters.
+
+    Events are appended to SQLite and long-term records are extracted from
+    them synchronously, so they are searchable as soon as create_event
+    returns. Each namespace keeps its record embeddings in memory for search;
+    the matrices are rebuilt from SQLite on startup.
+    """
+
+    def __init__(self, path: str = str(DEFAULT_LOCAL_MEMORY_PATH)):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS events (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                memory_id TEXT NOT NULL,
+                actor_id TEXT NOT NULL,
+                session_id TEXT NOT NULL,
+                role TEXT NOT NULL,
+                text TEXT NOT NULL,
+                created REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS records (
+                id TEXT PRIMARY KEY,
+                memory_id TEXT NOT NULL,
+                namespace TEXT NOT NULL,
+                text TEXT NOT NULL,
+                embedding BLOB NOT NULL,
+                created REAL NOT NULL
+            );
+            """
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+        self._indexes: Dict[Tuple[str, str], _NamespaceIndex] = {}
+        for record_id, memory_id, namespace, text, embedding, created in self._conn.execute(
+            "SELECT id, memory_id, namespace, text, embedding, created FROM records ORDER BY created"
+        ):
+            self._index(memory_id, namespace).upsert(
+                self._record(record_id, namespace, text, created), np.frombuffer(embedding, dtype=np.float32)
+            )
+
+    def _index(self, memory_id: str, namespace: str) -> _NamespaceIndex:
+        return self._indexes.setdefault((memory_id, namespace), _NamespaceIndex())
+
+    @staticmethod
+    def _record(record_id: str, namespace: str, text: str, created: float) -> Dict[str, Any]:
+        """A memory record in the shape AgentCore returns."""
+        return {"memoryRecordId": record_id, "content": {"text": text}, "namespaces": [namespace], "createdAt": created}
+
+    def get_memory_strategies(self, memory_id: str) -> List[Dict[str, Any]]:
+        """Return the preference and semantic strategies."""
+        return LOCAL_STRATEGIES
+
+    def create_event(self, memory_id: str, actor_id: str, session_id: str, messages: List[Tuple[str, str]], **kwargs) -> Dict[str, Any]:
+        """Store an event and the preference and semantic records extracted from it."""
+        now = time.time()
+        namespaces = {s["type"]: s["namespaces"][0].format(actorId=actor_id) for s in LOCAL_STRATEGIES}
+        records, removed = [], []
+        for strategy, key, text in extract_records(messages):
+            namespace = namespaces[strategy]
+            record_id = hashlib.sha1(f"{memory_id}|{namespace}|{key}".encode()).hexdigest()
+            if text is None:
+                removed.append((record_id, namespace))
+            else:
+                records.append((record_id, namespace, text, embed(text)))
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO events (memory_id, actor_id, session_id, role, text, created) VALUES (?, ?, ?, ?, ?, ?)",
+                [(memory_id, actor_id, session_id, role, text, now) for text, role in messages],
+            )
+            # Repeated statements and updated product facts replace the existing record
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO records (id, memory_id, namespace, text, embedding, created) VALUES (?, ?, ?, ?, ?, ?)",
+                [(record_id, memory_id, namespace, text, vector.tobytes(), now) for record_id, namespace, text, vector in records],
+            )
+            self._conn.executemany("DELETE FROM records WHERE id = ?", [(record_id,) for record_id, _ in removed])
+            self._conn.commit()
+            for record_id, namespace, text, vector in records:
+                self._index(memory_id, namespace).upsert(self._record(record_id, namespace, text, now), vector)
+            for record_id, namespace in removed:
+                self._index(memory_id, namespace).remove(record_id)
+        return {"eventId": str(uuid.uuid4()), "memoryId": memory_id, "actorId": actor_id, "sessionId": session_id}
+
+    def retrieve_memories(self, memory_id: str, namespace: str, query: str, top_k: int = 3) -> List[Dict[str, Any]]:
+        """Return up to top_k records in a namespace by cosine similarity to the query."""
+        vector = embed(query)
+        with self._lock:
+            index = self._indexes.get((memory_id, namespace))
+            return index.search(vector, top_k) if index else []
+
+    def list_memory_records(self, memoryId: str, namespace: str, maxResults: int = 20, nextToken: str = None) -> Dict[str, Any]:
+        """Page through records whose namespace starts with a prefix, like the AgentCore data plane API."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, namespace, text, created FROM records"
+                " WHERE memory_id = ? AND substr(namespace, 1, ?) = ? AND id > ? ORDER BY id LIMIT ?",
+                (memoryId, len(namespace), namespace, nextToken or "", maxResults),
+            ).fetchall()
+        page = {"memoryRecordSummaries": [self._record(*row) for row in rows]}
+        if len(rows) == maxResults:
+            page["nextToken"] = rows[-1][0]
+        return page
+
+    def batch_create_memory_records(self, memoryId: str, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Store records as given, like the AgentCore data plane API; the request identifier becomes the record ID."""
+        rows, succeeded, failed = [], [], []
+        for record in records:
+            text = record.get("content", {}).get("text", "").strip()
+            if not text or not record.get("namespaces"):
+                failed.append({"requestIdentifier": record["requestIdentifier"], "status": "FAILED",
+                               "errorCode": 400, "errorMessage": "Record needs text and a namespace"})
+                continue
+            timestamp = record.get("timestamp")
+            created = timestamp.timestamp() if hasattr(timestamp, "timestamp") else time.time()
+            rows.append((record["requestIdentifier"], record["namespaces"][0], text, embed(text), created))
+            succeeded.append({"memoryRecordId": record["requestIdentifier"],
+                              "requestIdentifier": record["requestIdentifier"], "status": "SUCCEEDED"})
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO records (id, memory_id, namespace, text, embedding, created) VALUES (?, ?, ?, ?, ?, ?)",
+                [(record_id, memoryId, namespace, text, vector.tobytes(), created) for record_id, namespace, text, vector, created in rows],
+            )
+            self._conn.commit()
+            for record_id, namespace, text, vector, created in rows:
+                self._index(memoryId, namespace).upsert(self._record(record_id, namespace, text, created), vector)
+        return {"successfulRecords": succeeded, "failedRecords": failed}
+
+    def delete_memory(self, memory_id: str):
+        """Delete all events and records of a memory."""
+        with self._lock:
+            self._conn.execute("DELETE FROM events WHERE memory_id = ?", (memory_id,))
+            self._conn.execute("DELETE FROM records WHERE memory_id = ?", (memory_id,))
+            self._conn.commit()
+            self._indexes = {key: index for key, index in self._indexes.items() if key[0] != memory_id}
@@ -2,8 +2,15 @@
 
 import logging
 import os
+import re
 import sys
+import threading
+import time
 import uuid
+import zlib
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError, wait
+from pathlib import Path
 from typing import Dict, Optional
 
 import boto3
@@ -18,6 +25,12 @@ from strands.hooks import (
     MessageAddedEvent,
 )
 
+from .context_assembly import MEMORY_CONTEXT_TOP_K, assemble_context
+from .interaction_dedupe import get_interaction_index
+from .local_memory import DEFAULT_LOCAL_MEMORY_PATH, LocalMemoryClient
+from .resilience import CircuitBreaker
+from .response_cache import ResponseCache, fingerprint
+from .semantic_cache import get_semantic_cache
 from .utils import get_ssm_parameter, put_ssm_parameter
 
 # Initialize logging
@@ -31,9 +44,344 @@ REGION = 'us-west-2'
 memory_client = MemoryClient(region_name=REGION)
 memory_name = "ProductHuntLaunchMemory"
 
+# "agentcore" uses the managed AgentCore Memory service; "local" keeps memory in SQLite
+# (LOCAL_MEMORY_PATH) with in-process vector search, for development and on-prem use
+MEMORY_BACKEND = os.getenv("MEMORY_BACKEND", "agentcore").lower()
+LOCAL_MEMORY_ID = "local"
+_local_memory_client = None
+
+# Memory summaries are cached per actor until that actor's memory is written
+MEMORY_SUMMARY_TTL = int(os.getenv("MEMORY_SUMMARY_TTL", "600"))
+MEMORY_SUMMARY_MAX_ACTORS = int(os.getenv("MEMORY_SUMMARY_MAX_ACTORS", "1000"))
+# Long-term memories are extracted asynchronously after a write, so summaries
+# fetched shortly after one are not cached
+MEMORY_SUMMARY_SETTLE_SECONDS = int(os.getenv("MEMORY_SUMMARY_SETTLE_SECONDS", "120"))
+
+# Memory retrieval gets this long per turn; results arriving later are dropped
+MEMORY_RETRIEVAL_BUDGET_MS = int(os.getenv("MEMORY_RETRIEVAL_BUDGET_MS", "800"))
+# Consecutive failed or over-budget retrievals that open the breaker, and how long it stays open
+MEMORY_BREAKER_FAILURES = int(os.getenv("MEMORY_BREAKER_FAILURES", "3"))
+MEMORY_BREAKER_COOLDOWN = float(os.getenv("MEMORY_BREAKER_COOLDOWN", "30"))
+
+_memory_breaker = None
+_retrieval_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="memory-retrieval")
+_retrieval_lock = threading.Lock()
+_retrieval_stats = {"retrievals": 0, "over_budget": 0, "errors": 0, "skipped": 0, "prefetches": 0, "prefetch_hits": 0,
+                    "prefetch_merged": 0, "prefetch_skipped": 0}
+_retrieval_latencies = deque(maxlen=1000)
+
+# Memories prefetched when the chat page loads serve the actor's first turn.
+# A pool built or kept across a recent write is merged with a live retrieval
+MEMORY_PREFETCH_TTL = int(os.getenv("MEMORY_PREFETCH_TTL", "300"))
+MEMORY_PREFETCH_MAX_ACTORS = int(os.getenv("MEMORY_PREFETCH_MAX_ACTORS", "1000"))
+MEMORY_PREFETCH_TIMEOUT_MS = int(os.getenv("MEMORY_PREFETCH_TIMEOUT_MS", "5000"))
+
+_prefetch_lock = threading.Lock()
+_prefetch_pools: "OrderedDict[tuple, Dict]" = OrderedDict()
+
+# Interaction writes run off the turn on a small pool. Writes slower than
+# MEMORY_WRITE_TIMEOUT_MS count as breaker failures, and writes are dropped
+# while the breaker is open or MEMORY_WRITE_QUEUE_MAX are already pending
+MEMORY_WRITE_TIMEOUT_MS = int(os.getenv("MEMORY_WRITE_TIMEOUT_MS", "3000"))
+MEMORY_WRITE_QUEUE_MAX = int(os.getenv("MEMORY_WRITE_QUEUE_MAX", "100"))
+
+_write_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="memory-write")
+_pending_writes = set()
+_write_stats = {"writes": 0, "slow": 0, "errors": 0, "dropped": 0}
+
+# Retrieval gating skips memory lookups for turns like "thanks" or "continue".
+# A stable fraction of actors is held out (always retrieves) so answer quality can be compared.
+MEMORY_GATING = os.getenv("MEMORY_GATING", "true").lower() == "true"
+MEMORY_GATING_HOLDOUT = float(os.getenv("MEMORY_GATING_HOLDOUT", "0.05"))
+MEMORY_GATE_MIN_SCORE = float(os.getenv("MEMORY_GATE_MIN_SCORE", "1.0"))
+
+_GATE_WORD = re.compile(r"[a-z0-9']+")
+_ACKNOWLEDGEMENTS = frozenset(
+    "thanks thank thx ty ok okay k cool great nice awesome perfect good sounds got it continue go on "
+    "yes yep yeah sure no nope hi hello hey bye lol more next please".split()
+)
+_GATE_STOPWORDS = frozenset(
+    "a an the to of in for and or is are be was do does did can could should would will what which "
+    "how why who this that these those with at by from about me you your tell give show".split()
+)
+# Words suggesting the answer depends on what is remembered about the user or their product
+_CONTEXT_WEIGHTS = {
+    "my": 2.0, "our": 2.0, "we": 1.5, "i": 0.5, "i'm": 1.0, "remember": 2.5, "prefer": 2.0,
+    "preference": 2.0, "previous": 1.5, "last": 1.0, "again": 1.0, "product": 1.5, "audience": 1.5,
+    "launch": 1.0, "date": 1.0, "timeline": 1.0, "tagline": 1.0, "marketing": 1.0, "competitor": 1.0,
+    "competitors": 1.0, "hunter": 1.0, "plan": 1.0, "strategy": 1.0,
+    # Requests to produce launch assets are written for the user's product, however short
+    "write": 0.75, "draft": 0.75, "create": 0.75, "generate": 0.75, "rewrite": 0.75, "improve": 0.5,
+    "tweet": 1.0, "tweets": 1.0, "thread": 1.0, "post": 1.0, "posts": 1.0, "email": 1.0, "emails": 1.0,
+    "taglines": 1.0, "description": 1.0, "copy": 1.0, "pitch": 1.0, "announcement": 1.0, "comment": 1.0,
+    "newsletter": 1.0, "checklist": 1.0, "hunters": 1.0,
+}
+
+_gate_lock = threading.Lock()
+_gate_stats: Dict[str, Dict[str, int]] = {}
+
+_summary_lock = threading.Lock()
+_summary_cache: "OrderedDict[str, Dict]" = OrderedDict()
+# Latest write per actor in write order; writes older than the settle window are pruned
+_last_write: "OrderedDict[str, float]" = OrderedDict()
+_summary_stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+# Last seeded product data per actor, so unchanged seeds are skipped even after a restart
+DEFAULT_SEED_INDEX_PATH = Path(__file__).resolve().parents[2] / "data" / "seed_index.db"
+SEED_INDEX_TTL = int(os.getenv("SEED_INDEX_TTL", str(30 * 24 * 3600)))
+SEED_INDEX_MAX_ACTORS = int(os.getenv("SEED_INDEX_MAX_ACTORS", "10000"))
+SEED_FIELDS = {
+    "product_name": "Name",
+    "product_type": "Type",
+    "product_description": "Description",
+    "target_audience": "Target Audience",
+    "launch_date": "Launch Date",
+    "additional_notes": "Additional Notes",
+    "github_repo": "GitHub Repository",
+}
+
+_seed_index = None
+_seed_lock = threading.Lock()
+# Seeds for one actor are serialized on one of a fixed set of locks, chosen by hashing the actor ID
+SEED_LOCK_STRIPES = 64
+_seed_lock_stripes = [threading.Lock() for _ in range(SEED_LOCK_STRIPES)]
+_seed_stats = {"full": 0, "deltas": 0, "skipped": 0}
+
+
+def get_memory_breaker() -> CircuitBreaker:
+    """Get the circuit breaker guarding AgentCore Memory reads."""
+    global _memory_breaker
+    if _memory_breaker is None:
+        _memory_breaker = CircuitBreaker("agentcore-memory", MEMORY_BREAKER_FAILURES, MEMORY_BREAKER_COOLDOWN)
+    return _memory_breaker
+
+
+def _count_retrieval(name: str):
+    with _retrieval_lock:
+        _retrieval_stats[name] += 1
+
+
+def _record_retrieval(seconds: float, over_budget: bool, failed: bool):
+    with _retrieval_lock:
+        _retrieval_stats["retrievals"] += 1
+        _retrieval_stats["over_budget"] += over_budget
+        _retrieval_stats["errors"] += failed
+        _retrieval_latencies.append(seconds)
+
+
+def get_memory_retrieval_stats() -> Dict:
+    """Retrieval, prefetch and write counts, latency percentiles and circuit breaker state."""
+    with _retrieval_lock:
+        latencies = sorted(_retrieval_latencies)
+        stats = {
+            **_retrieval_stats,
+            "budget_ms": MEMORY_RETRIEVAL_BUDGET_MS,
+            "latency_ms_p50": round(latencies[len(latencies) // 2] * 1000, 1) if latencies else None,
+            "latency_ms_p95": round(latencies[int(0.95 * (len(latencies) - 1))] * 1000, 1) if latencies else None,
+        }
+        stats["writes"] = {**_write_stats, "pending": len(_pending_writes), "timeout_ms": MEMORY_WRITE_TIMEOUT_MS}
+    with _prefetch_lock:
+        stats["prefetch_pools"] = len(_prefetch_pools)
+    return {**stats, "breaker": get_memory_breaker().stats()}
+
+
+def _write_event(client, breaker: CircuitBreaker, **event):
+    start = time.perf_counter()
+    try:
+        client.create_event(**event)
+    except Exception as e:
+        breaker.record_failure()
+        with _retrieval_lock:
+            _write_stats["errors"] += 1
+        logger.error(f"Failed to save launch interaction: {e}")
+        return
+    slow = time.perf_counter() - start > MEMORY_WRITE_TIMEOUT_MS / 1000
+    if slow:
+        breaker.record_failure()
+        logger.warning(f"Memory write exceeded {MEMORY_WRITE_TIMEOUT_MS}ms")
+    else:
+        breaker.record_success()
+    with _retrieval_lock:
+        _write_stats["writes"] += 1
+        _write_stats["slow"] += slow
+    logger.info("Saved product launch interaction to memory")
+
+
+def submit_memory_write(client, **event) -> bool:
+    """Queue an event write on the memory write pool without waiting for it.
+
+    Args:
+        client: Memory client to call create_event on
+        **event: Keyword arguments for create_event
+
+    Returns:
+        False if the write was dropped because the breaker is open or the queue is full
+    """
+    breaker = get_memory_breaker()
+    with _retrieval_lock:
+        if len(_pending_writes) >= MEMORY_WRITE_QUEUE_MAX or not breaker.allow():
+            _write_stats["dropped"] += 1
+            return False
+        future = _write_executor.submit(_write_event, client, breaker, **event)
+        _pending_writes.add(future)
+    future.add_done_callback(_finish_write)
+    return True
+
+
+def _finish_write(future: Future):
+    with _retrieval_lock:
+        _pending_writes.discard(future)
+
+
+def flush_memory_writes(timeout: Optional[float] = None) -> bool:
+    """Wait for queued memory writes; returns False if some are still pending after timeout."""
+    with _retrieval_lock:
+        pending = list(_pending_writes)
+    return not wait(pending, timeout=timeout).not_done
+
+
+def _prefetch_queries(product_data: Dict) -> list:
+    """Queries the first turns about a product are likely to need memories for."""
+    fields = _normalize_product_data(product_data)
+    queries = ["product launch context"]
+    if "product_name" in fields:
+        queries.append(f"{fields['product_name']} product launch")
+    if "product_type" in fields:
+        queries.append(f"{fields['product_type']} launch strategy")
+    if "launch_date" in fields:
+        queries.append(f"launch date timeline {fields['launch_date']}")
+    if "target_audience" in fields:
+        queries.append(f"target audience {fields['target_audience']}")
+    if "product_description" in fields:
+        queries.append(fields["product_description"][:200])
+    return queries
+
+
+def _recently_written(actor_id: str) -> bool:
+    """Whether the actor's memory was written within MEMORY_SUMMARY_SETTLE_SECONDS, so extraction may be pending."""
+    with _summary_lock:
+        last_write = _last_write.get(actor_id)
+    return last_write is not None and time.monotonic() - last_write <= MEMORY_SUMMARY_SETTLE_SECONDS
+
+
+def _prefetched_candidates(memory_id: str, actor_id: str, timeout: float) -> Optional[tuple]:
+    """Take an actor's prefetched memories, waiting up to timeout for a prefetch in flight.
+
+    A pool serves one turn: the question after it is answered from a live,
+    query-specific retrieval. Returns (candidates, settled), where settled is
+    False if the actor's memory was written within MEMORY_SUMMARY_SETTLE_SECONDS
+    of the pool being built or since, so memories may be missing from it.
+    Returns None when there is no fresh pool or the prefetch did not finish in time.
+    """
+    with _prefetch_lock:
+        pool = _prefetch_pools.pop((memory_id, actor_id), None)
+    if pool is None or time.monotonic() - pool["created"] > MEMORY_PREFETCH_TTL:
+        return None
+    try:
+        candidates = pool["future"].result(timeout=timeout)
+    except TimeoutError:
+        return None
+    if candidates is None:
+        return None
+    return candidates, pool["settled"]
+
+
+def _unsettle_prefetch_pools(actor_id: str):
+    with _prefetch_lock:
+        for key, pool in _prefetch_pools.items():
+            if key[1] == actor_id:
+                pool["settled"] = False
+
+
+def gating_group(actor_id: str) -> str:
+    """Stable A/B group for an actor: "holdout" always retrieves, "gated" uses the classifier."""
+    if not MEMORY_GATING:
+        return "holdout"
+    bucket = zlib.crc32(actor_id.encode()) % 10000
+    return "holdout" if bucket < MEMORY_GATING_HOLDOUT * 10000 else "gated"
+
+
+def needs_memory_context(message: str) -> Dict:
+    """Decide whether a user turn needs long-term memory context.
+
+    Acknowledgements and chit-chat ("thanks", "ok, continue") are skipped.
+    Otherwise the message scores keyword weights for personal and product
+    references plus a small amount per content word; messages at or above
+    MEMORY_GATE_MIN_SCORE, or longer ones that are not mostly stopwords,
+    retrieve.
+
+    Args:
+        message: User's message
+
+    Returns:
+        Dictionary with retrieve (bool), reason and score
+    """
+    words = _GATE_WORD.findall(message.lower())
+    if not words:
+        return {"retrieve": False, "reason": "empty", "score": 0.0}
+    if all(word in _ACKNOWLEDGEMENTS for word in words):
+        return {"retrieve": False, "reason": "acknowledgement", "score": 0.0}
+
+    content = [w for w in words if w not in _GATE_STOPWORDS and w not in _ACKNOWLEDGEMENTS]
+    score = round(sum(_CONTEXT_WEIGHTS.get(w, 0.0) for w in words) + 0.25 * len(content), 2)
+    stopword_ratio = 1 - len(content) / len(words)
+    if score >= MEMORY_GATE_MIN_SCORE:
+        return {"retrieve": True, "reason": "context_keywords", "score": score}
+    if len(words) >= 6 and stopword_ratio < 0.8:
+        return {"retrieve": True, "reason": "substantive", "score": score}
+    return {"retrieve": False, "reason": "low_signal", "score": score}
+
+
+def _record_gate(group: str, gate: Dict, context_items: int):
+    """Count a gating decision; holdout turns the classifier would skip show what gating would lose."""
+    with _gate_lock:
+        stats = _gate_stats.setdefault(
+            group, {"turns": 0, "skipped": 0, "would_skip": 0, "would_skip_with_context": 0, "context_items": 0}
+        )
+        stats["turns"] += 1
+        stats["context_items"] += context_items
+        if not gate["retrieve"]:
+            if group == "gated":
+                stats["skipped"] += 1
+            else:
+                stats["would_skip"] += 1
+                stats["would_skip_with_context"] += context_items > 0
+
+
+def get_memory_gating_stats() -> Dict:
+    """Per-group turns, skip rates and context found on turns the classifier would have skipped."""
+    with _gate_lock:
+        return {
+            group: {
+                **stats,
+                "skip_rate": round(stats["skipped"] / stats["turns"], 3) if stats["turns"] else 0.0,
+                "would_skip_rate": round(stats["would_skip"] / stats["turns"], 3) if stats["turns"] else 0.0,
+            }
+            for group, stats in _gate_stats.items()
+        }
+
+
+def get_memory_client():
+    """Get the client for the configured MEMORY_BACKEND."""
+    global _local_memory_client
+    if MEMORY_BACKEND != "local":
+        return memory_client
+    if _local_memory_client is None:
+        _local_memory_client = LocalMemoryClient(os.getenv("LOCAL_MEMORY_PATH", str(DEFAULT_LOCAL_MEMORY_PATH)))
+    return _local_memory_client
+
+
+def get_memory_data_client():
+    """Get the client for record-level calls (list and batch create) on the configured MEMORY_BACKEND."""
+    if MEMORY_BACKEND == "local":
+        return get_memory_client()
+    return memory_client.gmdp_client
+
 
 def create_or_get_memory_resource():
     """Create or retrieve existing AgentCore Memory resource for Product Hunt launches."""
+    if MEMORY_BACKEND == "local":
+        return LOCAL_MEMORY_ID
     try:
         memory_id = get_ssm_parameter("/app/producthunt/agentcore/memory_id")
         memory_client.gmcp_client.get_memory(memoryId=memory_id)
@@ -83,8 +431,10 @@ def create_or_get_memory_resource():
 def delete_memory(memory_hook):
     """Delete the memory resource and SSM parameter."""
     try:
+        get_memory_client().delete_memory(memory_id=memory_hook.memory_id)
+        if MEMORY_BACKEND == "local":
+            return
         ssm_client = boto3.client("ssm", region_name=REGION)
-        memory_client.delete_memory(memory_id=memory_hook.memory_id)
         ssm_client.delete_parameter(Name="/app/producthunt/agentcore/memory_id")
     except Exception:
         pass
@@ -100,56 +450,205 @@ class ProductHuntMemoryHooks(HookProvider):
         self.client = client
         self.actor_id = actor_id
         self.session_id = session_id
+        self.last_gate = None
+        # The user's message as typed, before memory context is injected into it
+        self.last_query = None
         self.namespaces = {
             i["type"]: i["namespaces"][0]
             for i in self.client.get_memory_strategies(self.memory_id)
         }
 
     def retrieve_product_context(self, event: MessageAddedEvent):
-        """Retrieve product and user context before processing launch query."""
+        """Retrieve product and user context before processing launch query.
+
+        Namespaces are queried in parallel within MEMORY_RETRIEVAL_BUDGET_MS;
+        late or failed results are dropped so a slow memory service cannot
+        stall the turn, and repeated failures open the memory circuit breaker.
+        Memories prefetched for the actor's first turn are used instead when
+        available, together with a live retrieval if the actor's memory was
+        written recently enough that the pool may miss memories.
+        The memories returned are ranked together and packed into
+        MEMORY_CONTEXT_TOKEN_BUDGET by assemble_context.
+        """
         messages = event.agent.messages
         if (
             messages[-1]["role"] == "user"
             and "toolResult" not in messages[-1]["content"][0]
         ):
             user_query = messages[-1]["content"][0]["text"]
+            self.last_query = user_query
 
-            try:
-                all_context = []
+            group = gating_group(self.actor_id)
+            gate = needs_memory_context(user_query)
+            self.last_gate = {**gate, "group": group}
+            if group == "gated" and not gate["retrieve"]:
+                _record_gate(group, gate, 0)
+                logger.info(f"Skipping memory retrieval ({gate['reason']})")
+                return
 
-                for context_type, namespace in self.namespaces.items():
-                    # Retrieve user context from each namespace
-                    memories = self.client.retrieve_memories(
-                        memory_id=self.memory_id,
-                        namespace=namespace.format(actorId=self.actor_id),
-                        query=user_query,
-                        top_k=3,
-                    )
-                    # Post-processing: Format memories into context strings
-                    for memory in memories:
-                        if isinstance(memory, dict):
-                            content = memory.get("content", {})
-                            if isinstance(content, dict):
-                                text = content.get("text", "").strip()
-                                if text:
-                                    all_context.append(
-                                        f"[{context_type.upper()}] {text}"
-                                    )
-
-                # Inject product context into the query
-                if all_context:
-                    context_text = "\n".join(all_context)
-                    original_text = messages[-1]["content"][0]["text"]
-                    messages[-1]["content"][0][
-                        "text"
-                    ] = f"Product Launch Context:\n{context_text}\n\n{original_text}"
-                    logger.info(f"Retrieved {len(all_context)} product context items")
-
-            except Exception as e:
-                logger.error(f"Failed to retrieve product context: {e}")
+            prefetched = _prefetched_candidates(self.memory_id, self.actor_id, MEMORY_RETRIEVAL_BUDGET_MS / 1000)
+            if prefetched is not None:
+                _count_retrieval("prefetch_hits")
+                candidates, settled = prefetched
+            else:
+                candidates, settled = [], False
+            if not settled:
+                breaker = get_memory_breaker()
+                if breaker.allow():
+                    # The pool goes in front of the live results; assemble_context ranks and dedupes both
+                    candidates = candidates + self._retrieve_candidates(user_query, breaker)
+                    if prefetched is not None:
+                        _count_retrieval("prefetch_merged")
+                elif prefetched is None:
+                    _count_retrieval("skipped")
+                    logger.info("Memory circuit open, answering without product context")
+                    return
+
+            # Rank across namespaces, drop near-duplicates and fit the token budget
+            all_context = [
+                f"[{item['type'].upper()}] {item['text']}" for item in assemble_context(user_query, candidates)
+            ]
+
+            _record_gate(group, gate, len(all_context))
+
+            # Inject product context into the query
+            if all_context:
+                context_text = "\n".join(all_context)
+                original_text = messages[-1]["content"][0]["text"]
+                messages[-1]["content"][0][
+                    "text"
+                ] = f"Product Launch Context:\n{context_text}\n\n{original_text}"
+                logger.info(f"Retrieved {len(all_context)} product context items")
+
+    def _retrieve_candidates(self, user_query: str, breaker: CircuitBreaker) -> list:
+        """Query every namespace in parallel within MEMORY_RETRIEVAL_BUDGET_MS."""
+        start = time.perf_counter()
+        futures = {
+            _retrieval_executor.submit(
+                self.client.retrieve_memories,
+                memory_id=self.memory_id,
+                namespace=namespace.format(actorId=self.actor_id),
+                query=user_query,
+                top_k=MEMORY_CONTEXT_TOP_K,
+            ): context_type
+            for context_type, namespace in self.namespaces.items()
+        }
+        done, late = wait(futures, timeout=MEMORY_RETRIEVAL_BUDGET_MS / 1000)
+        failed = [future for future in done if future.exception() is not None]
+        _record_retrieval(time.perf_counter() - start, over_budget=bool(late), failed=bool(failed))
+        if late or failed:
+            breaker.record_failure()
+            for future in failed:
+                logger.error(f"Failed to retrieve product context: {future.exception()}")
+            if late:
+                logger.warning(f"Memory retrieval exceeded {MEMORY_RETRIEVAL_BUDGET_MS}ms budget, skipped {len(late)} namespaces")
+        else:
+            breaker.record_success()
+
+        candidates = []
+        for future, context_type in futures.items():
+            if future not in done or future in failed:
+                continue
+            for memory in future.result():
+                if isinstance(memory, dict):
+                    content = memory.get("content", {})
+                    if isinstance(content, dict):
+                        text = content.get("text", "").strip()
+                        if text:
+                            candidates.append({"type": context_type, "text": text, "score": memory.get("score")})
+        return candidates
+
+    def prefetch_context(self, product_data: Dict) -> int:
+        """Warm the actor's memory pool for their first turn with queries built from their product details.
+
+        Each likely query is run against every namespace in parallel and the
+        distinct memories are pooled without scores, so assemble_context ranks
+        them against the real question when the turn arrives. A turn that
+        starts while the prefetch is in flight waits for it within the
+        retrieval budget instead of issuing its own queries. Within
+        MEMORY_SUMMARY_SETTLE_SECONDS of a write to the actor's memory the pool
+        may miss memories still being extracted, so that turn also runs a live
+        retrieval and ranks both together.
+
+        Args:
+            product_data: Product details, as sent to seed_product_memory
+
+        Returns:
+            Number of memories pooled, or -1 if the prefetch was skipped or failed
+        """
+        breaker = get_memory_breaker()
+        if not breaker.allow():
+            _count_retrieval("prefetch_skipped")
+            logger.info("Memory circuit open, skipping memory prefetch")
+            return -1
+
+        key = (self.memory_id, self.actor_id)
+        # Memories written moments ago (such as the seed) may still be missing from the pool
+        pool = {"created": time.monotonic(), "future": Future(), "settled": not _recently_written(self.actor_id)}
+        with _prefetch_lock:
+            _prefetch_pools[key] = pool
+            _prefetch_pools.move_to_end(key)
+            if len(_prefetch_pools) > MEMORY_PREFETCH_MAX_ACTORS:
+                _prefetch_pools.popitem(last=False)[1]["future"].set_result(None)
+
+        futures = {
+            _retrieval_executor.submit(
+                self.client.retrieve_memories,
+                memory_id=self.memory_id,
+                namespace=namespace.format(actorId=self.actor_id),
+                query=query,
+                top_k=MEMORY_CONTEXT_TOP_K,
+            ): context_type
+            for query in _prefetch_queries(product_data)
+            for context_type, namespace in self.namespaces.items()
+        }
+        done, late = wait(futures, timeout=MEMORY_PREFETCH_TIMEOUT_MS / 1000)
+        failed = [future for future in done if future.exception() is not None]
+        if late or failed:
+            # An incomplete pool could hide memories a normal retrieval would find
+            breaker.record_failure()
+            logger.warning(f"Memory prefetch incomplete: {len(failed)} failed, {len(late)} timed out")
+            with _prefetch_lock:
+                if _prefetch_pools.get(key) is pool:
+                    del _prefetch_pools[key]
+            if not pool["future"].done():
+                pool["future"].set_result(None)
+            return -1
+        breaker.record_success()
+
+        candidates, seen = [], set()
+        for future, context_type in futures.items():
+            for memory in future.result():
+                if isinstance(memory, dict):
+                    content = memory.get("content", {})
+                    text = content.get("text", "").strip() if isinstance(content, dict) else ""
+                    if text and (context_type, text) not in seen:
+                        seen.add((context_type, text))
+                        candidates.append({"type": context_type, "text": text, "score": None})
+        if not pool["future"].done():
+            pool["future"].set_result(candidates)
+        _count_retrieval("prefetches")
+        logger.info(f"Prefetched {len(candidates)} memories for {len(futures)} queries")
+        return len(candidates)
+
+    def prefetch_mode(self) -> str:
+        """How a prefetch started now would serve the first turn.
+
+        Returns:
+            "pool" if the pool alone answers it, "pool+live" if a recent write
+            means a live retrieval is merged in, or "skipped" if the memory
+            circuit is open
+        """
+        if get_memory_breaker().state == "open":
+            return "skipped"
+        return "pool+live" if _recently_written(self.actor_id) else "pool"
 
     def save_launch_interaction(self, event: AfterInvocationEvent):
-        """Save product launch interaction after agent response."""
+        """Save product launch interaction after agent response.
+
+        The write is queued with submit_memory_write, so a slow memory
+        service never delays the response.
+        """
         try:
             messages = event.agent.messages
             if len(messages) >= 2 and messages[-1]["role"] == "assistant":
@@ -169,17 +668,30 @@ class ProductHuntMemoryHooks(HookProvider):
                         break
 
                 if user_query and agent_response:
-                    # Save the launch interaction to memory
-                    self.client.create_event(
+                    messages = [(user_query, "USER"), (agent_response, "ASSISTANT")]
+                    index = get_interaction_index()
+                    if index:
+                        # Fingerprint the user's own words, not the memory context injected before them
+                        own_query = self.last_query if self.last_query and user_query.endswith(self.last_query) else user_query
+                        verdict = index.check(f"{self.actor_id}:{self.session_id}", own_query, agent_response)
+                        if verdict == "duplicate":
+                            logger.info("Skipped saving a near-duplicate launch interaction")
+                            return
+                        if verdict == "repeat":
+                            # The question is already in memory; only the new answer is worth extracting
+                            messages = [(agent_response, "ASSISTANT")]
+
+                    # Save the launch interaction to memory without holding up the turn
+                    if not submit_memory_write(
+                        self.client,
                         memory_id=self.memory_id,
                         actor_id=self.actor_id,
                         session_id=self.session_id,
-                        messages=[
-                            (user_query, "USER"),
-                            (agent_response, "ASSISTANT"),
-                        ],
-                    )
-                    logger.info("Saved product launch interaction to memory")
+                        messages=messages,
+                    ):
+                        logger.warning("Memory writes unavailable, launch interaction not saved")
+                        return
+                    invalidate_memory_summary(self.actor_id)
 
         except Exception as e:
             logger.error(f"Failed to save launch interaction: {e}")
@@ -205,7 +717,7 @@ def get_memory_hooks(actor_id: str = None, session_id: str = None):
     
     memory_hooks = ProductHuntMemoryHooks(
         memory_id=memory_id,
-        client=memory_client,
+        client=get_memory_client(),
         actor_id=actor_id,
         session_id=session_id,
     )
@@ -213,41 +725,170 @@ def get_memory_hooks(actor_id: str = None, session_id: str = None):
     return memory_hooks
 
 
+def _normalize_product_data(product_data: Dict) -> Dict[str, str]:
+    """Seeded fields with whitespace collapsed and empty values dropped."""
+    normalized = {}
+    for field in SEED_FIELDS:
+        value = " ".join(str(product_data.get(field) or "").split())
+        if value:
+            normalized[field] = value
+    return normalized
+
+
+def _product_context_messages(product_data: Dict) -> list:
+    """Conversation messages that seed the full product context."""
+    product_context = f"""
+    Product Information:
+    - Name: {product_data.get('product_name') or 'Not specified'}
+    - Type: {product_data.get('product_type') or 'SaaS'}
+    - Description: {product_data.get('product_description') or 'Not provided'}
+    - Target Audience: {product_data.get('target_audience') or 'Not specified'}
+    - Launch Date: {product_data.get('launch_date') or 'Not specified'}
+    - Additional Notes: {product_data.get('additional_notes') or 'None'}
+    - GitHub Repository: {product_data.get('github_repo') or 'Not provided'}
+    """
+    return [
+        (f"I'm launching a product: {product_data.get('product_name') or 'my product'}", "USER"),
+        (product_context, "ASSISTANT"),
+    ]
+
+
+def _product_update_messages(previous: Dict[str, str], current: Dict[str, str]) -> list:
+    """Conversation messages that record only the product fields that changed."""
+    changes = []
+    for field, label in SEED_FIELDS.items():
+        if previous.get(field) == current.get(field):
+            continue
+        if field in current:
+            changes.append(f"- {label}: {current[field]} (was {previous.get(field, 'not specified')})")
+        else:
+            changes.append(f"- {label}: removed (was {previous[field]})")
+    return [
+        (f"I've updated the details of {current.get('product_name', 'my product')}", "USER"),
+        ("Product Update:\n" + "\n".join(changes), "ASSISTANT"),
+    ]
+
+
+def get_seed_index() -> ResponseCache:
+    """Get the local index of the last product data seeded per actor."""
+    global _seed_index
+    if _seed_index is None:
+        _seed_index = ResponseCache(
+            os.getenv("SEED_INDEX_PATH", str(DEFAULT_SEED_INDEX_PATH)),
+            ttl_seconds=SEED_INDEX_TTL,
+            max_entries=SEED_INDEX_MAX_ACTORS,
+        )
+    return _seed_index
+
+
 def seed_product_memory(memory_id: str, actor_id: str, product_data: Dict):
-    """Seed memory with initial product information."""
+    """Seed memory with product information, skipping seeds that match the last one.
+
+    The normalized product data is hashed and compared with the actor's last
+    seed; a first seed or a new product writes the full context, otherwise
+    only the changed fields are written.
+    """
+    current = _normalize_product_data(product_data)
+    content_hash = fingerprint(current)
+    key = f"{memory_id}:{actor_id}"
     try:
-        # Create initial product context
-        product_context = f"""
-        Product Information:
-        - Name: {product_data.get('product_name', 'Not specified')}
-        - Type: {product_data.get('product_type', 'SaaS')}
-        - Description: {product_data.get('product_description', 'Not provided')}
-        - Target Audience: {product_data.get('target_audience', 'Not specified')}
-        - Launch Date: {product_data.get('launch_date', 'Not specified')}
-        - Additional Notes: {product_data.get('additional_notes', 'None')}
-        - GitHub Repository: {product_data.get('github_repo', 'Not provided')}
-        """
-        
-        # Save initial product context
-        memory_client.create_event(
-            memory_id=memory_id,
-            actor_id=actor_id,
-            session_id="initial_setup",
-            messages=[
-                (f"I'm launching a product: {product_data.get('product_name', 'my product')}", "USER"),
-                (product_context, "ASSISTANT"),
-            ],
-        )
-        logger.info("Seeded product memory with initial context")
+        # Concurrent seeds for one actor would otherwise both see the old hash
+        with _seed_lock_stripes[zlib.crc32(actor_id.encode()) % SEED_LOCK_STRIPES]:
+            last = get_seed_index().get(key)
+            previous = last["body"] if last else None
+            if previous and previous["hash"] == content_hash:
+                with _seed_lock:
+                    _seed_stats["skipped"] += 1
+                logger.info("Product memory already seeded with this data, skipping")
+                return True
+
+            # A first seed or a different product gets the full context, otherwise only the changes
+            full = previous is None or previous["fields"].get("product_name") != current.get("product_name")
+            get_memory_client().create_event(
+                memory_id=memory_id,
+                actor_id=actor_id,
+                session_id="initial_setup",
+                messages=_product_context_messages(product_data) if full else _product_update_messages(previous["fields"], current),
+            )
+            get_seed_index().put(key, {"hash": content_hash, "fields": current})
+        with _seed_lock:
+            _seed_stats["full" if full else "deltas"] += 1
+        invalidate_memory_summary(actor_id)
+        # Cached chat answers were given for the previous product details
+        semantic_cache = get_semantic_cache()
+        if semantic_cache:
+            semantic_cache.clear(actor_id)
+        logger.info("Seeded product memory with " + ("initial context" if full else "changed fields"))
         return True
-        
+
     except Exception as e:
         logger.error(f"Failed to seed product memory: {e}")
         return False
 
 
+def get_seed_stats() -> Dict:
+    """Counts of full seeds, delta seeds and skipped duplicate seeds."""
+    with _seed_lock:
+        return dict(_seed_stats)
+
+
+def invalidate_memory_summary(actor_id: str):
+    """Drop an actor's cached memory summary and mark their prefetched memories unsettled after a write."""
+    now = time.monotonic()
+    with _summary_lock:
+        _summary_cache.pop(actor_id, None)
+        _last_write[actor_id] = now
+        _last_write.move_to_end(actor_id)
+        # Settled writes no longer affect caching, so only the last settle window's writers are kept
+        while now - next(iter(_last_write.values())) > MEMORY_SUMMARY_SETTLE_SECONDS:
+            _last_write.popitem(last=False)
+        _summary_stats["invalidations"] += 1
+    _unsettle_prefetch_pools(actor_id)
+
+
+def get_memory_summary_cache_stats() -> Dict:
+    """Hit, miss and invalidation counts for cached memory summaries."""
+    with _summary_lock:
+        lookups = _summary_stats["hits"] + _summary_stats["misses"]
+        return {
+            **_summary_stats,
+            "hit_rate": round(_summary_stats["hits"] / lookups, 3) if lookups else 0.0,
+            "actors": len(_summary_cache),
+        }
+
+
 def get_user_memory_summary(memory_id: str, actor_id: str) -> Dict:
-    """Get a summary of user's stored memories."""
+    """Get a summary of user's stored memories, cached until the actor's memory changes."""
+    now = time.monotonic()
+    with _summary_lock:
+        cached = _summary_cache.get(actor_id)
+        if cached and cached["memory_id"] == memory_id and now - cached["created"] <= MEMORY_SUMMARY_TTL:
+            _summary_stats["hits"] += 1
+            return cached["summary"]
+        _summary_stats["misses"] += 1
+
+    summary = _fetch_user_memory_summary(memory_id, actor_id)
+    if summary is None:
+        return {"preferences": [], "semantic": [], "total_memories": 0}
+
+    with _summary_lock:
+        # Skip caching while a recent write may still be extracted, including one made during the fetch
+        last_write = _last_write.get(actor_id)
+        if last_write is None or now - last_write > MEMORY_SUMMARY_SETTLE_SECONDS:
+            _last_write.pop(actor_id, None)
+            _summary_cache[actor_id] = {"memory_id": memory_id, "created": now, "summary": summary}
+            _summary_cache.move_to_end(actor_id)
+            if len(_summary_cache) > MEMORY_SUMMARY_MAX_ACTORS:
+                _summary_cache.popitem(last=False)
+    return summary
+
+
+def _fetch_user_memory_summary(memory_id: str, actor_id: str) -> Optional[Dict]:
+    """Retrieve an actor's preference and semantic memories, or None on failure or an open breaker."""
+    breaker = get_memory_breaker()
+    if not breaker.allow():
+        _count_retrieval("skipped")
+        return None
     try:
         summary = {
             "preferences": [],
@@ -259,7 +900,7 @@ def get_user_memory_summary(memory_id: str, actor_id: str) -> Dict:
             "preferences": f"producthunt/user/{actor_id}/preferences",
             "semantic": f"producthunt/user/{actor_id}/semantic"
         }.items():
-            memories = memory_client.retrieve_memories(
+            memories = get_memory_client().retrieve_memories(
                 memory_id=memory_id,
                 namespace=namespace,
                 query="product launch context",
@@ -275,9 +916,11 @@ def get_user_memory_summary(memory_id: str, actor_id: str) -> Dict:
                             summary[context_type].append(text)
             
             summary["total_memories"] += len(memories)
-        
+
+        breaker.record_success()
         return summary
         
     except Exception as e:
+        breaker.record_failure()
         logger.error(f"Failed to get memory summary: {e}")
-        return {"preferences": [], "semantic": [], "total_memories": 0}
+        return None
@@ -0,0 +1,209 @@
+"""Streaming export and import of long-term memory records as gzip-compressed JSONL."""
+
+import gzip
+import json
+import logging
+import re
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Records per ListMemoryRecords page and per BatchCreateMemoryRecords call (the service maximum)
+EXPORT_PAGE_SIZE = 100
+IMPORT_BATCH_SIZE = 100
+IMPORT_CONCURRENCY = 4
+# Every actor's records live under this namespace prefix
+MEMORY_NAMESPACE_PREFIX = "producthunt/user/"
+
+_REQUEST_ID = re.compile(r"[^A-Za-z0-9_-]")
+
+
+def actor_namespaces(actor_ids: Iterable[str], strategies: List[Dict[str, Any]]) -> List[str]:
+    """Namespaces holding the records of each actor under the memory's strategies."""
+    return [
+        namespace.format(actorId=actor_id)
+        for actor_id in actor_ids
+        for strategy in strategies
+        for namespace in strategy["namespaces"]
+    ]
+
+
+def _timestamp(value: Any) -> str:
+    """ISO 8601 timestamp for a record time returned as a datetime, epoch seconds or string."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value, tz=timezone.utc).isoformat()
+    return str(value) if value else datetime.now(timezone.utc).isoformat()
+
+
+def iter_memory_records(client, memory_id: str, namespace: str, page_size: int = EXPORT_PAGE_SIZE) -> Iterator[Dict[str, Any]]:
+    """Yield every record whose namespace starts with the given prefix, one page at a time.
+
+    Args:
+        client: AgentCore data plane client or LocalMemoryClient
+        memory_id: Memory to read
+        namespace: Namespace prefix, such as one actor's namespace or MEMORY_NAMESPACE_PREFIX
+        page_size: Records requested per page
+
+    Yields:
+        Memory record summaries
+    """
+    next_token = None
+    while True:
+        request = {"memoryId": memory_id, "namespace": namespace, "maxResults": page_size}
+        if next_token:
+            request["nextToken"] = next_token
+        page = client.list_memory_records(**request)
+        yield from page.get("memoryRecordSummaries", [])
+        next_token = page.get("nextToken")
+        if not next_token:
+            return
+
+
+def export_memory_records(
+    client, memory_id: str, namespaces: Iterable[str], path: str, page_size: int = EXPORT_PAGE_SIZE
+) -> Dict[str, Any]:
+    """Stream records to a gzip-compressed JSONL file, one record per line.
+
+    Only one page of records is held in memory at a time. Namespaces are
+    prefixes, so overlapping ones export the same record twice.
+
+    Args:
+        client: AgentCore data plane client or LocalMemoryClient
+        memory_id: Memory to export
+        namespaces: Namespace prefixes to export
+        path: Output file, conventionally ending in .jsonl.gz
+        page_size: Records requested per page
+
+    Returns:
+        Record count, elapsed time and throughput
+    """
+    start = time.perf_counter()
+    records = 0
+    with gzip.open(path, "wt", encoding="utf-8") as output:
+        for namespace in namespaces:
+            for record in iter_memory_records(client, memory_id, namespace, page_size):
+                line = {
+                    "memoryRecordId": record.get("memoryRecordId"),
+                    "namespaces": record.get("namespaces", []),
+                    "content": {"text": record.get("content", {}).get("text", "")},
+                    "memoryStrategyId": record.get("memoryStrategyId"),
+                    "createdAt": _timestamp(record.get("createdAt")),
+                }
+                output.write(json.dumps(line) + "\n")
+                records += 1
+
+    elapsed = time.perf_counter() - start
+    return {
+        "records": records,
+        "elapsed_seconds": round(elapsed, 3),
+        "records_per_second": round(records / elapsed, 1) if elapsed > 0 else None,
+    }
+
+
+def _read_batches(path: str, batch_size: int) -> Iterator[List[Tuple[int, str]]]:
+    """Yield batches of (line number, line) pairs, numbered from 1 over every line in the file."""
+    with gzip.open(path, "rt", encoding="utf-8") as source:
+        batch = []
+        for number, line in enumerate(source, start=1):
+            if line.strip():
+                batch.append((number, line))
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+
+def _to_record(line: str, number: int) -> Dict[str, Any]:
+    """Parse one exported line into a BatchCreateMemoryRecords record, raising on a malformed line."""
+    exported = json.loads(line)
+    return {
+        # Exported record IDs make re-imports traceable; the line number stands in for a missing one
+        "requestIdentifier": _REQUEST_ID.sub("-", exported.get("memoryRecordId") or f"line-{number}")[:80],
+        "namespaces": exported["namespaces"][:1],
+        "content": {"text": exported["content"]["text"]},
+        "timestamp": datetime.fromisoformat(exported["createdAt"]),
+    }
+
+
+def _create_batch(client, memory_id: str, lines: List[Tuple[int, str]]) -> Dict[str, int]:
+    """Write one batch of exported lines, returning counts of imported and failed records.
+
+    Malformed lines are logged and counted as failed without affecting the rest of the batch.
+    """
+    records, invalid = [], 0
+    for number, line in lines:
+        try:
+            records.append(_to_record(line, number))
+        except Exception as e:
+            logger.error(f"Skipping malformed memory record on line {number}: {e!r}")
+            invalid += 1
+    if not records:
+        return {"imported": 0, "failed": invalid}
+    try:
+        response = client.batch_create_memory_records(memoryId=memory_id, records=records)
+    except Exception as e:
+        logger.error(f"Failed to import {len(records)} memory records: {e}")
+        return {"imported": 0, "failed": len(records) + invalid}
+    for failure in response.get("failedRecords", []):
+        logger.error(f"Failed to import memory record {failure.get('requestIdentifier')}: {failure.get('errorMessage')}")
+    failed = len(response.get("failedRecords", []))
+    return {"imported": len(records) - failed, "failed": failed + invalid}
+
+
+def import_memory_records(
+    client,
+    memory_id: str,
+    path: str,
+    batch_size: int = IMPORT_BATCH_SIZE,
+    concurrency: int = IMPORT_CONCURRENCY,
+) -> Dict[str, Any]:
+    """Stream records from an export file into a memory with bounded concurrent batch writes.
+
+    At most `concurrency` batches are in flight, so memory use stays
+    proportional to batch_size * concurrency however large the file is.
+    Strategy IDs belong to the exporting memory resource and are not
+    carried over; records keep their namespaces, text and timestamps.
+
+    Args:
+        client: AgentCore data plane client or LocalMemoryClient
+        memory_id: Memory to import into
+        path: File written by export_memory_records
+        batch_size: Records per BatchCreateMemoryRecords call (at most 100)
+        concurrency: Maximum batches written at once
+
+    Returns:
+        Imported and failed record counts, elapsed time and throughput
+    """
+    start = time.perf_counter()
+    concurrency = max(1, concurrency)
+    totals = {"imported": 0, "failed": 0}
+    records = 0
+
+    def _collect(finished):
+        for future in finished:
+            for key, count in future.result().items():
+                totals[key] += count
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        pending = set()
+        for lines in _read_batches(path, min(batch_size, IMPORT_BATCH_SIZE)):
+            if len(pending) >= concurrency:
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                _collect(finished)
+            pending.add(executor.submit(_create_batch, client, memory_id, lines))
+            records += len(lines)
+        _collect(wait(pending).done)
+
+    elapsed = time.perf_counter() - start
+    return {
+        "records": records,
+        **totals,
+        "elapsed_seconds": round(elapsed, 3),
+        "records_per_second": round(totals["imported"] / elapsed, 1) if elapsed > 0 else None,
+    }
@@ -0,0 +1,177 @@
+"""Route each agent turn to a model tier by estimated complexity."""
+
+import logging
+import os
+import re
+import threading
+from collections import deque
+from typing import Any, Dict, Iterable, Tuple
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+# Tiering rules; override any key with a YAML or JSON file named by MODEL_ROUTING_CONFIG
+DEFAULT_ROUTING_RULES: Dict[str, Any] = {
+    "tiers": {
+        "fast": {
+            "model_id": os.getenv("MODEL_FAST_ID", "anthropic.claude-3-5-haiku-20241022-v1:0"),
+            # USD per million input and output tokens
+            "input_cost_per_mtok": 0.80,
+            "output_cost_per_mtok": 4.00,
+        },
+        "large": {
+            "model_id": os.getenv("MODEL_LARGE_ID", "anthropic.claude-3-5-sonnet-20241022-v2:0"),
+            "input_cost_per_mtok": 3.00,
+            "output_cost_per_mtok": 15.00,
+        },
+    },
+    "default_tier": "fast",
+    "large_tier": "large",
+    # Turns scoring at least this much go to the large tier
+    "large_min_score": 3.0,
+    # Score contributions
+    "chars_per_point": 400,
+    "max_length_points": 2.0,
+    "section_points": 0.5,
+    "tool_points": 0.75,
+    "synthesis_points": 1.5,
+    "tool_keywords": {
+        "timeline": ["timeline", "schedule", "checklist", "milestone"],
+        "marketing": ["tagline", "tweet", "marketing", "copy", "messaging"],
+        "research": ["competitor", "competitive", "hunter", "research", "top launches"],
+        "launch_days": ["best day", "launch day", "which day", "when should"],
+    },
+    "synthesis_keywords": ["comprehensive", "analysis", "analyze", "strategy", "strategic", "in depth", "compare"],
+}
+
+# Recent turns kept per tier for latency and cost percentiles
+STATS_WINDOW = 1000
+
+_SECTION = re.compile(r"^\s*(?:\d+[.)]|[-*•])\s+\S", re.MULTILINE)
+
+# Shared router and per-tier statistics
+_router = None
+_stats_lock = threading.Lock()
+_tier_stats: Dict[str, Dict[str, deque]] = {}
+
+
+def _merge(base: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
+    """Recursively merge override values into a copy of base."""
+    merged = dict(base)
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def load_routing_rules() -> Dict[str, Any]:
+    """Load the default tiering rules merged with MODEL_ROUTING_CONFIG, if set."""
+    path = os.getenv("MODEL_ROUTING_CONFIG")
+    if not path:
+        return DEFAULT_ROUTING_RULES
+    try:
+        with open(path, encoding="utf-8") as f:
+            return _merge(DEFAULT_ROUTING_RULES, yaml.safe_load(f) or {})
+    except Exception as e:
+        logger.error(f"Failed to load model routing config {path}: {e}")
+        return DEFAULT_ROUTING_RULES
+
+
+class ModelRouter:
+    """Score a user turn and choose the cheapest tier that can handle it.
+
+    The score adds points for message length, requested sections (numbered or
+    bulleted lines), distinct tools the message is likely to need and
+    synthesis wording such as "comprehensive analysis". Short chit-chat scores
+    near zero and stays on the fast tier.
+    """
+
+    def __init__(self, rules: Dict[str, Any] = None):
+        self.rules = rules or load_routing_rules()
+        self._tool_patterns = {
+            tool: re.compile(r"\b(?:" + "|".join(re.escape(k) for k in keywords) + r")", re.IGNORECASE)
+            for tool, keywords in self.rules["tool_keywords"].items()
+        }
+        self._synthesis_pattern = re.compile(
+            r"\b(?:" + "|".join(re.escape(k) for k in self.rules["synthesis_keywords"]) + r")", re.IGNORECASE
+        )
+
+    def score(self, message: str) -> Dict[str, Any]:
+        """Break down a message's complexity score."""
+        rules = self.rules
+        length = min(len(message) / rules["chars_per_point"], rules["max_length_points"])
+        sections = len(_SECTION.findall(message))
+        tools = [tool for tool, pattern in self._tool_patterns.items() if pattern.search(message)]
+        synthesis = bool(self._synthesis_pattern.search(message))
+        total = (
+            length
+            + sections * rules["section_points"]
+            + len(tools) * rules["tool_points"]
+            + (rules["synthesis_points"] if synthesis else 0.0)
+        )
+        return {"score": round(total, 2), "sections": sections, "tools": tools, "synthesis": synthesis}
+
+    def route(self, message: str) -> Tuple[str, Dict[str, Any]]:
+        """Choose a tier for a message.
+
+        Returns:
+            Tuple of tier name and the score breakdown
+        """
+        breakdown = self.score(message)
+        tier = self.rules["large_tier"] if breakdown["score"] >= self.rules["large_min_score"] else self.rules["default_tier"]
+        return tier, breakdown
+
+    def cost(self, tier: str, input_tokens: int, output_tokens: int) -> float:
+        """Estimated USD cost of a turn on a tier."""
+        prices = self.rules["tiers"][tier]
+        return (input_tokens * prices["input_cost_per_mtok"] + output_tokens * prices["output_cost_per_mtok"]) / 1_000_000
+
+
+def get_model_router() -> ModelRouter:
+    """Get the shared model router."""
+    global _router
+    if _router is None:
+        _router = ModelRouter()
+    return _router
+
+
+def record_turn(tier: str, latency: float, input_tokens: int, output_tokens: int) -> float:
+    """Log a routed turn and add it to the per-tier distribution.
+
+    Returns:
+        Estimated USD cost of the turn
+    """
+    cost = get_model_router().cost(tier, input_tokens, output_tokens)
+    with _stats_lock:
+        stats = _tier_stats.setdefault(tier, {"latency": deque(maxlen=STATS_WINDOW), "cost": deque(maxlen=STATS_WINDOW)})
+        stats["latency"].append(latency)
+        stats["cost"].append(cost)
+    logger.info(
+        f"Model tier {tier}: {latency:.2f}s, {input_tokens} in / {output_tokens} out tokens, ${cost:.5f}"
+    )
+    return cost
+
+
+def _percentile(values: Iterable[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+
+def get_model_tier_stats() -> Dict[str, Dict[str, Any]]:
+    """Turn counts with latency and cost distributions per tier."""
+    with _stats_lock:
+        return {
+            tier: {
+                "turns": len(stats["latency"]),
+                "latency_p50": round(_percentile(stats["latency"], 0.5), 3),
+                "latency_p95": round(_percentile(stats["latency"], 0.95), 3),
+                "cost_total": round(sum(stats["cost"]), 5),
+                "cost_p50": round(_percentile(stats["cost"], 0.5), 5),
+                "cost_p95": round(_percentile(stats["cost"], 0.95), 5),
+            }
+            for tier, stats in _tier_stats.items()
+            if stats["latency"]
+        }
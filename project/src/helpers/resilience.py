@@ -0,0 +1,337 @@
+"""Client-side rate limiting, throttling retries, hedged requests and circuit breaking for AWS calls."""
+
+import asyncio
+import logging
+import os
+import random
+import threading
+import time
+from collections import deque
+from typing import Any, AsyncGenerator, Dict, Optional, Tuple
+
+from botocore.exceptions import ClientError
+from strands.models.model import Model
+from strands.types.exceptions import ModelThrottledException
+
+logger = logging.getLogger(__name__)
+
+# Token bucket shared by every agent in the process
+BEDROCK_MAX_RPS = float(os.getenv("BEDROCK_MAX_RPS", "5"))
+BEDROCK_BURST = int(os.getenv("BEDROCK_BURST", "10"))
+
+# Decorrelated jitter retry on throttling
+BEDROCK_MAX_RETRIES = int(os.getenv("BEDROCK_MAX_RETRIES", "4"))
+BEDROCK_RETRY_BASE_DELAY = float(os.getenv("BEDROCK_RETRY_BASE_DELAY", "0.5"))
+BEDROCK_RETRY_MAX_DELAY = float(os.getenv("BEDROCK_RETRY_MAX_DELAY", "20"))
+
+# Hedging sends a second request when the first response event is slower than the observed p95
+BEDROCK_HEDGE = os.getenv("BEDROCK_HEDGE", "false").lower() == "true"
+HEDGE_MIN_SAMPLES = 20
+HEDGE_MIN_DELAY = 0.25
+LATENCY_WINDOW = 200
+
+_THROTTLE_CODES = {"ThrottlingException", "TooManyRequestsException", "ServiceUnavailableException"}
+
+# Shared limiter and counters
+_rate_limiter = None
+_counter_lock = threading.Lock()
+_counters: Dict[str, int] = {
+    "requests": 0,
+    "rate_limited": 0,
+    "throttles": 0,
+    "throttles_absorbed": 0,
+    "retries": 0,
+    "hedges": 0,
+    "hedge_wins": 0,
+    "failures": 0,
+}
+
+
+def _count(name: str, amount: int = 1):
+    with _counter_lock:
+        _counters[name] += amount
+
+
+def is_throttle(error: BaseException) -> bool:
+    """Whether an error means Bedrock rejected the request for capacity reasons."""
+    if isinstance(error, ModelThrottledException):
+        return True
+    if isinstance(error, ClientError):
+        return error.response.get("Error", {}).get("Code") in _THROTTLE_CODES
+    return False
+
+
+class TokenBucket:
+    """Thread-safe token bucket; callers reserve a token and sleep until it is available.
+
+    Tokens may go negative, which queues callers fairly in arrival order
+    instead of letting them race when the bucket refills.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Take a token and return how many seconds to wait before using it."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def try_acquire(self) -> bool:
+        """Take a token only if one is available now."""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+    async def acquire(self):
+        """Wait for a token."""
+        wait = self.reserve()
+        if wait > 0:
+            _count("rate_limited")
+            await asyncio.sleep(wait)
+
+
+def get_rate_limiter() -> TokenBucket:
+    """Get the process-wide Bedrock rate limiter."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        _rate_limiter = TokenBucket(BEDROCK_MAX_RPS, BEDROCK_BURST)
+    return _rate_limiter
+
+
+def decorrelated_jitter(previous: float, base: float, cap: float) -> float:
+    """Next retry delay: uniform between base and three times the previous delay, capped."""
+    return min(cap, random.uniform(base, previous * 3))
+
+
+async def _close(stream: AsyncGenerator, cancel_signal: Optional[threading.Event]):
+    """Abort an in-flight stream that lost a hedge race."""
+    if cancel_signal is not None:
+        cancel_signal.set()
+    try:
+        await stream.aclose()
+    except Exception:
+        pass
+
+
+class CircuitBreaker:
+    """Stop calling a failing dependency for a cool-off period.
+
+    After failure_threshold consecutive failures (errors or calls over their
+    latency budget) the breaker opens and allow() returns False for
+    cooldown_seconds. Then a single trial call is let through; its outcome
+    closes the breaker or opens it again.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 3, cooldown_seconds: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+        self._opens = 0
+        self._rejected = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Current state: closed, open or half_open."""
+        with self._lock:
+            return self._state(time.monotonic())
+
+    def _state(self, now: float) -> str:
+        if self._opened_at is None:
+            return "closed"
+        return "open" if now - self._opened_at < self.cooldown_seconds else "half_open"
+
+    def allow(self) -> bool:
+        """Whether a call may go ahead; every allowed call must be followed by a record call."""
+        with self._lock:
+            state = self._state(time.monotonic())
+            if state == "closed" or (state == "half_open" and not self._trial_in_flight):
+                self._trial_in_flight = state == "half_open"
+                return True
+            self._rejected += 1
+            return False
+
+    def record_success(self):
+        """Close the breaker and reset the failure count."""
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info(f"Circuit {self.name} closed")
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        """Count a failure, opening the breaker at the threshold or after a failed trial."""
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_flight or (self._opened_at is None and self._failures >= self.failure_threshold):
+                self._opened_at = time.monotonic()
+                self._opens += 1
+                logger.warning(f"Circuit {self.name} open for {self.cooldown_seconds:.0f}s after {self._failures} failures")
+            self._trial_in_flight = False
+
+    def stats(self) -> Dict[str, Any]:
+        """Breaker state, consecutive failures, times opened and calls rejected."""
+        with self._lock:
+            return {
+                "state": self._state(time.monotonic()),
+                "consecutive_failures": self._failures,
+                "opens": self._opens,
+                "rejected": self._rejected,
+            }
+
+
+class ResilientModel(Model):
+    """Wrap a Strands model with rate limiting, throttling retries and optional hedging.
+
+    Retries and hedges only happen before the first response event, so the
+    agent never sees a partial response followed by a replacement.
+    """
+
+    def __init__(
+        self,
+        model: Model,
+        rate_limiter: TokenBucket = None,
+        max_retries: int = BEDROCK_MAX_RETRIES,
+        base_delay: float = BEDROCK_RETRY_BASE_DELAY,
+        max_delay: float = BEDROCK_RETRY_MAX_DELAY,
+        hedge: bool = BEDROCK_HEDGE,
+    ):
+        self.model = model
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.hedge = hedge
+        self._first_event_latencies = deque(maxlen=LATENCY_WINDOW)
+
+    def __getattr__(self, name: str) -> Any:
+        # Anything not wrapped (config, client, ...) comes from the underlying model
+        return getattr(self.model, name)
+
+    @property
+    def stateful(self) -> bool:
+        return self.model.stateful
+
+    def update_config(self, **model_config: Any) -> None:
+        self.model.update_config(**model_config)
+
+    def get_config(self) -> Any:
+        return self.model.get_config()
+
+    async def count_tokens(self, *args, **kwargs) -> int:
+        return await self.model.count_tokens(*args, **kwargs)
+
+    async def structured_output(self, output_model, prompt, system_prompt=None, **kwargs):
+        await self.rate_limiter.acquire()
+        async for event in self.model.structured_output(output_model, prompt, system_prompt=system_prompt, **kwargs):
+            yield event
+
+    def hedge_delay(self) -> Optional[float]:
+        """Seconds to wait for a first event before hedging, or None until enough samples exist."""
+        if not self.hedge or len(self._first_event_latencies) < HEDGE_MIN_SAMPLES:
+            return None
+        ordered = sorted(self._first_event_latencies)
+        return max(ordered[int(0.95 * (len(ordered) - 1))], HEDGE_MIN_DELAY)
+
+    async def _open(self, args: tuple, kwargs: dict, cancel_signal: Optional[threading.Event]) -> Tuple[AsyncGenerator, Any]:
+        """Start one request and wait for its first event."""
+        if cancel_signal is not None:
+            kwargs = {**kwargs, "cancel_signal": cancel_signal}
+        stream = self.model.stream(*args, **kwargs)
+        try:
+            return stream, await stream.__anext__()
+        except BaseException:
+            await _close(stream, cancel_signal)
+            raise
+
+    async def _first_event(self, args: tuple, kwargs: dict) -> Tuple[AsyncGenerator, Any]:
+        """Open a request, hedging with a second one if the first is slower than p95."""
+        await self.rate_limiter.acquire()
+        _count("requests")
+        start = time.perf_counter()
+
+        delay = self.hedge_delay()
+        if delay is None:
+            opened = await self._open(args, kwargs, None)
+            self._first_event_latencies.append(time.perf_counter() - start)
+            return opened
+
+        signals = {}
+        primary = asyncio.ensure_future(self._open(args, kwargs, signals.setdefault("primary", threading.Event())))
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        # Hedges respect the rate limit: skip when no token is free right now
+        if done or not self.rate_limiter.try_acquire():
+            opened = await primary
+            self._first_event_latencies.append(time.perf_counter() - start)
+            return opened
+
+        _count("hedges")
+        _count("requests")
+        hedge = asyncio.ensure_future(self._open(args, kwargs, signals.setdefault("hedge", threading.Event())))
+        pending = {primary, hedge}
+        error = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            winner = next((task for task in done if task.exception() is None), None)
+            if winner is None:
+                error = error or next(iter(done)).exception()
+                continue
+            # Abort the slower request; _open closes its stream when cancelled
+            for loser in pending:
+                signals["primary" if loser is primary else "hedge"].set()
+                loser.cancel()
+            if winner is hedge:
+                _count("hedge_wins")
+            self._first_event_latencies.append(time.perf_counter() - start)
+            return winner.result()
+        raise error
+
+    async def stream(self, *args, **kwargs) -> AsyncGenerator[Any, None]:
+        """Stream from the wrapped model, retrying throttled requests with decorrelated jitter."""
+        delay = self.base_delay
+        throttled = False
+        for attempt in range(self.max_retries + 1):
+            try:
+                stream, first = await self._first_event(args, kwargs)
+                break
+            except Exception as e:
+                if not is_throttle(e):
+                    raise
+                throttled = True
+                _count("throttles")
+                if attempt == self.max_retries:
+                    _count("failures")
+                    raise
+                delay = decorrelated_jitter(delay, self.base_delay, self.max_delay)
+                _count("retries")
+                logger.warning(f"Bedrock throttled, retry {attempt + 1}/{self.max_retries} in {delay:.2f}s")
+                await asyncio.sleep(delay)
+
+        if throttled:
+            _count("throttles_absorbed")
+        yield first
+        async for event in stream:
+            yield event
+
+
+def get_resilience_stats() -> Dict[str, Any]:
+    """Counters for requests, rate limiting, retries, hedges and throttles absorbed."""
+    with _counter_lock:
+        return {**_counters, "max_rps": BEDROCK_MAX_RPS, "hedging": BEDROCK_HEDGE}
@@ -0,0 +1,136 @@
+"""Disk-backed LRU response cache with TTL and ETags."""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parents[2] / "data" / "analysis_cache.db"
+
+ANALYSIS_CACHE_TTL = int(os.getenv("ANALYSIS_CACHE_TTL", str(24 * 3600)))
+ANALYSIS_CACHE_MAX_ENTRIES = int(os.getenv("ANALYSIS_CACHE_MAX_ENTRIES", "1000"))
+
+# Shared cache instance
+_analysis_cache = None
+
+
+def fingerprint(payload: Any) -> str:
+    """SHA-256 of a canonical JSON encoding with whitespace-normalized strings."""
+    def canonical(value):
+        if isinstance(value, str):
+            return " ".join(value.split())
+        if isinstance(value, dict):
+            return {k: canonical(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [canonical(v) for v in value]
+        return value
+
+    encoded = json.dumps(canonical(payload), sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def make_etag(body: Dict[str, Any]) -> str:
+    """Strong ETag for a JSON body."""
+    encoded = json.dumps(body, sort_keys=True, default=str)
+    return f'"{hashlib.sha256(encoded.encode()).hexdigest()[:32]}"'
+
+
+class ResponseCache:
+    """JSON responses in SQLite with a TTL and least-recently-used eviction.
+
+    Entries survive restarts; reads refresh an entry's access time so the
+    least recently read entries are evicted first once max_entries is exceeded.
+    """
+
+    def __init__(self, path: str, ttl_seconds: int = ANALYSIS_CACHE_TTL, max_entries: int = ANALYSIS_CACHE_MAX_ENTRIES):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                etag TEXT NOT NULL,
+                body TEXT NOT NULL,
+                created REAL NOT NULL,
+                accessed REAL NOT NULL
+            )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses(accessed)")
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return {"etag", "body", "age_seconds"} for a fresh entry, otherwise None."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT etag, body, created FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None or now - row[2] > self.ttl_seconds:
+                if row is not None:
+                    self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self._conn.commit()
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+        return {"etag": row[0], "body": json.loads(row[1]), "age_seconds": int(now - row[2])}
+
+    def put(self, key: str, body: Dict[str, Any]) -> str:
+        """Store a JSON body and return its ETag, evicting least recently used entries."""
+        encoded = json.dumps(body, sort_keys=True, default=str)
+        etag = make_etag(body)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, etag, body, created, accessed) VALUES (?, ?, ?, ?, ?)",
+                (key, etag, encoded, now, now),
+            )
+            self._conn.execute(
+                "DELETE FROM responses WHERE key IN "
+                "(SELECT key FROM responses ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            self._conn.commit()
+        return etag
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size."""
+        with self._lock:
+            size = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            "size": size,
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+
+def get_analysis_cache() -> ResponseCache:
+    """Get the shared /api/analyze-product cache at data/analysis_cache.db or ANALYSIS_CACHE_PATH."""
+    global _analysis_cache
+    if _analysis_cache is None:
+        _analysis_cache = ResponseCache(os.getenv("ANALYSIS_CACHE_PATH", str(DEFAULT_CACHE_PATH)))
+    return _analysis_cache
@@ -0,0 +1,277 @@
+"""Per-tenant semantic cache of chat answers for paraphrased, context-free questions."""
+
+import logging
+import os
+import re
+import threading
+import time
+import zlib
+from collections import OrderedDict, deque
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SEMANTIC_CACHE = os.getenv("SEMANTIC_CACHE", "true").lower() == "true"
+# Minimum cosine similarity between a question and a cached one to reuse its answer
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.8"))
+SEMANTIC_CACHE_TTL = int(os.getenv("SEMANTIC_CACHE_TTL", "3600"))
+# Cached answers per tenant and tenants kept, both evicted least recently used first
+SEMANTIC_CACHE_MAX_ENTRIES = int(os.getenv("SEMANTIC_CACHE_MAX_ENTRIES", "256"))
+SEMANTIC_CACHE_MAX_TENANTS = int(os.getenv("SEMANTIC_CACHE_MAX_TENANTS", "1000"))
+
+EMBEDDING_DIM = 1024
+# Longer messages are specific enough that paraphrases rarely recur
+MAX_QUESTION_CHARS = 300
+LATENCY_WINDOW = 1000
+
+_WORD = re.compile(r"[a-z0-9]+")
+# References to earlier turns or to the user's own product make an answer depend on context
+_CONTEXTUAL = re.compile(
+    r"\b(?:it|its|this|that|these|those|above|previous|earlier|again|before|you said|my|our|we|us|mine)\b",
+    re.IGNORECASE,
+)
+_STOPWORDS = frozenset(
+    "a an the to of on in for and or is are be do does should would could can i what which when how "
+    "there any some with at by from please tell me you your get give make makes write need want know "
+    "recommend suggest week product hunt ph".split()
+)
+# Words that mean the same thing for launch questions
+_SYNONYMS = {
+    "weekday": "day",
+    "days": "day",
+    "optimal": "best",
+    "ideal": "best",
+    "good": "best",
+    "greatest": "best",
+    "launching": "launch",
+    "launches": "launch",
+    "launched": "launch",
+    "release": "launch",
+    "ship": "launch",
+    "time": "timing",
+    "when": "timing",
+}
+
+# Negations and antonyms that flip a question's meaning without changing most of its features:
+# "worst day to launch?" embeds close to "best day to launch?". Each maps to its polarity class,
+# and a cached answer is only reused when both questions have the same set of classes.
+_POLARITY = {
+    "not": "not",
+    "never": "not",
+    "no": "not",
+    "without": "not",
+    "don": "not",  # don't, doesn't, shouldn't, isn't and aren't split at the apostrophe
+    "doesn": "not",
+    "shouldn": "not",
+    "isn": "not",
+    "aren": "not",
+    "avoid": "avoid",
+    "skip": "avoid",
+    "worst": "worst",
+    "worse": "worst",
+    "bad": "worst",
+    "least": "worst",
+}
+
+# Shared cache instance
+_semantic_cache = None
+
+
+def _stem(word: str) -> str:
+    word = _SYNONYMS.get(word, word)
+    for suffix in ("ing", "ed", "es", "s"):
+        if len(word) > len(suffix) + 3 and word.endswith(suffix):
+            word = word[: -len(suffix)]
+            break
+    return _SYNONYMS.get(word, word)
+
+
+def _bucket(feature: str) -> int:
+    return zlib.crc32(feature.encode()) % EMBEDDING_DIM
+
+
+def embed(text: str) -> np.ndarray:
+    """Embed text as an L2-normalized hashed bag of words, word pairs and character trigrams.
+
+    Content words are stemmed and mapped through a small synonym table, so
+    "best day to launch?" and "which weekday should I launch on?" share most
+    features. Character trigrams add tolerance for typos and inflections.
+    """
+    vector = np.zeros(EMBEDDING_DIM, dtype=np.float32)
+    words = [_stem(w) for w in _WORD.findall(text.lower()) if w not in _STOPWORDS]
+    for word in words:
+        vector[_bucket("w:" + word)] += 1.0
+        padded = f"#{word}#"
+        for i in range(len(padded) - 2):
+            vector[_bucket("c:" + padded[i:i + 3])] += 0.25
+    for first, second in zip(words, words[1:]):
+        vector[_bucket(f"b:{first} {second}")] += 0.5
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+def polarity(text: str) -> int:
+    """Hash of the negation and antonym classes in a text; 0 when it has none."""
+    classes = sorted({_POLARITY[w] for w in _WORD.findall(text.lower()) if w in _POLARITY})
+    return zlib.crc32(" ".join(classes).encode())
+
+
+def is_context_free(message: str, context: Optional[Dict[str, Any]] = None) -> bool:
+    """Whether a question can be answered the same way regardless of conversation history."""
+    return not context and len(message) <= MAX_QUESTION_CHARS and not _CONTEXTUAL.search(message)
+
+
+class _TenantIndex:
+    """Embeddings of one tenant's cached questions in a matrix that doubles up to max_entries."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.vectors = np.zeros((min(8, max_entries), EMBEDDING_DIM), dtype=np.float32)
+        self.answers = [None] * len(self.vectors)
+        self.polarity = np.zeros(len(self.vectors), dtype=np.int64)
+        self.created = np.full(len(self.vectors), -np.inf)
+        self.accessed = np.full(len(self.vectors), -np.inf)
+
+    def __len__(self) -> int:
+        return int(np.isfinite(self.created).sum())
+
+    def search(self, vector: np.ndarray, polarity: int, now: float, ttl: float):
+        """Return (slot, similarity) of the most similar fresh entry with the same polarity."""
+        similarities = self.vectors @ vector
+        similarities[(now - self.created > ttl) | (self.polarity != polarity)] = -1.0
+        slot = int(np.argmax(similarities))
+        return slot, float(similarities[slot])
+
+    def _grow(self):
+        size = min(len(self.vectors) * 2, self.max_entries)
+        extra = size - len(self.vectors)
+        self.vectors = np.vstack([self.vectors, np.zeros((extra, EMBEDDING_DIM), dtype=np.float32)])
+        self.answers.extend([None] * extra)
+        self.polarity = np.concatenate([self.polarity, np.zeros(extra, dtype=np.int64)])
+        self.created = np.concatenate([self.created, np.full(extra, -np.inf)])
+        self.accessed = np.concatenate([self.accessed, np.full(extra, -np.inf)])
+
+    def add(self, vector: np.ndarray, polarity: int, answer: str, now: float):
+        """Store an answer in an empty slot, growing the matrix or evicting the least recently used entry."""
+        if len(self) == len(self.vectors) and len(self.vectors) < self.max_entries:
+            self._grow()
+        slot = int(np.argmin(self.accessed))
+        self.vectors[slot] = vector
+        self.answers[slot] = answer
+        self.polarity[slot] = polarity
+        self.created[slot] = now
+        self.accessed[slot] = now
+
+
+class SemanticCache:
+    """Answers keyed by question embedding, isolated per tenant.
+
+    A lookup is one matrix-vector product over the tenant's entries, so it
+    stays well under a millisecond for hundreds of cached questions. Entries
+    whose question differs in negation or antonyms ("worst", "avoid", "not")
+    never match, however similar the rest of the question is.
+    """
+
+    def __init__(
+        self,
+        threshold: float = SEMANTIC_CACHE_THRESHOLD,
+        ttl_seconds: int = SEMANTIC_CACHE_TTL,
+        max_entries: int = SEMANTIC_CACHE_MAX_ENTRIES,
+        max_tenants: int = SEMANTIC_CACHE_MAX_TENANTS,
+    ):
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_tenants = max_tenants
+        self.hits = 0
+        self.misses = 0
+        self.skipped = 0
+        self._tenants: "OrderedDict[str, _TenantIndex]" = OrderedDict()
+        self._lookup_ms = deque(maxlen=LATENCY_WINDOW)
+        self._lock = threading.Lock()
+
+    def lookup(self, tenant: str, message: str, context: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """Return a cached answer to a paraphrase of the message, or None.
+
+        Args:
+            tenant: Tenant the answer must belong to, such as the user ID
+            message: User's question
+            context: Request context; questions with context are never cached
+
+        Returns:
+            Cached answer text, or None on a miss
+        """
+        start = time.perf_counter()
+        if not is_context_free(message, context):
+            with self._lock:
+                self.skipped += 1
+            return None
+
+        vector = embed(message)
+        now = time.time()
+        answer = None
+        with self._lock:
+            index = self._tenants.get(tenant)
+            if index is not None:
+                self._tenants.move_to_end(tenant)
+                slot, similarity = index.search(vector, polarity(message), now, self.ttl_seconds)
+                if similarity >= self.threshold:
+                    index.accessed[slot] = now
+                    answer = index.answers[slot]
+            if answer is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            self._lookup_ms.append((time.perf_counter() - start) * 1000)
+        return answer
+
+    def store(self, tenant: str, message: str, answer: str, context: Optional[Dict[str, Any]] = None):
+        """Cache the answer to a context-free question for the tenant."""
+        if not answer or not is_context_free(message, context):
+            return
+        vector = embed(message)
+        with self._lock:
+            index = self._tenants.get(tenant)
+            if index is None:
+                index = self._tenants[tenant] = _TenantIndex(self.max_entries)
+                if len(self._tenants) > self.max_tenants:
+                    self._tenants.popitem(last=False)
+            self._tenants.move_to_end(tenant)
+            index.add(vector, polarity(message), answer, time.time())
+
+    def clear(self, tenant: str = None):
+        """Drop cached answers for one tenant, or for all tenants."""
+        with self._lock:
+            if tenant is None:
+                self._tenants.clear()
+            else:
+                self._tenants.pop(tenant, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit rate, lookup latency and size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            latencies = sorted(self._lookup_ms)
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "skipped": self.skipped,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "lookup_ms_p50": round(latencies[len(latencies) // 2], 3) if latencies else None,
+                "lookup_ms_p95": round(latencies[int(0.95 * (len(latencies) - 1))], 3) if latencies else None,
+                "tenants": len(self._tenants),
+                "entries": sum(len(index) for index in self._tenants.values()),
+                "threshold": self.threshold,
+            }
+
+
+def get_semantic_cache() -> Optional[SemanticCache]:
+    """Get the shared chat answer cache, or None when SEMANTIC_CACHE is disabled."""
+    global _semantic_cache
+    if not SEMANTIC_CACHE:
+        return None
+    if _semantic_cache is None:
+        _semantic_cache = SemanticCache()
+    return _semantic_cache
@@ -0,0 +1,126 @@
+"""Bounded concurrent tool execution and per-tool wall time for the agent loop."""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+import weakref
+from typing import Any, Dict, List
+
+from strands.hooks import (
+    AfterToolCallEvent,
+    AfterToolsEvent,
+    BeforeInvocationEvent,
+    BeforeToolCallEvent,
+    BeforeToolsEvent,
+    HookProvider,
+    HookRegistry,
+)
+from strands.tools.executors import ConcurrentToolExecutor
+
+logger = logging.getLogger(__name__)
+
+# Maximum tool calls from one model turn that run at the same time
+MAX_TOOL_CONCURRENCY = int(os.getenv("MAX_TOOL_CONCURRENCY", "4"))
+
+# Aggregate wall time per tool across all agents, for metrics
+_timing_lock = threading.Lock()
+_timing_totals: Dict[str, Dict[str, float]] = {}
+
+
+class BoundedConcurrentToolExecutor(ConcurrentToolExecutor):
+    """Run the tool calls of one model turn concurrently, at most max_concurrency at once.
+
+    Synchronous tools run in worker threads, so independent calls such as a
+    timeline and marketing assets overlap instead of running back to back.
+    """
+
+    def __init__(self, max_concurrency: int = MAX_TOOL_CONCURRENCY):
+        super().__init__()
+        self.max_concurrency = max(1, max_concurrency)
+        # asyncio semaphores belong to one event loop; the CLI starts a new loop per turn
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    async def _task(self, *args, **kwargs) -> None:
+        async with self._semaphore():
+            await super()._task(*args, **kwargs)
+
+
+class ToolTimingHooks(HookProvider):
+    """Record the wall time of every tool call and of each concurrent batch.
+
+    last_turn holds one entry per tool batch in the most recent invocation:
+    {"wall_seconds": ..., "tools": [{"tool": ..., "seconds": ...}, ...]}.
+    """
+
+    def __init__(self):
+        self.last_turn: List[Dict[str, Any]] = []
+        self._batch_start = None
+        self._batch_tools: List[Dict[str, Any]] = []
+        self._call_starts: Dict[str, float] = {}
+
+    def start_turn(self, event: BeforeInvocationEvent):
+        """Reset timings at the start of each invocation."""
+        self.last_turn = []
+
+    def start_batch(self, event: BeforeToolsEvent):
+        """Mark the start of a batch of tool calls from one model turn."""
+        self._batch_start = time.perf_counter()
+        self._batch_tools = []
+
+    def start_call(self, event: BeforeToolCallEvent):
+        """Mark the start of a single tool call."""
+        self._call_starts[event.tool_use["toolUseId"]] = time.perf_counter()
+
+    def end_call(self, event: AfterToolCallEvent):
+        """Record the wall time of a single tool call."""
+        started = self._call_starts.pop(event.tool_use["toolUseId"], None)
+        if started is None:
+            return
+        name = event.tool_use["name"]
+        seconds = time.perf_counter() - started
+        self._batch_tools.append({"tool": name, "seconds": round(seconds, 4)})
+
+        with _timing_lock:
+            totals = _timing_totals.setdefault(name, {"calls": 0, "total_seconds": 0.0, "max_seconds": 0.0})
+            totals["calls"] += 1
+            totals["total_seconds"] += seconds
+            totals["max_seconds"] = max(totals["max_seconds"], seconds)
+
+    def end_batch(self, event: AfterToolsEvent):
+        """Record the wall time of the whole batch."""
+        if self._batch_start is None:
+            return
+        wall = time.perf_counter() - self._batch_start
+        self.last_turn.append({"wall_seconds": round(wall, 4), "tools": self._batch_tools})
+        logger.info(f"Tool batch finished in {wall:.3f}s: {self._batch_tools}")
+        self._batch_start = None
+
+    def register_hooks(self, registry: HookRegistry) -> None:
+        """Register tool timing hooks."""
+        registry.add_callback(BeforeInvocationEvent, self.start_turn)
+        registry.add_callback(BeforeToolsEvent, self.start_batch)
+        registry.add_callback(BeforeToolCallEvent, self.start_call)
+        registry.add_callback(AfterToolCallEvent, self.end_call)
+        registry.add_callback(AfterToolsEvent, self.end_batch)
+
+
+def get_tool_timing_stats() -> Dict[str, Dict[str, float]]:
+    """Call counts and wall time per tool across all agents."""
+    with _timing_lock:
+        return {
+            name: {
+                "calls": int(totals["calls"]),
+                "avg_seconds": round(totals["total_seconds"] / totals["calls"], 4),
+                "max_seconds": round(totals["max_seconds"], 4),
+            }
+            for name, totals in _timing_totals.items()
+        }
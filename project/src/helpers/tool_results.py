@@ -0,0 +1,170 @@
+"""Compact text encoding of tool results sent back to the model."""
+
+import json
+import logging
+import os
+import re
+import threading
+from typing import Any, Dict, List
+
+from strands.hooks import AfterToolCallEvent, HookProvider, HookRegistry
+
+logger = logging.getLogger(__name__)
+
+# "compact" sends the model indented text with tables; "json" keeps the Strands default
+TOOL_RESULT_FORMAT = os.getenv("TOOL_RESULT_FORMAT", "compact").lower()
+
+_TOKEN = re.compile(r"\w+|[^\w\s]")
+
+# Aggregate estimated tokens per tool, for metrics
+_stats_lock = threading.Lock()
+_encoding_totals: Dict[str, Dict[str, int]] = {}
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate model tokens as words plus punctuation marks.
+
+    JSON's quotes, braces and commas each cost a token, which this counts.
+    """
+    return len(_TOKEN.findall(text))
+
+
+def _scalar(value: Any) -> str:
+    """Render a scalar without JSON quoting."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (list, tuple)):
+        return ", ".join(_scalar(v) for v in value)
+    return " ".join(str(value).split())
+
+
+def _is_scalar(value: Any) -> bool:
+    return not isinstance(value, (dict, list, tuple)) or (
+        isinstance(value, (list, tuple)) and all(not isinstance(v, (dict, list, tuple)) for v in value)
+    )
+
+
+def _is_empty(value: Any) -> bool:
+    return value is None or value == "" or value == [] or value == {}
+
+
+def _table(key: str, rows: List[Dict[str, Any]], indent: str) -> List[str]:
+    """Render a list of flat dicts as a header of column names plus one pipe-separated row each."""
+    columns = []
+    for row in rows:
+        columns.extend(c for c in row if c not in columns and not _is_empty(row[c]))
+    lines = [f"{indent}{key}[{len(rows)}]{{{'|'.join(columns)}}}:"]
+    for row in rows:
+        cells = ("" if _is_empty(row.get(c)) else _scalar(row[c]).replace("|", "/") for c in columns)
+        lines.append(f"{indent}  " + "|".join(cells))
+    return lines
+
+
+def _fields(data: Dict[str, Any], indent: str) -> List[str]:
+    """Render the non-empty fields of a dictionary."""
+    lines = []
+    for key, value in data.items():
+        if not _is_empty(value):
+            lines.extend(_encode(key, value, indent))
+    return lines
+
+
+def _encode(key: str, value: Any, indent: str) -> List[str]:
+    """Render one field as YAML-like lines."""
+    if _is_scalar(value):
+        if isinstance(value, (list, tuple)) and any(len(_scalar(v)) > 40 for v in value):
+            # Sentences read better one per line than comma-joined
+            return [f"{indent}{key}:"] + [f"{indent}- {_scalar(v)}" for v in value]
+        return [f"{indent}{key}: {_scalar(value)}"]
+
+    if isinstance(value, dict):
+        return [f"{indent}{key}:"] + _fields(value, indent + "  ")
+
+    if all(isinstance(v, dict) and all(_is_scalar(x) for x in v.values()) for v in value):
+        return _table(key, value, indent)
+
+    lines = [f"{indent}{key}:"]
+    for item in value:
+        if isinstance(item, dict):
+            item_lines = _fields(item, indent + "  ")
+            if item_lines:
+                item_lines[0] = f"{indent}- " + item_lines[0][len(indent) + 2:]
+            lines.extend(item_lines)
+        else:
+            lines.append(f"{indent}- {_scalar(item)}")
+    return lines
+
+
+def encode_compact(result: Dict[str, Any]) -> str:
+    """Encode a tool result dictionary as compact indented text for the model.
+
+    Lists of flat dictionaries become tables with one header line, lists of
+    scalars are comma-joined, JSON quoting is dropped, and empty fields and a
+    top-level success flag of true are omitted.
+
+    Args:
+        result: JSON-serializable tool result
+
+    Returns:
+        Compact text representation
+    """
+    if result.get("success") is True:
+        result = {k: v for k, v in result.items() if k != "success"}
+    return "\n".join(_fields(result, ""))
+
+
+class CompactToolResultHooks(HookProvider):
+    """Replace JSON tool results with the compact encoding before they reach the model.
+
+    Tools still return full dictionaries, so the REST endpoints that call them
+    directly are unaffected; only the text added to the conversation changes.
+    """
+
+    def compact_result(self, event: AfterToolCallEvent):
+        """Re-encode a successful JSON object result and record the token saving."""
+        result = event.result
+        content = result.get("content") or []
+        if result.get("status") != "success" or len(content) != 1 or "text" not in content[0]:
+            return
+        text = content[0]["text"]
+        try:
+            data = json.loads(text)
+        except ValueError:
+            return
+        if not isinstance(data, dict):
+            return
+
+        compact = encode_compact(data)
+        content[0]["text"] = compact
+        _record(event.tool_use["name"], estimate_tokens(text), estimate_tokens(compact))
+
+    def register_hooks(self, registry: HookRegistry) -> None:
+        """Register tool result encoding hooks."""
+        registry.add_callback(AfterToolCallEvent, self.compact_result)
+
+
+def _record(tool_name: str, json_tokens: int, compact_tokens: int):
+    with _stats_lock:
+        totals = _encoding_totals.setdefault(tool_name, {"results": 0, "json_tokens": 0, "compact_tokens": 0})
+        totals["results"] += 1
+        totals["json_tokens"] += json_tokens
+        totals["compact_tokens"] += compact_tokens
+
+
+def get_tool_result_encoding_stats() -> Dict[str, Dict[str, Any]]:
+    """Estimated JSON and compact tokens per tool, with the reduction achieved."""
+    with _stats_lock:
+        return {
+            name: {
+                **totals,
+                "reduction": round(1 - totals["compact_tokens"] / totals["json_tokens"], 3) if totals["json_tokens"] else 0.0,
+            }
+            for name, totals in _encoding_totals.items()
+        }
+
+
+def get_tool_result_hooks():
+    """Return the encoding hooks for the configured TOOL_RESULT_FORMAT, or None for JSON."""
+    if TOOL_RESULT_FORMAT == "json":
+        return None
+    return CompactToolResultHooks()
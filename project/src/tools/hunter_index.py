@@ -0,0 +1,283 @@
+"""Vector similarity index for matching Product Hunt hunters to products."""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROFILES_PATH = Path(__file__).resolve().parents[2] / "data" / "hunters.jsonl"
+
+# Hashed feature space; 256 float32 dims keeps 100k profiles at ~100 MB
+DEFAULT_DIM = 256
+
+# Shared index instance and the profiles file state it was synced from
+_hunter_index = None
+_synced_mtime = None
+
+
+def _tokens(text: str) -> List[str]:
+    """Lowercase word unigrams and bigrams."""
+    words = re.findall(r"\w+", text.lower())
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+def _profile_text(profile: Dict[str, Any]) -> str:
+    """Text describing what a hunter specializes in."""
+    topics = profile.get("topics", [])
+    if isinstance(topics, str):
+        topics = [topics]
+    return " ".join([profile.get("specialization", ""), " ".join(topics), profile.get("bio", "")])
+
+
+def _format_followers(followers: int) -> str:
+    """Format follower counts like the demo data ("15K+")."""
+    return f"{followers // 1000}K+" if followers >= 1000 else str(followers)
+
+
+def _format_success_rate(rate: float) -> str:
+    """Bucket a 0-1 success rate into the labels used by the demo data."""
+    if rate >= 0.75:
+        return "High"
+    if rate >= 0.6:
+        return "Medium-High"
+    if rate >= 0.4:
+        return "Medium"
+    return "Low"
+
+
+class HunterIndex:
+    """Hunter profiles with hashed TF vectors in one contiguous float32 matrix.
+
+    Profile vectors are L2-normalized sublinear term frequencies; IDF is applied
+    on the query side only, so adding or removing profiles never requires
+    re-weighting existing profiles. The matrix is stored feature-major
+    (dim x profiles) so a query only reads the rows of its nonzero features.
+    """
+
+    def __init__(self, dim: int = DEFAULT_DIM):
+        self.dim = dim
+        self._size = 0
+        self._vectors = np.zeros((dim, 0), dtype=np.float32)
+        self._followers = np.zeros(0, dtype=np.int64)
+        self._success_rates = np.zeros(0, dtype=np.float32)
+        self._doc_freq = np.zeros(dim, dtype=np.int64)
+        self._profiles: List[Dict[str, Any]] = []
+        self._rows: Dict[str, int] = {}
+        self._content_hashes: Dict[str, str] = {}
+        # Reentrant so sync can hold it across the remove and upsert it is made of
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _term_counts(self, text: str) -> np.ndarray:
+        """Count hashed tokens of text into a dim-sized vector."""
+        buckets = [zlib.crc32(token.encode()) % self.dim for token in _tokens(text)]
+        return np.bincount(buckets, minlength=self.dim).astype(np.float32)
+
+    def _profile_vector(self, profile: Dict[str, Any]) -> np.ndarray:
+        """Encode a profile as an L2-normalized sublinear TF vector."""
+        counts = self._term_counts(_profile_text(profile))
+        vector = np.where(counts > 0, 1.0 + np.log(np.maximum(counts, 1.0)), 0.0).astype(np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def _query_vector(self, text: str) -> np.ndarray:
+        """Encode a query with IDF weights from the current profiles."""
+        idf = np.log((1.0 + self._size) / (1.0 + self._doc_freq)) + 1.0
+        vector = (self._term_counts(text) * idf).astype(np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def _grow(self, capacity: int):
+        """Reallocate the contiguous arrays to hold at least capacity rows."""
+        capacity = max(capacity, 2 * self._vectors.shape[1], 64)
+        vectors = np.zeros((self.dim, capacity), dtype=np.float32)
+        vectors[:, :self._size] = self._vectors[:, :self._size]
+        followers = np.zeros(capacity, dtype=np.int64)
+        followers[:self._size] = self._followers[:self._size]
+        success_rates = np.zeros(capacity, dtype=np.float32)
+        success_rates[:self._size] = self._success_rates[:self._size]
+        self._vectors, self._followers, self._success_rates = vectors, followers, success_rates
+
+    def upsert(self, profiles: Iterable[Dict[str, Any]]) -> int:
+        """Add or update profiles by handle, re-encoding only changed ones.
+
+        Returns:
+            Number of profiles added or changed
+        """
+        changed = 0
+        with self._lock:
+            for profile in profiles:
+                handle = profile["handle"]
+                content_hash = hashlib.sha1(json.dumps(profile, sort_keys=True).encode()).hexdigest()
+                if self._content_hashes.get(handle) == content_hash:
+                    continue
+
+                vector = self._profile_vector(profile)
+                row = self._rows.get(handle)
+                if row is None:
+                    if self._size == self._vectors.shape[1]:
+                        self._grow(self._size + 1)
+                    row = self._size
+                    self._size += 1
+                    self._rows[handle] = row
+                    self._profiles.append(profile)
+                else:
+                    self._doc_freq -= self._vectors[:, row] > 0
+                    self._profiles[row] = profile
+
+                self._vectors[:, row] = vector
+                self._followers[row] = int(profile.get("followers", 0))
+                self._success_rates[row] = float(profile.get("success_rate", 0.0))
+                self._doc_freq += vector > 0
+                self._content_hashes[handle] = content_hash
+                changed += 1
+        return changed
+
+    def remove(self, handles: Iterable[str]) -> int:
+        """Remove profiles by handle, filling each gap with the last row.
+
+        Returns:
+            Number of profiles removed
+        """
+        removed = 0
+        with self._lock:
+            for handle in handles:
+                row = self._rows.pop(handle, None)
+                if row is None:
+                    continue
+                self._content_hashes.pop(handle, None)
+                self._doc_freq -= self._vectors[:, row] > 0
+
+                last = self._size - 1
+                if row != last:
+                    self._vectors[:, row] = self._vectors[:, last]
+                    self._followers[row] = self._followers[last]
+                    self._success_rates[row] = self._success_rates[last]
+                    self._profiles[row] = self._profiles[last]
+                    self._rows[self._profiles[row]["handle"]] = row
+                self._profiles.pop()
+                self._size = last
+                removed += 1
+        return removed
+
+    def sync(self, profiles: Sequence[Dict[str, Any]]) -> Dict[str, int]:
+        """Make the index match a full profile list, touching only the differences."""
+        handles = {profile["handle"] for profile in profiles}
+        with self._lock:
+            removed = self.remove([handle for handle in self._rows if handle not in handles])
+            changed = self.upsert(profiles)
+            return {"changed": changed, "removed": removed, "total": self._size}
+
+    def match_many(
+        self,
+        queries: Sequence[Tuple[str, str]],
+        top_k: int = 5,
+        min_followers: int = 0,
+        min_success_rate: float = 0.0
+    ) -> List[List[Dict[str, Any]]]:
+        """Find the best hunters for many (category, audience) queries in one batched pass.
+
+        Args:
+            queries: (product_category, target_audience) pairs
+            top_k: Number of hunters per query
+            min_followers: Only match hunters with at least this many followers
+            min_success_rate: Only match hunters with at least this success rate (0-1)
+
+        Returns:
+            One list of hunter dictionaries per query, best match first
+        """
+        with self._lock:
+            if self._size == 0 or not queries:
+                return [[] for _ in queries]
+
+            query_matrix = np.stack([self._query_vector(f"{category} {audience}") for category, audience in queries])
+            features = np.flatnonzero(query_matrix.any(axis=0))
+            scores = query_matrix[:, features] @ self._vectors[features, :self._size]
+
+            eligible = (self._followers[:self._size] >= min_followers) & (self._success_rates[:self._size] >= min_success_rate)
+            if not eligible.all():
+                scores[:, ~eligible] = -np.inf
+
+            k = min(top_k, self._size)
+            top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            top_scores = np.take_along_axis(scores, top, axis=1)
+            order = np.argsort(-top_scores, axis=1)
+            top = np.take_along_axis(top, order, axis=1)
+            top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+            results = []
+            for (category, _), rows, row_scores in zip(queries, top.tolist(), top_scores.tolist()):
+                matches = []
+                for row, score in zip(rows, row_scores):
+                    if score <= 0:
+                        break
+                    profile = self._profiles[row]
+                    matches.append({
+                        "name": profile.get("name", profile["handle"]),
+                        "handle": profile["handle"],
+                        "specialization": profile.get("specialization", ""),
+                        "followers": _format_followers(int(self._followers[row])),
+                        "success_rate": _format_success_rate(float(self._success_rates[row])),
+                        "contact_approach": profile.get("contact_approach", "Twitter DM or email"),
+                        "why_fit": f"Hunts {profile.get('specialization') or 'launches'} relevant to {category}",
+                        "match_score": round(score, 3),
+                    })
+                results.append(matches)
+            return results
+
+    def match(self, product_category: str, target_audience: str, top_k: int = 5, **filters) -> List[Dict[str, Any]]:
+        """Find the best hunters for a single product."""
+        return self.match_many([(product_category, target_audience)], top_k=top_k, **filters)[0]
+
+
+def load_hunter_profiles(path: str) -> List[Dict[str, Any]]:
+    """Load hunter profiles (one JSON object per line, keyed by handle)."""
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _profiles_path() -> Path:
+    """Get the hunter profiles location, overridable with HUNTER_PROFILES_PATH."""
+    return Path(os.getenv("HUNTER_PROFILES_PATH", str(DEFAULT_PROFILES_PATH)))
+
+
+def get_profiles_version() -> Optional[int]:
+    """Get the mtime of the hunter profiles file, or None if it does not exist."""
+    try:
+        return _profiles_path().stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def get_hunter_index() -> Optional[HunterIndex]:
+    """Get the shared hunter index, syncing it when the profiles file changes.
+
+    Profiles are read from data/hunters.jsonl or HUNTER_PROFILES_PATH.
+    Returns None if no profiles file exists, dropping any index synced from
+    a file that has since been deleted.
+    """
+    global _hunter_index, _synced_mtime
+    path = _profiles_path()
+    mtime = get_profiles_version()
+    if mtime is None:
+        _hunter_index, _synced_mtime = None, None
+        return None
+
+    if _hunter_index is None or mtime != _synced_mtime:
+        if _hunter_index is None:
+            _hunter_index = HunterIndex()
+        stats = _hunter_index.sync(load_hunter_profiles(str(path)))
+        _synced_mtime = mtime
+        logger.info(f"Hunter index synced: {stats}")
+    return _hunter_index
@@ -0,0 +1,148 @@
+"""Per-day, per-category launch counts for scoring candidate launch dates."""
+
+import logging
+import sqlite3
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .launch_index import get_index_path, get_index_version
+
+logger = logging.getLogger(__name__)
+
+# Relative Product Hunt traffic by weekday (Mon..Sun); Tuesday-Thursday perform best
+WEEKDAY_PRIOR = np.array([0.8, 1.0, 1.0, 1.0, 0.75, 0.55, 0.55])
+
+# Days on either side of a candidate whose launches still compete for attention,
+# and their weight relative to same-day launches (the daily leaderboard matters most)
+NEIGHBORHOOD_DAYS = 3
+NEIGHBORHOOD_WEIGHT = 0.25
+
+# Trailing history used to estimate the typical load on each weekday
+HISTORY_DAYS = 365
+
+_WEEKDAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+# Shared index instance and the launch index file state it was built from
+_density_index = None
+_built_version = None
+
+
+class LaunchDensityIndex:
+    """Launch counts in a (category, day) array with prefix sums for O(1) range queries.
+
+    Row 0 holds all categories combined; days are ordinals relative to the
+    earliest launch in the corpus.
+    """
+
+    def __init__(self, launches: Iterable[Tuple[str, str]]):
+        categories, days = [], []
+        for category, launch_date in launches:
+            try:
+                day = np.datetime64((launch_date or "")[:10], "D")
+            except ValueError:
+                continue
+            if np.isnat(day):
+                continue
+            days.append(day)
+            categories.append((category or "").lower())
+
+        self.categories = {name: i + 1 for i, name in enumerate(sorted(set(categories)))}
+        if days:
+            day_array = np.array(days, dtype="datetime64[D]")
+            self.start = day_array.min()
+            offsets = (day_array - self.start).astype(np.int64)
+            n_days = int(offsets.max()) + 1
+        else:
+            self.start = np.datetime64("1970-01-01", "D")
+            offsets = np.zeros(0, dtype=np.int64)
+            n_days = 1
+
+        rows = np.array([self.categories[c] for c in categories], dtype=np.int64)
+        counts = np.zeros((len(self.categories) + 1, n_days), dtype=np.int32)
+        np.add.at(counts, (rows, offsets), 1)
+        counts[0] = counts[1:].sum(axis=0)
+
+        self.n_days = n_days
+        self.prefix = np.zeros((counts.shape[0], n_days + 1), dtype=np.int64)
+        np.cumsum(counts, axis=1, out=self.prefix[:, 1:])
+
+    def _row(self, category: str) -> int:
+        """Row for a category, falling back to all categories."""
+        return self.categories.get((category or "").lower(), 0)
+
+    def range_counts(self, category: str, first_days: np.ndarray, last_days: np.ndarray) -> np.ndarray:
+        """Count launches in [first_day, last_day] for many ranges at once."""
+        prefix = self.prefix[self._row(category)]
+        lo = np.clip((first_days - self.start).astype(np.int64), 0, self.n_days)
+        hi = np.clip((last_days - self.start).astype(np.int64) + 1, 0, self.n_days)
+        return np.maximum(prefix[hi] - prefix[lo], 0)
+
+    def score_dates(self, category: str, candidates: np.ndarray, today: np.datetime64) -> Dict[str, np.ndarray]:
+        """Score candidate launch days in one vectorized pass; higher is better."""
+        same_day = self.range_counts(category, candidates, candidates)
+        nearby = self.range_counts(category, candidates - NEIGHBORHOOD_DAYS, candidates + NEIGHBORHOOD_DAYS) - same_day
+
+        # Average launches per weekday over the trailing year of history
+        history_days = np.arange(today - HISTORY_DAYS, today, dtype="datetime64[D]")
+        history_counts = self.range_counts(category, history_days, history_days)
+        history_weekdays = (history_days.astype(np.int64) + 3) % 7  # 1970-01-01 was a Thursday
+        weekday_load = np.bincount(history_weekdays, weights=history_counts, minlength=7) / np.maximum(
+            np.bincount(history_weekdays, minlength=7), 1
+        )
+
+        weekdays = (candidates.astype(np.int64) + 3) % 7
+        competition = same_day + NEIGHBORHOOD_WEIGHT * nearby / (2 * NEIGHBORHOOD_DAYS) + weekday_load[weekdays]
+        return {
+            "score": WEEKDAY_PRIOR[weekdays] / (1.0 + competition),
+            "weekday": weekdays,
+            "same_day": same_day,
+            "nearby": nearby,
+            "weekday_load": weekday_load[weekdays],
+        }
+
+    def best_launch_days(
+        self,
+        category: str,
+        window_start: np.datetime64,
+        window_days: int,
+        top_n: int = 3,
+        today: Optional[np.datetime64] = None
+    ) -> List[Dict[str, Any]]:
+        """Rank every day in a window and return the best launch days."""
+        today = today if today is not None else window_start
+        candidates = window_start + np.arange(max(window_days, 1))
+        scored = self.score_dates(category, candidates, today)
+
+        best = np.argsort(-scored["score"], kind="stable")[:top_n]
+        return [
+            {
+                "date": str(candidates[i]),
+                "weekday": _WEEKDAY_NAMES[scored["weekday"][i]],
+                "score": round(float(scored["score"][i]), 4),
+                "same_day_launches": int(scored["same_day"][i]),
+                "launches_within_3_days": int(scored["nearby"][i]),
+                "typical_weekday_launches": round(float(scored["weekday_load"][i]), 2),
+            }
+            for i in best
+        ]
+
+
+def get_launch_density_index() -> LaunchDensityIndex:
+    """Get the shared density index, rebuilt whenever the launch index file changes."""
+    global _density_index, _built_version
+    path = get_index_path()
+    # (inode, mtime): an index swapped in by os.replace can keep the old mtime
+    version = get_index_version()
+    if _density_index is None or version != _built_version:
+        launches = []
+        if version is not None:
+            conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+            try:
+                launches = conn.execute("SELECT category, launch_date FROM launches").fetchall()
+            finally:
+                conn.close()
+        _density_index = LaunchDensityIndex(launches)
+        _built_version = version
+        logger.info(f"Launch density index built from {len(launches)} launches")
+    return _density_index
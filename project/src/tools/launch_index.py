@@ -0,0 +1,230 @@
+"""Local, read-only Product Hunt launch corpus backed by SQLite FTS5."""
+
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .tool_cache import clear_tool_caches
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_PATH = Path(__file__).resolve().parents[2] / "data" / "launches.db"
+
+_SCHEMA = """
+CREATE TABLE launches (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    tagline TEXT NOT NULL DEFAULT '',
+    category TEXT NOT NULL DEFAULT '',
+    launch_date TEXT NOT NULL DEFAULT '',
+    rank INTEGER,
+    upvotes INTEGER NOT NULL DEFAULT 0,
+    success_factors TEXT NOT NULL DEFAULT '[]',
+    standout_features TEXT NOT NULL DEFAULT '',
+    lessons TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX idx_launches_category ON launches (category COLLATE NOCASE, upvotes DESC);
+CREATE VIRTUAL TABLE launches_fts USING fts5(
+    name, tagline, category, success_factors,
+    content='launches', content_rowid='id', tokenize='porter unicode61'
+);
+"""
+
+# Shared index instance (opened lazily)
+_launch_index = None
+
+# Column weights for bm25: category matches matter most, then name/tagline
+_BM25_WEIGHTS = "2.0, 1.5, 4.0, 1.0"
+
+# Most-upvoted launches in a category that are re-ranked by audience overlap
+_CATEGORY_CANDIDATES = 200
+
+
+def _file_version(path: Path) -> Optional[tuple]:
+    """Identity of the file at a path, which changes whenever the index is rebuilt and swapped in."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns)
+
+
+def get_index_path() -> Path:
+    """Get the launch index location, overridable with LAUNCH_INDEX_PATH."""
+    return Path(os.getenv("LAUNCH_INDEX_PATH", str(DEFAULT_INDEX_PATH)))
+
+
+def get_index_version() -> Optional[tuple]:
+    """Get the (inode, mtime) of the launch index file, or None if no index has been built."""
+    return _file_version(get_index_path())
+
+
+def build_launch_index(jsonl_path: str, db_path: Optional[str] = None) -> Dict[str, Any]:
+    """Build the launch index from a JSONL file, replacing any existing index.
+
+    Each line must have a name and may have tagline, category, launch_date,
+    rank, upvotes, success_factors (list), standout_features and lessons.
+
+    Args:
+        jsonl_path: Path to the JSONL launch corpus
+        db_path: Output SQLite file, defaults to get_index_path()
+
+    Returns:
+        Dictionary with the number of launches indexed and the index size in bytes
+    """
+    db_path = Path(db_path or get_index_path())
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = db_path.with_suffix(".tmp")
+    if tmp_path.exists():
+        tmp_path.unlink()
+
+    def _rows():
+        with open(jsonl_path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                launch = json.loads(line)
+                yield (
+                    launch["name"],
+                    launch.get("tagline", ""),
+                    launch.get("category", ""),
+                    launch.get("launch_date", ""),
+                    launch.get("rank"),
+                    int(launch.get("upvotes") or 0),
+                    json.dumps(launch.get("success_factors", [])),
+                    launch.get("standout_features", ""),
+                    launch.get("lessons", ""),
+                )
+
+    # Build into a temporary file and swap it in so readers never see a partial index
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.executescript(_SCHEMA)
+        conn.executemany(
+            "INSERT INTO launches (name, tagline, category, launch_date, rank, upvotes, "
+            "success_factors, standout_features, lessons) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            _rows(),
+        )
+        conn.execute("INSERT INTO launches_fts (launches_fts) VALUES ('rebuild')")
+        conn.execute("INSERT INTO launches_fts (launches_fts) VALUES ('optimize')")
+        count = conn.execute("SELECT COUNT(*) FROM launches").fetchone()[0]
+        conn.commit()
+        conn.execute("VACUUM")
+    finally:
+        conn.close()
+
+    os.replace(tmp_path, db_path)
+
+    # In this process, drop cached results now; other processes notice the new file on their next lookup
+    clear_tool_caches()
+    logger.info(f"Indexed {count} launches into {db_path}")
+    return {"launches": count, "index_bytes": db_path.stat().st_size, "path": str(db_path)}
+
+
+def _ordinal(rank: Optional[int]) -> str:
+    """Format a daily rank like the mock data ("1st place")."""
+    if not rank:
+        return "Unranked"
+    suffix = "th" if 10 <= rank % 100 <= 20 else {1: "st", 2: "nd", 3: "rd"}.get(rank % 10, "th")
+    return f"{rank}{suffix} place"
+
+
+class LaunchIndex:
+    """Read-only ranked search over the local launch corpus."""
+
+    def __init__(self, db_path: Path, version: Optional[tuple] = None):
+        self.db_path = Path(db_path)
+        # (inode, mtime) of the file this index was opened on
+        self.version = version or _file_version(self.db_path)
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get this thread's read-only connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
+        return conn
+
+    def search(self, category: str, audience: str = "", top_k: int = 5) -> List[Dict[str, Any]]:
+        """Find the top launches for a category and audience.
+
+        Exact category matches are read from the category index by upvotes and
+        re-ranked by audience overlap; otherwise full-text bm25 ranking is used.
+
+        Args:
+            category: Product category (e.g., Productivity, AI Tools)
+            audience: Target audience, matched against taglines and success factors
+            top_k: Number of launches to return
+
+        Returns:
+            List of launch dictionaries in the research_top_launches format
+        """
+        conn = self._connection()
+        audience_terms = set(re.findall(r"\w+", audience.lower()))
+
+        rows = conn.execute(
+            "SELECT * FROM launches WHERE category = ? COLLATE NOCASE ORDER BY upvotes DESC LIMIT ?",
+            (category, _CATEGORY_CANDIDATES),
+        ).fetchall()
+        if rows:
+            if audience_terms:
+                # Stable sort keeps upvote order among equally relevant launches
+                rows.sort(
+                    key=lambda row: -len(audience_terms & set(re.findall(r"\w+", f"{row['tagline']} {row['success_factors']}".lower())))
+                )
+            rows = rows[:top_k]
+        else:
+            terms = list(dict.fromkeys(re.findall(r"\w+", f"{category} {audience}".lower())))
+            if not terms:
+                return []
+            rows = conn.execute(
+                f"""
+                SELECT l.* FROM (
+                    SELECT rowid, bm25(launches_fts, {_BM25_WEIGHTS}) AS score
+                    FROM launches_fts WHERE launches_fts MATCH ? ORDER BY score LIMIT ?
+                ) f JOIN launches l ON l.id = f.rowid
+                ORDER BY f.score, l.upvotes DESC
+                """,
+                (" OR ".join(f'"{term}"' for term in terms), top_k),
+            ).fetchall()
+
+        return [
+            {
+                "name": row["name"],
+                "tagline": row["tagline"],
+                "category": row["category"],
+                "launch_date": row["launch_date"],
+                "ranking": _ordinal(row["rank"]),
+                "upvotes": row["upvotes"],
+                "success_factors": json.loads(row["success_factors"]),
+                "standout_features": row["standout_features"],
+                "lessons": row["lessons"],
+            }
+            for row in rows
+        ]
+
+
+def get_launch_index() -> Optional[LaunchIndex]:
+    """Get the shared launch index, or None if no index has been built.
+
+    The index file is replaced atomically by `index-launches`, usually from
+    another process, so the file's inode and mtime are checked on every call
+    and the index is reopened when either has changed. Connections opened on
+    the old file keep reading the old snapshot until they are released.
+    """
+    global _launch_index
+    path = get_index_path()
+    version = get_index_version()
+    if version is None:
+        _launch_index = None
+        return None
+    if _launch_index is None or _launch_index.db_path != path or _launch_index.version != version:
+        _launch_index = LaunchIndex(path, version)
+    return _launch_index
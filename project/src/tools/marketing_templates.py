@@ -0,0 +1,284 @@
+"""Precompiled marketing copy templates keyed by tone and product type."""
+
+import re
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple
+
+# Platform length limits
+TAGLINE_MAX_CHARS = 60       # Product Hunt tagline
+DESCRIPTION_MAX_CHARS = 260  # Product Hunt short description
+TWEET_MAX_CHARS = 280
+
+TONES = ("professional", "casual", "playful", "technical")
+DEFAULT_TONE = "professional"
+
+# Near-duplicate threshold on word-set Jaccard similarity
+DUPLICATE_SIMILARITY = 0.8
+
+# Fields: {name}, {pitch}, {audience}, {product_type}
+TONE_TEMPLATES = {
+    "professional": {
+        "taglines": [
+            "{name}: {pitch}",
+            "{name} - built for {audience}",
+            "Transform your workflow with {name}",
+            "The smarter {product_type} for {audience}",
+            "Build better with {name}",
+            "{name} helps {audience} do more",
+        ],
+        "descriptions": [
+            "{pitch} Built for {audience}, {name} helps you get results faster. Try {name} today and see the difference!",
+        ],
+        "tweets": [
+            "🚀 We just launched {name} on @ProductHunt! {pitch} #ProductHunt #Launch",
+            "Excited to share {name} with the world! Built for {audience}. Check it out: #ProductHunt #Launch",
+            "After months of building, {name} is live on @ProductHunt! Would love your support 🙏 #ProductHunt #Launch",
+            "{name} is live on @ProductHunt today. {pitch} Feedback from {audience} very welcome. #ProductHunt",
+            "Today's the day: {name} launches on @ProductHunt. If you're one of the {audience} we built it for, we'd love your thoughts. #ProductHunt",
+        ],
+    },
+    "casual": {
+        "taglines": [
+            "{name}: {pitch}",
+            "Meet {name}, your new favorite {product_type}",
+            "{name} makes life easier for {audience}",
+            "Say hi to {name} 👋",
+            "{name} - the {product_type} {audience} will love",
+            "Less hassle, more done with {name}",
+        ],
+        "descriptions": [
+            "{pitch} We made {name} for {audience} who want things to just work. Give it a spin!",
+        ],
+        "tweets": [
+            "We're live on @ProductHunt! 🎉 {name}: {pitch} #ProductHunt",
+            "So {name} is out today 👀 Made it for {audience}. Come say hi on @ProductHunt! #ProductHunt",
+            "Launch day for {name}! ☕ Would mean a lot if you checked it out on @ProductHunt #ProductHunt #Launch",
+            "Hey {audience}! We built {name} for you. {pitch} It's on @ProductHunt today 🙌 #ProductHunt",
+            "Finally shipped {name} 🚢 {pitch} Drop by @ProductHunt and tell us what you think! #ProductHunt",
+        ],
+    },
+    "playful": {
+        "taglines": [
+            "{name}: {pitch} ✨",
+            "{name} - like magic for {audience}",
+            "Your {product_type} just got superpowers",
+            "{name}: because {audience} deserve nice things",
+            "Oops, we made {name} 🙈",
+            "{name} goes brrr for {audience}",
+        ],
+        "descriptions": [
+            "{pitch} {name} is the sidekick {audience} didn't know they needed. Take it for a spin - it doesn't bite! 🐶",
+        ],
+        "tweets": [
+            "🥁 Drumroll... {name} is LIVE on @ProductHunt! {pitch} #ProductHunt",
+            "Plot twist: {name} just launched on @ProductHunt 🎬 Made with ❤️ for {audience} #ProductHunt #Launch",
+            "Warning ⚠️ {name} may cause extreme productivity. Now on @ProductHunt! #ProductHunt",
+            "{audience}, assemble! 🦸 {name} is on @ProductHunt today. {pitch} #ProductHunt",
+            "We made a thing! 🎉 {name}: {pitch} Come play on @ProductHunt #ProductHunt #Launch",
+        ],
+    },
+    "technical": {
+        "taglines": [
+            "{name}: {pitch}",
+            "{name} - a {product_type} engineered for {audience}",
+            "Ship faster with {name}",
+            "{name}: fewer moving parts, more throughput",
+            "The {product_type} {audience} can build on",
+            "{name} - open, fast and reliable",
+        ],
+        "descriptions": [
+            "{pitch} {name} is a {product_type} designed for {audience}, with a focus on performance, reliability and clean integrations.",
+        ],
+        "tweets": [
+            "Shipped: {name} is on @ProductHunt today. {pitch} #ProductHunt #DevTools",
+            "{name} v1 is live on @ProductHunt. Built for {audience}; questions about the architecture welcome. #ProductHunt",
+            "Launching {name} on @ProductHunt 🚀 {pitch} Benchmarks and docs in the comments. #ProductHunt #Launch",
+            "We built {name} because {audience} needed a better {product_type}. Now on @ProductHunt. #ProductHunt",
+            "{name}: {pitch} Try it, break it, tell us on @ProductHunt. #ProductHunt #BuildInPublic",
+        ],
+    },
+}
+
+# Extra templates for specific product types, combined with every tone
+PRODUCT_TYPE_TEMPLATES = {
+    "saas": {
+        "taglines": ["{name} - the SaaS {audience} run on"],
+        "tweets": ["Start a free trial of {name} today - it's live on @ProductHunt! {pitch} #ProductHunt #SaaS"],
+    },
+    "mobile app": {
+        "taglines": ["{name} - {audience} in your pocket", "{name}: {pitch} On iOS and Android"],
+        "tweets": ["📱 {name} is on @ProductHunt today! {pitch} Download it and let us know what you think. #ProductHunt #MobileApp"],
+    },
+    "chrome extension": {
+        "taglines": ["{name} - one click for {audience}", "Add {name} to Chrome in seconds"],
+        "tweets": ["🧩 {name} is live on @ProductHunt! One click to install. {pitch} #ProductHunt #ChromeExtension"],
+    },
+    "api": {
+        "taglines": ["{name} - an API {audience} can trust"],
+        "tweets": ["🔌 {name} is on @ProductHunt. {pitch} Grab a key and start building. #ProductHunt #API"],
+    },
+}
+
+SUGGESTIONS = [
+    "Start building your community around {name} 2-3 weeks before launch",
+    "Create a demo video showcasing {name}'s key features",
+    "Reach out to {audience} influencers and thought leaders",
+    "Prepare social media content for launch day and the following week",
+    "Plan follow-up activities to maintain momentum after launch day",
+]
+
+_ASSET_LIMITS = {
+    "taglines": TAGLINE_MAX_CHARS,
+    "descriptions": DESCRIPTION_MAX_CHARS,
+    "tweets": TWEET_MAX_CHARS,
+}
+
+_Compiled = Dict[str, Tuple[Callable[..., str], ...]]
+
+
+def _compile(tone: str, product_type: str) -> _Compiled:
+    """Merge tone and product type templates into bound str.format callables."""
+    compiled = {}
+    for asset in _ASSET_LIMITS:
+        # Type-specific copy first so it survives when fewer variants are requested
+        templates = PRODUCT_TYPE_TEMPLATES.get(product_type, {}).get(asset, []) + TONE_TEMPLATES[tone].get(asset, [])
+        compiled[asset] = tuple(template.format for template in templates)
+    return compiled
+
+
+# Compiled once at import for every (tone, product type) pair
+_COMPILED: Dict[Tuple[str, str], _Compiled] = {
+    (tone, product_type): _compile(tone, product_type)
+    for tone in TONES
+    for product_type in [""] + list(PRODUCT_TYPE_TEMPLATES)
+}
+_SUGGESTIONS = tuple(template.format for template in SUGGESTIONS)
+_WORD = re.compile(r"\w+")
+_PRODUCT_TYPE_PATTERNS = {key: re.compile(rf"\b{re.escape(key)}\b") for key in PRODUCT_TYPE_TEMPLATES}
+
+
+def _product_type_key(product_type: str) -> str:
+    """Map a free-form product type onto a template key."""
+    normalized = (product_type or "").lower()
+    for key, pattern in _PRODUCT_TYPE_PATTERNS.items():
+        if pattern.search(normalized):
+            return key
+    return ""
+
+
+def shorten(text: str, limit: int) -> str:
+    """Truncate text to limit characters on a word boundary, adding an ellipsis."""
+    if len(text) <= limit:
+        return text
+    cut = text[:limit - 1]
+    if " " in cut:
+        cut = cut[:cut.rfind(" ")]
+    return cut.rstrip(" ,.;:-") + "…"
+
+
+def _render(template: Callable[..., str], fields: Dict[str, str], limit: int) -> str:
+    """Render a template, shortening the pitch first if it exceeds the limit."""
+    text = template(**fields)
+    overflow = len(text) - limit
+    if overflow > 0 and fields["pitch"]:
+        pitch = shorten(fields["pitch"], max(len(fields["pitch"]) - overflow, 10))
+        text = template(**{**fields, "pitch": pitch})
+    return shorten(text, limit)
+
+
+def _dedupe(texts: Iterable[str], count: int) -> List[str]:
+    """Keep up to count texts, dropping near-duplicates by word-set Jaccard similarity.
+
+    texts may be a generator so rendering stops once enough variants are kept.
+    """
+    kept, signatures = [], []
+    for text in texts:
+        words = frozenset(_WORD.findall(text.lower()))
+        if any(len(words & other) >= DUPLICATE_SIMILARITY * len(words | other) for other in signatures):
+            continue
+        kept.append(text)
+        signatures.append(words)
+        if len(kept) == count:
+            break
+    return kept
+
+
+def generate_assets(
+    product_name: str,
+    elevator_pitch: str,
+    target_audience: str,
+    tone: str = DEFAULT_TONE,
+    product_type: str = "",
+    variants: int = 5
+) -> Dict[str, Any]:
+    """Generate up to `variants` taglines and tweets plus a description and suggestions.
+
+    The requested tone's templates are used first; when more variants are
+    requested than it has, the other tones' templates follow. Every tone and
+    type combination together yields about 20 distinct taglines and tweets, so
+    larger requests return fewer than asked; variants_returned has the counts.
+    One short description, in the requested tone, is returned.
+
+    Args:
+        product_name: Name of the product
+        elevator_pitch: Brief description of the product's value proposition
+        target_audience: Primary target audience
+        tone: One of TONES; unknown tones use the professional templates
+        product_type: Product type used to add type-specific templates
+        variants: Number of taglines and tweets to return
+
+    Returns:
+        Dictionary containing taglines, short_description, tweets, suggestions
+        and variants_returned (the number of taglines and tweets generated)
+    """
+    tone = (tone or "").lower()
+    tone = tone if tone in TONES else DEFAULT_TONE
+    templates = _COMPILED[(tone, _product_type_key(product_type))]
+    # Other tones' templates, for requests beyond what this tone provides
+    fallbacks = [_COMPILED[(other, "")] for other in TONES if other != tone]
+    pitch = (elevator_pitch or "").strip()
+    fields = {
+        "name": product_name,
+        "pitch": pitch if pitch.endswith((".", "!", "?")) or not pitch else pitch + ".",
+        "audience": target_audience or "makers",
+        "product_type": product_type or "tool",
+    }
+    tagline_fields = {**fields, "pitch": fields["pitch"].rstrip(".")}
+
+    def _variants(asset: str, asset_fields: Dict[str, str]) -> List[str]:
+        candidates = (t for compiled in [templates] + fallbacks for t in compiled[asset])
+        return _dedupe((_render(t, asset_fields, _ASSET_LIMITS[asset]) for t in candidates), variants)
+
+    taglines = _variants("taglines", tagline_fields)
+    tweets = _variants("tweets", fields)
+    return {
+        "taglines": taglines,
+        "short_description": _render(templates["descriptions"][0], fields, DESCRIPTION_MAX_CHARS),
+        "tweets": tweets,
+        "suggestions": [t(**fields) for t in _SUGGESTIONS],
+        "variants_returned": {"taglines": len(taglines), "tweets": len(tweets)},
+    }
+
+
+def generate_assets_batch(products: Sequence[Dict[str, Any]], variants: int = 5) -> List[Dict[str, Any]]:
+    """Generate marketing assets for many products.
+
+    Args:
+        products: Dictionaries with product_name, elevator_pitch and optional
+            target_audience, tone and product_type
+        variants: Number of taglines and tweets per product
+
+    Returns:
+        One asset dictionary per product, in input order
+    """
+    return [
+        generate_assets(
+            product["product_name"],
+            product.get("elevator_pitch", ""),
+            product.get("target_audience", ""),
+            tone=product.get("tone", DEFAULT_TONE),
+            product_type=product.get("product_type", ""),
+            variants=variants,
+        )
+        for product in products
+    ]
+
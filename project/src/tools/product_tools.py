@@ -2,14 +2,26 @@
 Product Hunt Launch Assistant Tools using Strands Agents
 """
 
-from datetime import datetime, timedelta
-from typing import Dict, Any, List
+import calendar
+import re
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from typing import Dict, Any, List, Sequence, Optional
 from dateutil import parser
 
+import numpy as np
+
 from strands import tool
 
+from .hunter_index import get_hunter_index, get_profiles_version
+from .launch_density import get_launch_density_index
+from .launch_index import get_index_version, get_launch_index
+from .marketing_templates import generate_assets
+from .tool_cache import cached_tool
+
 
 @tool
+@cached_tool(ttl_seconds=3600, date_sensitive=True)
 def generate_launch_timeline(
     product_name: str,
     product_type: str,
@@ -59,11 +71,14 @@ def generate_launch_timeline(
 
 
 @tool
+@cached_tool(ttl_seconds=3600)
 def generate_marketing_assets(
     product_name: str,
     elevator_pitch: str,
     target_audience: str,
-    tone: str = "professional"
+    tone: str = "professional",
+    product_type: str = "",
+    variants: int = 5
 ) -> Dict[str, Any]:
     """
     Generate marketing assets including taglines, descriptions, and social media content.
@@ -73,45 +88,26 @@ def generate_marketing_assets(
         elevator_pitch: Brief description of the product's value proposition
         target_audience: Primary target audience
         tone: Tone for the content (professional, casual, playful, technical)
+        product_type: Type of product (SaaS, Mobile App, Chrome Extension, etc.)
+        variants: Number of tagline and tweet variants to generate (about 20 at most;
+            variants_returned in the result has the actual counts)
         
     Returns:
-        Dictionary containing taglines, description, tweets, and suggestions
+        Dictionary containing taglines, one description, tweets, suggestions and variants_returned
     """
     try:
-        # Generate taglines
-        taglines = [
-            f"{product_name} - {elevator_pitch[:50]}...",
-            f"Revolutionary {product_name} for {target_audience}",
-            f"Transform your workflow with {product_name}",
-            f"The future of {product_name} is here",
-            f"Build better with {product_name}"
-        ]
-        
-        # Generate short description
-        short_description = f"{elevator_pitch} Perfect for {target_audience}. Try {product_name} today and see the difference!"
-        
-        # Generate tweets
-        tweets = [
-            f"🚀 Just launched {product_name} on @ProductHunt! {elevator_pitch[:100]}... #ProductHunt #Launch",
-            f"Excited to share {product_name} with the world! Built for {target_audience}. Check it out: #ProductHunt #Launch",
-            f"After months of building, {product_name} is live on @ProductHunt! Would love your support 🙏 #ProductHunt #Launch"
-        ]
-        
-        # Generate suggestions
-        suggestions = [
-            f"Start building your community around {product_name} 2-3 weeks before launch",
-            f"Create a demo video showcasing {product_name}'s key features",
-            f"Reach out to {target_audience} influencers and thought leaders",
-            "Prepare social media content for launch day and the following week",
-            "Plan follow-up activities to maintain momentum after launch day"
-        ]
+        assets = generate_assets(
+            product_name,
+            elevator_pitch,
+            target_audience,
+            tone=tone,
+            product_type=product_type,
+            variants=max(1, int(variants))
+        )
         
         return {
             "success": True,
-            "taglines": taglines,
-            "short_description": short_description,
-            "tweets": tweets,
-            "suggestions": suggestions
+            **assets
         }
         
     except Exception as e:
@@ -121,7 +117,13 @@ def generate_marketing_assets(
         }
 
 
+def _research_data_version() -> tuple:
+    """Versions of the launch index and hunter profiles that research results are computed from."""
+    return (get_index_version(), get_profiles_version())
+
+
 @tool
+@cached_tool(ttl_seconds=6 * 3600, version=_research_data_version)
 def research_top_launches(
     product_category: str,
     target_audience: str,
@@ -139,8 +141,14 @@ def research_top_launches(
         Dictionary containing top launches, recommended hunters, and insights
     """
     try:
-        # Mock data for demo - in real implementation, this would use web search
-        top_launches = [
+        launch_index = get_launch_index()
+        if launch_index is not None:
+            top_launches = launch_index.search(product_category, target_audience, top_k=5)
+        else:
+            top_launches = []
+
+        # Mock data for demo when no local launch index has been built
+        top_launches = top_launches or [
             {
                 "name": f"Top {product_category} Tool",
                 "tagline": "Revolutionary solution for modern teams",
@@ -161,7 +169,14 @@ def research_top_launches(
             }
         ]
         
-        recommended_hunters = [
+        hunter_index = get_hunter_index()
+        if hunter_index is not None:
+            recommended_hunters = hunter_index.match(product_category, target_audience, top_k=5)
+        else:
+            recommended_hunters = []
+
+        # Mock data for demo when no hunter profiles are available
+        recommended_hunters = recommended_hunters or [
             {
                 "name": "Tech Hunter",
                 "handle": "@techhunter",
@@ -213,32 +228,138 @@ def research_top_launches(
         }
 
 
-# Helper functions
-def parse_launch_date(date_input: str) -> datetime:
-    """Parse natural language date input"""
-    # Handle relative dates
-    if "next" in date_input.lower():
-        if "tuesday" in date_input.lower():
-            today = datetime.now()
-            days_ahead = 1 - today.weekday()  # Tuesday is 1
-            if days_ahead <= 0:  # Target day already happened this week
-                days_ahead += 7
-            return today + timedelta(days=days_ahead)
-        elif "friday" in date_input.lower():
-            today = datetime.now()
-            days_ahead = 4 - today.weekday()  # Friday is 4
-            if days_ahead <= 0:  # Target day already happened this week
-                days_ahead += 7
-            return today + timedelta(days=days_ahead)
+@tool
+@cached_tool(ttl_seconds=3600, date_sensitive=True, version=get_index_version)
+def find_best_launch_days(
+    product_category: str,
+    window_start: str = "tomorrow",
+    window_days: int = 30,
+    top_n: int = 3
+) -> Dict[str, Any]:
+    """
+    Find the best launch days in a date window based on competing launches in the category.
     
-    # Try parsing with dateutil
+    Args:
+        product_category: Category of the product (e.g., Productivity, AI Tools, Design)
+        window_start: First candidate launch date (e.g., "tomorrow", "next Monday", "2025-03-01")
+        window_days: Number of days in the candidate window
+        top_n: Number of best days to return
+        
+    Returns:
+        Dictionary containing the best launch days with their competition breakdown
+    """
     try:
-        return parser.parse(date_input)
-    except Exception:
-        # Fallback to adding days if it's a number
-        if date_input.isdigit():
-            return datetime.now() + timedelta(days=int(date_input))
-        raise ValueError(f"Could not parse date: {date_input}")
+        today = date.today()
+        start = parse_launch_date(window_start, today=today).date()
+        if start < today:
+            return {
+                "success": False,
+                "error": "Window start is in the past. Please provide a future date."
+            }
+
+        window_days = max(1, min(int(window_days), 365))
+        best_days = get_launch_density_index().best_launch_days(
+            product_category,
+            np.datetime64(start, "D"),
+            window_days,
+            top_n=max(1, int(top_n)),
+            today=np.datetime64(today, "D")
+        )
+
+        return {
+            "success": True,
+            "best_days": best_days,
+            "window_start": start.isoformat(),
+            "window_end": (start + timedelta(days=window_days - 1)).isoformat(),
+            "method": "Weekday traffic prior divided by competing launches on the day, within 3 days, and on that weekday historically"
+        }
+
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Launch day analysis failed: {str(e)}"
+        }
+
+
+# Helper functions
+_WEEKDAYS = {
+    "mon": 0, "monday": 0,
+    "tue": 1, "tues": 1, "tuesday": 1,
+    "wed": 2, "weds": 2, "wednesday": 2,
+    "thu": 3, "thur": 3, "thurs": 3, "thursday": 3,
+    "fri": 4, "friday": 4,
+    "sat": 5, "saturday": 5,
+    "sun": 6, "sunday": 6,
+}
+_NUMBER_WORDS = {
+    "a": 1, "an": 1, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5,
+    "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10, "eleven": 11, "twelve": 12,
+}
+_UNIT_DAYS = {"day": 1, "week": 7}
+
+_ISO_DATE = re.compile(r"^(\d{4})-(\d{1,2})-(\d{1,2})$")
+_WEEKDAY = re.compile(r"^(?:(next|this|on)\s+)?(" + "|".join(sorted(_WEEKDAYS, key=len, reverse=True)) + r")\.?$")
+_RELATIVE = re.compile(r"^in\s+(\d+|" + "|".join(_NUMBER_WORDS) + r")\s+(day|week|month)s?$")
+_END_OF_MONTH = re.compile(r"^end\s+of\s+(?:the\s+)?(this|next)?\s*month$")
+
+
+def _add_months(day: date, months: int) -> date:
+    """Add calendar months, clamping to the last day of the target month."""
+    month_index = day.month - 1 + months
+    year, month = day.year + month_index // 12, month_index % 12 + 1
+    return date(year, month, min(day.day, calendar.monthrange(year, month)[1]))
+
+
+@lru_cache(maxsize=4096)
+def _parse_launch_date_cached(text: str, today: date) -> datetime:
+    """Resolve a normalized date expression relative to today."""
+    target = None
+
+    if text == "today":
+        target = today
+    elif text == "tomorrow":
+        target = today + timedelta(days=1)
+    elif text == "next week":
+        target = today + timedelta(days=7)
+    elif text == "next month":
+        target = _add_months(today, 1)
+    elif text.isdigit():
+        target = today + timedelta(days=int(text))
+    elif match := _ISO_DATE.match(text):
+        target = date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+    elif match := _WEEKDAY.match(text):
+        # Always the upcoming occurrence, never today
+        days_ahead = (_WEEKDAYS[match.group(2)] - today.weekday()) % 7 or 7
+        target = today + timedelta(days=days_ahead)
+    elif match := _RELATIVE.match(text):
+        amount = int(match.group(1)) if match.group(1).isdigit() else _NUMBER_WORDS[match.group(1)]
+        if match.group(2) == "month":
+            target = _add_months(today, amount)
+        else:
+            target = today + timedelta(days=amount * _UNIT_DAYS[match.group(2)])
+    elif match := _END_OF_MONTH.match(text):
+        month_start = _add_months(today.replace(day=1), 1 if match.group(1) == "next" else 0)
+        target = month_start.replace(day=calendar.monthrange(month_start.year, month_start.month)[1])
+
+    if target is not None:
+        return datetime.combine(target, time())
+
+    # Absolute dates such as "December 15, 2024"; missing fields default to today
+    try:
+        return parser.parse(text, default=datetime.combine(today, time()))
+    except (ValueError, OverflowError):
+        raise ValueError(f"Could not parse date: {text}")
+
+
+def parse_launch_date(date_input: str, today: Optional[date] = None) -> datetime:
+    """Parse natural language date input
+
+    Supports ISO dates, all weekdays ("next Wednesday", "fri"), "in N days/weeks/months",
+    "end of month", "tomorrow" and falls back to dateutil for absolute dates.
+    Results are memoized per (input, today).
+    """
+    text = " ".join(date_input.lower().replace(",", " ").split())
+    return _parse_launch_date_cached(text, today or date.today())
 
 
 def calculate_timeline_days(launch_date: datetime) -> int:
@@ -253,78 +374,67 @@ def format_date_for_display(date: datetime) -> str:
     return date.strftime("%A, %B %d, %Y")
 
 
+# Timeline tasks shared by create_timeline and the batch engine. Each task:
+# (phase, minimum days until launch for the phase to apply, calendar days before
+# launch for the relative due date (or a fixed label), business days before
+# launch the absolute due date falls on, task fields)
+TIMELINE_TASK_TEMPLATE = [
+    ("Pre-launch (2+ weeks before)", 14, 14, 10, {
+        "name": "Create Product Hunt account and profile",
+        "priority": "High",
+        "time_estimate": "1 hour",
+        "dependencies": "None",
+        "success_criteria": "Account created with complete profile"
+    }),
+    ("Pre-launch (2+ weeks before)", 14, 10, 8, {
+        "name": "Prepare product assets (logo, screenshots, demo video)",
+        "priority": "High",
+        "time_estimate": "4-6 hours",
+        "dependencies": "None",
+        "success_criteria": "All visual assets ready"
+    }),
+    ("Final preparation (1 week before)", 7, 7, 5, {
+        "name": "Write compelling product description and tagline",
+        "priority": "High",
+        "time_estimate": "2-3 hours",
+        "dependencies": "Product assets ready",
+        "success_criteria": "Description approved and ready"
+    }),
+    ("Final preparation (1 week before)", 7, 5, 3, {
+        "name": "Identify and reach out to potential hunters",
+        "priority": "High",
+        "time_estimate": "3-4 hours",
+        "dependencies": "None",
+        "success_criteria": "At least 3 hunters confirmed"
+    }),
+    ("Launch day", 0, "Launch day (12:01 AM PST)", 0, {
+        "name": "Submit product to Product Hunt",
+        "priority": "High",
+        "time_estimate": "30 minutes",
+        "dependencies": "All assets and hunters ready",
+        "success_criteria": "Product live on Product Hunt"
+    }),
+    ("Launch day", 0, "Launch day (morning)", 0, {
+        "name": "Share on social media and personal networks",
+        "priority": "High",
+        "time_estimate": "2-3 hours",
+        "dependencies": "Product live",
+        "success_criteria": "Initial momentum generated"
+    }),
+]
+
+
 def create_timeline(product_name: str, product_type: str, launch_date: datetime, days_until_launch: int, additional_notes: str) -> List[Dict[str, Any]]:
     """Create detailed timeline based on days until launch"""
     timeline = []
-    
-    if days_until_launch >= 14:
-        timeline.append({
-            "phase": "Pre-launch (2+ weeks before)",
-            "tasks": [
-                {
-                    "name": "Create Product Hunt account and profile",
-                    "due_date": f"{days_until_launch - 14} days before launch",
-                    "priority": "High",
-                    "time_estimate": "1 hour",
-                    "dependencies": "None",
-                    "success_criteria": "Account created with complete profile"
-                },
-                {
-                    "name": "Prepare product assets (logo, screenshots, demo video)",
-                    "due_date": f"{days_until_launch - 10} days before launch",
-                    "priority": "High",
-                    "time_estimate": "4-6 hours",
-                    "dependencies": "None",
-                    "success_criteria": "All visual assets ready"
-                }
-            ]
-        })
-    
-    if days_until_launch >= 7:
-        timeline.append({
-            "phase": "Final preparation (1 week before)",
-            "tasks": [
-                {
-                    "name": "Write compelling product description and tagline",
-                    "due_date": f"{days_until_launch - 7} days before launch",
-                    "priority": "High",
-                    "time_estimate": "2-3 hours",
-                    "dependencies": "Product assets ready",
-                    "success_criteria": "Description approved and ready"
-                },
-                {
-                    "name": "Identify and reach out to potential hunters",
-                    "due_date": f"{days_until_launch - 5} days before launch",
-                    "priority": "High",
-                    "time_estimate": "3-4 hours",
-                    "dependencies": "None",
-                    "success_criteria": "At least 3 hunters confirmed"
-                }
-            ]
-        })
-    
-    timeline.append({
-        "phase": "Launch day",
-        "tasks": [
-            {
-                "name": "Submit product to Product Hunt",
-                "due_date": "Launch day (12:01 AM PST)",
-                "priority": "High",
-                "time_estimate": "30 minutes",
-                "dependencies": "All assets and hunters ready",
-                "success_criteria": "Product live on Product Hunt"
-            },
-            {
-                "name": "Share on social media and personal networks",
-                "due_date": "Launch day (morning)",
-                "priority": "High",
-                "time_estimate": "2-3 hours",
-                "dependencies": "Product live",
-                "success_criteria": "Initial momentum generated"
-            }
-        ]
-    })
-    
+    for phase, min_days, relative_due, _, task_fields in TIMELINE_TASK_TEMPLATE:
+        if days_until_launch < min_days:
+            continue
+        if not timeline or timeline[-1]["phase"] != phase:
+            timeline.append({"phase": phase, "tasks": []})
+        due_date = relative_due if isinstance(relative_due, str) else f"{days_until_launch - relative_due} days before launch"
+        timeline[-1]["tasks"].append({"name": task_fields["name"], "due_date": due_date, **task_fields})
+
     return timeline
 
 
@@ -335,4 +445,154 @@ def extract_milestones(timeline: List[Dict[str, Any]]) -> List[str]:
         for task in phase.get('tasks', []):
             if task.get('priority') == 'High':
                 milestones.append(f"{task['name']} - {task['due_date']}")
-    return milestones[:5]  # Top 5 milestones
\ No newline at end of file
+    return milestones[:5]  # Top 5 milestones
+
+
+# Batch timeline engine
+_TASK_MIN_DAYS = np.array([t[1] for t in TIMELINE_TASK_TEMPLATE], dtype=np.int64)
+_TASK_BUSINESS_DAYS_BEFORE = np.array([t[3] for t in TIMELINE_TASK_TEMPLATE], dtype=np.int64)
+
+
+def to_datetime64(launch_dates: Sequence[Any], today: Optional[date] = None) -> np.ndarray:
+    """Convert launch dates to a datetime64[D] array, parsing each distinct string once.
+
+    Unparseable entries become NaT.
+    """
+    values = np.asarray(launch_dates)
+    if values.dtype.kind == "M":
+        return values.astype("datetime64[D]")
+
+    unique_values, inverse = np.unique(values.astype(str), return_inverse=True)
+    parsed = np.empty(len(unique_values), dtype="datetime64[D]")
+    for i, value in enumerate(unique_values):
+        try:
+            parsed[i] = np.datetime64(parse_launch_date(value, today=today).date(), "D")
+        except (ValueError, OverflowError):
+            parsed[i] = np.datetime64("NaT")
+    return parsed[inverse.reshape(-1)]
+
+
+def compute_timeline_dates(
+    launch_dates: np.ndarray,
+    today: Optional[np.datetime64] = None,
+    holidays: Optional[Sequence[Any]] = None
+) -> Dict[str, np.ndarray]:
+    """Compute task due dates for many launches in one vectorized pass.
+
+    Args:
+        launch_dates: datetime64[D] array of launch dates (NaT for invalid entries)
+        today: Reference date, defaults to the current date
+        holidays: Optional dates excluded from business-day arithmetic
+
+    Returns:
+        Dictionary with days_until_launch (n,), due_dates (n, tasks) and included (n, tasks) arrays
+    """
+    today = np.datetime64(today if today is not None else datetime.now().date(), "D")
+    holidays = np.asarray(holidays if holidays is not None else [], dtype="datetime64[D]")
+
+    valid = ~np.isnat(launch_dates)
+    safe_launch = np.where(valid, launch_dates, today)
+    days_until_launch = (safe_launch - today).astype(np.int64)
+
+    # Pre-launch tasks land on business days; launch-day tasks stay on the launch date itself
+    due_dates = np.busday_offset(
+        safe_launch[:, None],
+        -_TASK_BUSINESS_DAYS_BEFORE[None, :],
+        roll="backward",
+        holidays=holidays
+    )
+    due_dates = np.where(_TASK_BUSINESS_DAYS_BEFORE[None, :] == 0, safe_launch[:, None], due_dates)
+    due_dates = np.maximum(due_dates, today)  # Tight timelines start today, never in the past
+    included = (days_until_launch[:, None] >= _TASK_MIN_DAYS[None, :]) & valid[:, None]
+
+    return {
+        "valid": valid,
+        "days_until_launch": days_until_launch,
+        "due_dates": due_dates,
+        "included": included
+    }
+
+
+def _timeline_layout(pattern: int):
+    """Group the tasks selected by a bitmask into phases and pick the milestone tasks."""
+    phase_groups = []
+    milestone_tasks = []
+    for j, (phase, _, _, _, task_fields) in enumerate(TIMELINE_TASK_TEMPLATE):
+        if not pattern >> j & 1:
+            continue
+        if not phase_groups or phase_groups[-1][0] != phase:
+            phase_groups.append((phase, []))
+        phase_groups[-1][1].append((j, task_fields))
+        if task_fields["priority"] == "High" and len(milestone_tasks) < 5:
+            milestone_tasks.append((j, task_fields["name"]))
+    return phase_groups, milestone_tasks
+
+
+def generate_launch_timelines_batch(
+    launch_dates: Sequence[Any],
+    product_types: Sequence[str],
+    today: Optional[Any] = None,
+    holidays: Optional[Sequence[Any]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Generate launch timelines with absolute due dates for many products at once.
+
+    Args:
+        launch_dates: Launch dates as strings, datetimes or a datetime64 array
+        product_types: Product type for each launch date
+        today: Reference date, defaults to the current date
+        holidays: Optional dates excluded from business-day arithmetic
+
+    Returns:
+        List of timeline dictionaries, one per input, in input order
+    """
+    if len(launch_dates) != len(product_types):
+        raise ValueError("launch_dates and product_types must have the same length")
+    if len(launch_dates) == 0:
+        return []
+
+    if today is not None:
+        today = np.datetime64(today, "D").item()
+    launch = to_datetime64(launch_dates, today=today)
+    dates = compute_timeline_dates(launch, today=today, holidays=holidays)
+
+    # Convert to Python objects once; per-row numpy access dominates otherwise
+    due_strings = np.datetime_as_string(dates["due_dates"], unit="D").tolist()
+    launch_strings = np.datetime_as_string(launch, unit="D").tolist()
+    days_until = dates["days_until_launch"].tolist()
+    valid = dates["valid"].tolist()
+    patterns = (dates["included"] @ (1 << np.arange(len(TIMELINE_TASK_TEMPLATE)))).tolist()
+    layouts = {}
+
+    results = []
+    for i, product_type in enumerate(product_types):
+        if not valid[i]:
+            results.append({"success": False, "error": f"Could not parse date: {launch_dates[i]}"})
+            continue
+        if days_until[i] < 0:
+            results.append({"success": False, "error": "Launch date is in the past. Please provide a future date."})
+            continue
+
+        # Rows with the same set of applicable tasks share a phase layout
+        layout = layouts.get(patterns[i])
+        if layout is None:
+            layout = layouts[patterns[i]] = _timeline_layout(patterns[i])
+        phase_groups, milestone_tasks = layout
+
+        row_due = due_strings[i]
+        timeline = [
+            {"phase": phase, "tasks": [{**fields, "due_date": row_due[j]} for j, fields in tasks]}
+            for phase, tasks in phase_groups
+        ]
+        milestones = [f"{name} - {row_due[j]}" for j, name in milestone_tasks]
+
+        results.append({
+            "success": True,
+            "product_type": product_type,
+            "timeline": timeline,
+            "total_days": days_until[i],
+            "launch_date": launch_strings[i],
+            "key_milestones": milestones
+        })
+
+    return results
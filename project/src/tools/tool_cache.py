@@ -0,0 +1,141 @@
+"""Memoizing result cache for agent tools."""
+
+import copy
+import functools
+import inspect
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Callable, Dict, Optional
+
+# Registered caches by tool name, for metrics
+_caches: Dict[str, "ToolResultCache"] = {}
+
+
+def _canonical(value: Any) -> Any:
+    """Normalize an argument so trivially different calls share a cache entry."""
+    if isinstance(value, str):
+        return " ".join(value.split())
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _canonical(v) for k, v in value.items()}
+    return value
+
+
+class ToolResultCache:
+    """Size-bounded LRU cache with a TTL and hit/miss counters."""
+
+    def __init__(self, name: str, ttl_seconds: float, maxsize: int):
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        """Return (True, value) for a fresh entry, otherwise (False, None)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def put(self, key: str, value: Any):
+        """Store a value, evicting the least recently used entries."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            "size": len(self._entries),
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+
+def cached_tool(
+    ttl_seconds: float,
+    date_sensitive: bool = False,
+    maxsize: int = 512,
+    version: Optional[Callable[[], Any]] = None,
+):
+    """Memoize a tool function's successful results.
+
+    Apply below @tool so Strands still sees the original signature and docstring.
+    Arguments are bound to the signature (so positional, keyword and default
+    forms share an entry) and whitespace-normalized before hashing.
+
+    Args:
+        ttl_seconds: How long a result stays fresh
+        date_sensitive: Include today's date in the key, for tools that resolve
+            relative dates such as "next Tuesday"
+        maxsize: Maximum number of cached results for this tool
+        version: Returns the current version of the data the tool reads, such
+            as an index file's mtime; it is part of the key, so results computed
+            from data rebuilt by another process are never served
+    """
+    def decorator(func: Callable) -> Callable:
+        cache = ToolResultCache(func.__name__, ttl_seconds, maxsize)
+        _caches[func.__name__] = cache
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key_parts = {name: _canonical(value) for name, value in bound.arguments.items()}
+            if date_sensitive:
+                key_parts["__today__"] = date.today().isoformat()
+            if version is not None:
+                key_parts["__version__"] = version()
+            key = json.dumps(key_parts, sort_keys=True, default=str)
+
+            hit, result = cache.get(key)
+            if hit:
+                return copy.deepcopy(result)
+
+            result = func(*args, **kwargs)
+            # Errors are not cached so transient failures can be retried
+            if not isinstance(result, dict) or result.get("success", True):
+                cache.put(key, copy.deepcopy(result))
+            return result
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
+
+
+def get_tool_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Hit/miss metrics for every cached tool."""
+    return {name: cache.stats() for name, cache in _caches.items()}
+
+
+def clear_tool_caches():
+    """Drop all cached tool results."""
+    for cache in _caches.values():
+        cache.clear()
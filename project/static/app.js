@@ -13,6 +13,8 @@ function appData() {
             semantic_memories: [],
             total_memories: 0
         },
+        memorySummaryEtag: null,
+        prefetchTimer: null,
         formData: {
             product_name: '',
             product_type: 'SaaS',
@@ -35,6 +37,24 @@ function appData() {
             // Initialize user session and memory
             await this.createUserSession();
             await this.loadMemorySummary();
+
+            // Warm memory context for returning users as they fill in the form
+            this.$watch('formData', () => this.schedulePrefetch());
+        },
+
+        schedulePrefetch() {
+            clearTimeout(this.prefetchTimer);
+            if (!this.userSession.memory_enabled || !this.formData.product_name || !this.formData.product_description) return;
+
+            this.prefetchTimer = setTimeout(() => {
+                fetch('/api/memory/prefetch', {
+                    method: 'POST',
+                    headers: {
+                        'Content-Type': 'application/json',
+                    },
+                    body: JSON.stringify(this.formData)
+                }).catch(err => console.error('Error prefetching memory:', err));
+            }, 1500);
         },
 
         async createUserSession() {
@@ -66,17 +86,25 @@ function appData() {
             if (!this.userSession.user_id) return;
 
             try {
+                const headers = {
+                    'Content-Type': 'application/json',
+                };
+                // Unchanged summaries come back as 304 with no body
+                if (this.memorySummaryEtag) {
+                    headers['If-None-Match'] = this.memorySummaryEtag;
+                }
+
                 const response = await fetch('/api/memory/summary', {
                     method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/json',
-                    },
+                    headers: headers,
                     body: JSON.stringify({
                         user_id: this.userSession.user_id,
                         session_id: this.userSession.session_id
                     })
                 });
 
+                if (response.status === 304) return;
+                this.memorySummaryEtag = response.headers.get('ETag');
                 const data = await response.json();
 
                 if (data.success) {